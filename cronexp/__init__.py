@@ -1,5 +1,14 @@
 # -*- coding: utf-8 -*-
 
-from ._cronexp import Cronexp, CronexpOption
+from ._batch import CronexpBatch
+from ._cache import (
+        CronexpCache, CronexpCacheInfo, compile_cache_info, compile_cronexp)
+from ._cronexp import Cronexp, CronexpCursor, CronexpOption
 from ._dateexp import DaySelectionMode
+from ._index import CronexpIndex
+from ._merge import merge_occurrences
+from ._scheduler import CronexpScheduler
+from ._stats import SearchCounter, SearchStats, search_stats
+from ._timezone import (
+        AmbiguousTimePolicy, NonexistentTimePolicy, ZonedCronexp)
 from ._weekday_field import SundayMode
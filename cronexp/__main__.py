@@ -0,0 +1,160 @@
+# -*- coding: utf-8 -*-
+
+import argparse
+import concurrent.futures
+import itertools
+import json
+import os
+import queue
+import sys
+import threading
+from typing import (
+        Any, Iterable, Iterator, List, Optional, Sequence, TextIO, Tuple)
+from ._cronexp import CronexpOption
+from ._dayexp import DaySelectionMode
+from ._validate import validate_expression, validation_error_to_dict
+from ._weekday_field import SundayMode
+
+
+# (source, line number, expression)
+Line = Tuple[str, int, str]
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog='python -m cronexp')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+    validate = subparsers.add_parser(
+            'validate',
+            help='validate cron expressions (one per line)')
+    validate.add_argument(
+            'file',
+            nargs='*',
+            help='input files (default: stdin)')
+    validate.add_argument(
+            '--jobs',
+            type=int,
+            default=None,
+            help='number of worker processes (default: CPU count)')
+    validate.add_argument(
+            '--chunk-size',
+            type=int,
+            default=10000,
+            help='expressions per task (default: %(default)s)')
+    validate.add_argument(
+            '--day-selection-mode',
+            choices=[mode.name for mode in DaySelectionMode],
+            default=DaySelectionMode.OR.name)
+    validate.add_argument(
+            '--sunday-is-7',
+            action='store_true')
+    validate.add_argument(
+            '--no-word-set',
+            action='store_true')
+    args = parser.parse_args(argv)
+    option = CronexpOption(
+            use_word_set=not args.no_word_set,
+            day_selection_mode=DaySelectionMode[args.day_selection_mode],
+            sunday_mode=(SundayMode.SUNDAY_IS_7
+                         if args.sunday_is_7
+                         else SundayMode.SUNDAY_IS_0))
+    if args.chunk_size <= 0:
+        parser.error('--chunk-size must be positive value')
+    is_valid = True
+    for is_ok, line in run_validate(
+            _read_lines(args.file),
+            option,
+            jobs=args.jobs,
+            chunk_size=args.chunk_size):
+        is_valid = is_valid and is_ok
+        sys.stdout.write(line)
+    return 0 if is_valid else 1
+
+
+def run_validate(
+        lines: Iterable[Line],
+        option: CronexpOption,
+        jobs: Optional[int] = None,
+        chunk_size: int = 10000) -> Iterator[Tuple[bool, str]]:
+    # yield (is valid, JSON line) per input, in input order
+    chunks = _chunked(lines, chunk_size)
+    if jobs == 1:
+        for chunk in chunks:
+            yield from _validate_chunk(chunk, option)
+        return
+    # in-flight chunks: submitted as read (by a reader thread),
+    # yielded in input order
+    window_size = 2 * (jobs if jobs is not None else os.cpu_count() or 1)
+    window: 'queue.Queue[Any]' = queue.Queue(maxsize=window_size)
+    with concurrent.futures.ProcessPoolExecutor(max_workers=jobs) as pool:
+        reader = threading.Thread(
+                target=_submit_chunks,
+                args=(pool, chunks, option, window),
+                daemon=True)
+        reader.start()
+        try:
+            while True:
+                item = window.get()
+                if item is None:
+                    break
+                if isinstance(item, BaseException):
+                    raise item
+                yield from item.result()
+        finally:
+            pool.shutdown(wait=False, cancel_futures=True)
+
+
+def _submit_chunks(
+        pool: concurrent.futures.Executor,
+        chunks: Iterable[List[Line]],
+        option: CronexpOption,
+        window: 'queue.Queue[Any]') -> None:
+    # window: futures, then an exception (if any) and None
+    try:
+        for chunk in chunks:
+            window.put(pool.submit(_validate_chunk, chunk, option))
+    except BaseException as error:
+        window.put(error)
+    finally:
+        window.put(None)
+
+
+def _validate_chunk(
+        chunk: List[Line],
+        option: CronexpOption) -> List[Tuple[bool, str]]:
+    result: List[Tuple[bool, str]] = []
+    for source, line_number, expression in chunk:
+        error = validate_expression(expression, option)
+        output = {'ok': error is None,
+                  'source': source,
+                  'line': line_number,
+                  'expression': expression}
+        if error is not None:
+            output['error'] = validation_error_to_dict(error)
+        result.append((error is None, json.dumps(output) + '\n'))
+    return result
+
+
+def _read_lines(file_list: List[str]) -> Iterator[Line]:
+    # skip empty lines and comments
+    def read(source: str, stream: TextIO) -> Iterator[Line]:
+        for line_number, line in enumerate(stream, start=1):
+            expression = line.strip()
+            if expression and not expression.startswith('#'):
+                yield source, line_number, expression
+    if not file_list:
+        yield from read('<stdin>', sys.stdin)
+    for path in file_list:
+        with open(path, encoding='utf-8') as stream:
+            yield from read(path, stream)
+
+
+def _chunked(lines: Iterable[Line], size: int) -> Iterator[List[Line]]:
+    iterator = iter(lines)
+    chunk = list(itertools.islice(iterator, size))
+    while chunk:
+        yield chunk
+        chunk = list(itertools.islice(iterator, size))
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,193 @@
+# -*- coding: utf-8 -*-
+
+import array
+import datetime
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple
+from ._cronexp import Cronexp
+from ._dayexp import DaySelectionMode
+from ._month_info import month_info
+from ._weekday_field import weekday_day_mask
+
+
+# how the day is selected
+_DAY_OF_MONTH = 0
+_DAY_OF_WEEK = 1
+_EITHER = 2
+_BOTH = 3
+# L/W/#: Dayexp.day_mask
+_EXTENSION = 4
+# max_year or never: Cronexp.next
+_FALLBACK = 5
+# months searched with the columns before falling back to Cronexp.next
+_MONTH_LOOKAHEAD = 12
+
+
+class _MonthTable(NamedTuple):
+    year: int
+    month: int
+    # bit i: 1 <= i <= the number of days
+    valid: int
+    # weekday bitmask -> day mask
+    weekday: List[int]
+
+
+def _month_table(year: int, month: int) -> _MonthTable:
+    init_weekday, lastday = month_info(year, month)
+    return _MonthTable(
+            year=year,
+            month=month,
+            valid=(1 << (lastday + 1)) - 2,
+            weekday=[weekday_day_mask(bitmask, init_weekday, lastday)
+                     for bitmask in range(1 << 7)])
+
+
+class CronexpBatch:
+    def __init__(self, expressions: Iterable[Cronexp] = ()) -> None:
+        self._expressions: List[Cronexp] = []
+        # columns (one element per expression)
+        self._minute = array.array('Q')
+        self._hour = array.array('L')
+        self._day_of_month = array.array('L')
+        self._day_of_week = array.array('B')
+        self._month = array.array('H')
+        self._kind = bytearray()
+        # first selected minute of day
+        self._first = array.array('H')
+        for cronexp in expressions:
+            self.add(cronexp)
+
+    def __len__(self) -> int:
+        return len(self._expressions)
+
+    def __getitem__(self, id_: int) -> Cronexp:
+        return self._expressions[id_]
+
+    def add(self, cronexp: Cronexp) -> int:
+        id_ = len(self._expressions)
+        self._expressions.append(cronexp)
+        timeexp = cronexp._timeexp
+        dateexp = cronexp._dateexp
+        day_of_month = dateexp.dayexp.day_of_month
+        day_of_week = dateexp.dayexp.day_of_week
+        self._minute.append(timeexp.minute.bitmask)
+        self._hour.append(timeexp.hour.bitmask)
+        self._day_of_month.append(day_of_month.bitmask)
+        self._day_of_week.append(day_of_week.bitmask)
+        self._month.append(dateexp.month.bitmask)
+        self._first.append(timeexp.minute_list()[0])
+        mode = dateexp.dayexp.selection_mode
+        if dateexp.max_year() is not None or not dateexp.is_satisfiable:
+            kind = _FALLBACK
+        elif day_of_month.has_extension or day_of_week.has_extension:
+            kind = _EXTENSION
+        elif mode is DaySelectionMode.EITHER:
+            kind = _DAY_OF_MONTH if day_of_week.is_blank else _DAY_OF_WEEK
+        elif day_of_week.is_any:
+            kind = _DAY_OF_MONTH
+        elif day_of_month.is_any:
+            kind = _DAY_OF_WEEK
+        elif mode is DaySelectionMode.OR:
+            kind = _EITHER
+        else:
+            kind = _BOTH
+        self._kind.append(kind)
+        return id_
+
+    def next(
+            self,
+            start: datetime.datetime) -> List[Optional[datetime.datetime]]:
+        # [cronexp.next(start) for cronexp in self]
+        year, month, day = start.year, start.month, start.day
+        hour, minute = start.hour, start.minute
+        tzinfo = start.tzinfo
+        month_bit = 1 << month
+        day_bit = 1 << day
+        # shared by all expressions
+        table = _month_table(year, month)
+        later_table: Dict[Tuple[int, int], _MonthTable] = {}
+        minute_column = self._minute
+        hour_column = self._hour
+        month_column = self._month
+        kind_column = self._kind
+        first_column = self._first
+        result: List[Optional[datetime.datetime]] = []
+        for id_ in range(len(self._expressions)):
+            if kind_column[id_] == _FALLBACK:
+                result.append(self._expressions[id_].next(start))
+                continue
+            if month_column[id_] & month_bit:
+                day_mask = self._day_mask(id_, table)
+                if day_mask & day_bit:
+                    # the rest of the day
+                    hour_mask = hour_column[id_]
+                    minute_mask = minute_column[id_] >> (minute + 1)
+                    if hour_mask >> hour & 1 and minute_mask:
+                        result.append(datetime.datetime(
+                                year, month, day,
+                                hour,
+                                minute + _lowest_bit(minute_mask) + 1,
+                                tzinfo=tzinfo))
+                        continue
+                    hour_mask >>= hour + 1
+                    if hour_mask:
+                        result.append(datetime.datetime(
+                                year, month, day,
+                                hour + _lowest_bit(hour_mask) + 1,
+                                _lowest_bit(minute_column[id_]),
+                                tzinfo=tzinfo))
+                        continue
+                day_mask >>= day + 1
+                if day_mask:
+                    result.append(datetime.datetime(
+                            year, month, day + _lowest_bit(day_mask) + 1,
+                            *divmod(first_column[id_], 60),
+                            tzinfo=tzinfo))
+                    continue
+            result.append(self._next_month(id_, start, later_table))
+        return result
+
+    def _day_mask(self, id_: int, table: _MonthTable) -> int:
+        kind = self._kind[id_]
+        if kind == _DAY_OF_MONTH:
+            return self._day_of_month[id_] & table.valid
+        if kind == _DAY_OF_WEEK:
+            return table.weekday[self._day_of_week[id_]]
+        if kind == _EITHER:
+            return ((self._day_of_month[id_] & table.valid)
+                    | table.weekday[self._day_of_week[id_]])
+        if kind == _BOTH:
+            return (self._day_of_month[id_]
+                    & table.weekday[self._day_of_week[id_]])
+        return self._expressions[id_]._dateexp.dayexp.day_mask(
+                table.year,
+                table.month)
+
+    def _next_month(
+            self,
+            id_: int,
+            start: datetime.datetime,
+            later_table: Dict[Tuple[int, int], _MonthTable],
+            ) -> Optional[datetime.datetime]:
+        # the first occurrence in the following months
+        year, month = start.year, start.month
+        month_mask = self._month[id_]
+        for _ in range(_MONTH_LOOKAHEAD):
+            year, month = (year, month + 1) if month < 12 else (year + 1, 1)
+            if datetime.MAXYEAR < year:
+                break
+            if not month_mask >> month & 1:
+                continue
+            table = later_table.get((year, month))
+            if table is None:
+                table = later_table[year, month] = _month_table(year, month)
+            day_mask = self._day_mask(id_, table)
+            if day_mask:
+                return datetime.datetime(
+                        year, month, _lowest_bit(day_mask),
+                        *divmod(self._first[id_], 60),
+                        tzinfo=start.tzinfo)
+        return self._expressions[id_].next(start)
+
+
+def _lowest_bit(value: int) -> int:
+    return (value & -value).bit_length() - 1
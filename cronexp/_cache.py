@@ -0,0 +1,91 @@
+# -*- coding: utf-8 -*-
+
+import collections
+import weakref
+from typing import Hashable, NamedTuple, Tuple
+from ._cronexp import Cronexp, CronexpOption
+
+
+CacheKey = Tuple[str, CronexpOption]
+
+
+class CronexpCacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    shared: int
+    maxsize: int
+    currsize: int
+
+
+class CronexpCache:
+    def __init__(self, maxsize: int = 1024) -> None:
+        if maxsize <= 0:
+            raise ValueError(
+                    'maxsize({0}) must be positive value'.format(maxsize))
+        self._maxsize = maxsize
+        # (normalized expression, option) -> compiled
+        self._cache: 'collections.OrderedDict[CacheKey, Cronexp]' = (
+                collections.OrderedDict())
+        # canonical key -> compiled (alive while referenced)
+        self._canonical: 'weakref.WeakValueDictionary[Hashable, Cronexp]' = (
+                weakref.WeakValueDictionary())
+        self._hits = 0
+        self._misses = 0
+        self._shared = 0
+
+    def compile(
+            self,
+            expression: str,
+            option: CronexpOption = CronexpOption()) -> Cronexp:
+        key = (' '.join(expression.split()), option)
+        cronexp = self._cache.get(key)
+        if cronexp is not None:
+            self._hits += 1
+            self._cache.move_to_end(key)
+            return cronexp
+        self._misses += 1
+        cronexp = Cronexp(expression, option=option)
+        canonical_key = cronexp.canonical_key()
+        shared = self._canonical.get(canonical_key)
+        if shared is not None:
+            self._shared += 1
+            # same occurrences: share the compiled parts, keep the option
+            cronexp = (shared if shared.option == option
+                       else Cronexp.from_exp(
+                               shared._timeexp,
+                               shared._dateexp,
+                               option=option))
+        else:
+            self._canonical[canonical_key] = cronexp
+        self._cache[key] = cronexp
+        if len(self._cache) > self._maxsize:
+            self._cache.popitem(last=False)
+        return cronexp
+
+    def info(self) -> CronexpCacheInfo:
+        return CronexpCacheInfo(
+                hits=self._hits,
+                misses=self._misses,
+                shared=self._shared,
+                maxsize=self._maxsize,
+                currsize=len(self._cache))
+
+    def clear(self) -> None:
+        self._cache.clear()
+        self._canonical.clear()
+        self._hits = 0
+        self._misses = 0
+        self._shared = 0
+
+
+_default_cache = CronexpCache()
+
+
+def compile_cronexp(
+        expression: str,
+        option: CronexpOption = CronexpOption()) -> Cronexp:
+    return _default_cache.compile(expression, option=option)
+
+
+def compile_cache_info() -> CronexpCacheInfo:
+    return _default_cache.info()
@@ -1,12 +1,21 @@
 # -*- coding: utf-8 -*-
 
+import bisect
 import datetime
-from typing import List, NamedTuple, Optional
-from ._dateexp import Dateexp, DateexpNext
+import itertools
+from typing import (
+        TYPE_CHECKING, Any, Hashable, Iterator, List, NamedTuple, Optional,
+        Tuple)
+from . import _stats
+from ._dateexp import GREGORIAN_CYCLE_YEARS, Dateexp
 from ._dayexp import DayexpParseError, DaySelectionMode
 from ._field_parser import FieldParseError
 from ._timeexp import Timeexp
 from ._weekday_field import SundayMode
+if TYPE_CHECKING:
+    import numpy
+    from ._timezone import (
+            AmbiguousTimePolicy, NonexistentTimePolicy, ZonedCronexp)
 
 
 class CronexpOption(NamedTuple):
@@ -17,21 +26,25 @@ class CronexpOption(NamedTuple):
 
 
 class Cronexp:
+    __slots__ = ('_option', '_timeexp', '_dateexp', '__weakref__')
+
     def __init__(
             self,
             expression: str,
             option: CronexpOption = CronexpOption()) -> None:
+        self._option = option
         field_list = expression.split()
         if len(field_list) != 5:
             raise ValueError(
                     'expression("{0}") has {1} fields. '
                     'expression must have 5 fields.'
                     .format(expression, len(field_list)))
+        # identical parts are shared between expressions
         try:
-            self._timeexp = Timeexp(
+            self._timeexp = Timeexp.parse(
                     minute=field_list[0],
                     hour=field_list[1])
-            self._dateexp = Dateexp(
+            self._dateexp = Dateexp.parse(
                     day=field_list[2],
                     month=field_list[3],
                     weekday=field_list[4],
@@ -42,46 +55,414 @@ class Cronexp:
         except (DayexpParseError, FieldParseError) as parse_error:
             raise ValueError(str(parse_error))
 
+    @classmethod
+    def from_exp(
+            cls,
+            timeexp: Timeexp,
+            dateexp: Dateexp,
+            option: CronexpOption = CronexpOption()) -> 'Cronexp':
+        cronexp = cls.__new__(cls)
+        cronexp._option = option
+        cronexp._timeexp = timeexp
+        cronexp._dateexp = dateexp
+        return cronexp
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> 'Cronexp':
+        from ._serialize import load
+        return load(data)
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        return (Cronexp.from_bytes, (self.to_bytes(),))
+
+    @property
+    def option(self) -> CronexpOption:
+        return self._option
+
+    @property
+    def is_satisfiable(self) -> bool:
+        # False if the expression never fires (e.g. "0 0 30 2 *")
+        return self._dateexp.is_satisfiable
+
+    def to_bytes(self) -> bytes:
+        from ._serialize import dump
+        return dump(self)
+
+    def canonical_key(self) -> Hashable:
+        # equal keys select the same occurrences
+        return (self._timeexp.canonical_key(), self._dateexp.canonical_key())
+
     def next(
             self,
-            start: datetime.datetime) -> Optional[datetime.datetime]:
+            start: datetime.datetime,
+            until: Optional[datetime.datetime] = None,
+            ) -> Optional[datetime.datetime]:
+        # until: give up at this time (exclusive)
+        stats = _stats.ACTIVE.get()
+        if stats is not None:
+            return stats.trace('next', self._next, start, until)
+        return self._next(start, until)
+
+    def _next(
+            self,
+            start: datetime.datetime,
+            until: Optional[datetime.datetime],
+            ) -> Optional[datetime.datetime]:
+        max_year = self._dateexp.max_year()
+        if max_year is not None and max_year < start.year:
+            return None
         next_time = self._timeexp.next(
                 minute=start.minute,
                 hour=start.hour)
-        next_date: Optional[DateexpNext] = None
+        result: Optional[datetime.datetime] = None
         if (not next_time.move_up
                 and self._dateexp.is_selected(
                         year=start.year,
                         month=start.month,
                         day=start.day)):
-            next_date = DateexpNext(
-                    day=start.day,
+            result = datetime.datetime(
+                    year=start.year,
                     month=start.month,
-                    year=start.year)
+                    day=start.day,
+                    hour=next_time.hour,
+                    minute=next_time.minute,
+                    tzinfo=start.tzinfo)
         else:
             next_date = self._dateexp.next(
                     year=start.year,
                     month=start.month,
-                    day=start.day + (1 if next_time.move_up else 0))
-        if next_date is not None:
+                    day=start.day,
+                    until=until.date() if until is not None else None)
+            if next_date is not None:
+                hour, minute = divmod(self._timeexp.minute_list()[0], 60)
+                result = datetime.datetime(
+                        year=next_date.year,
+                        month=next_date.month,
+                        day=next_date.day,
+                        hour=hour,
+                        minute=minute,
+                        tzinfo=start.tzinfo)
+        if result is not None and until is not None and until <= result:
+            return None
+        return result
+
+    def nth(
+            self,
+            start: datetime.datetime,
+            n: int) -> Optional[datetime.datetime]:
+        # n-th occurrence after start (nth(start, 1) == next(start))
+        if n <= 0:
+            raise ValueError('n({0}) must be positive value'.format(n))
+        stats = _stats.ACTIVE.get()
+        if stats is not None:
+            return stats.trace('nth', self._nth, start, n)
+        return self._nth(start, n)
+
+    def _nth(
+            self,
+            start: datetime.datetime,
+            n: int) -> Optional[datetime.datetime]:
+        max_year = self._dateexp.max_year()
+        if (not self.is_satisfiable
+                or (max_year is not None and max_year < start.year)):
+            return None
+        minute_list = self._timeexp.minute_list()
+        # the rest of the start day
+        if self._dateexp.is_selected(
+                year=start.year,
+                month=start.month,
+                day=start.day):
+            index = bisect.bisect_right(minute_list, _minute_of_day(start))
+            if n <= len(minute_list) - index:
+                hour, minute = divmod(minute_list[index + n - 1], 60)
+                return start.replace(
+                        hour=hour,
+                        minute=minute,
+                        second=0,
+                        microsecond=0)
+            n -= len(minute_list) - index
+        # skip whole months by their number of occurrences
+        year, month, day = start.year, start.month, start.day
+        is_found = False
+        while year <= datetime.MAXYEAR:
+            if max_year is not None and max_year < year:
+                break
+            if not is_found and start.year + GREGORIAN_CYCLE_YEARS < year:
+                break
+            day_list = self._dateexp.day_list(year, month)
+            day_list = day_list[bisect.bisect_right(day_list, day):]
+            is_found = is_found or bool(day_list)
+            if n <= len(day_list) * len(minute_list):
+                day_index, minute_index = divmod(n - 1, len(minute_list))
+                hour, minute = divmod(minute_list[minute_index], 60)
+                return datetime.datetime(
+                        year=year,
+                        month=month,
+                        day=day_list[day_index],
+                        hour=hour,
+                        minute=minute,
+                        tzinfo=start.tzinfo)
+            n -= len(day_list) * len(minute_list)
+            year, month = (year, month + 1) if month < 12 else (year + 1, 1)
+            day = 0
+        return None
+
+    def prev(
+            self,
+            start: datetime.datetime) -> Optional[datetime.datetime]:
+        # the latest occurrence at or before start
+        stats = _stats.ACTIVE.get()
+        if stats is not None:
+            return stats.trace('prev', self._prev, start)
+        return self._prev(start)
+
+    def _prev(
+            self,
+            start: datetime.datetime) -> Optional[datetime.datetime]:
+        if (self._timeexp.is_selected(hour=start.hour, minute=start.minute)
+                and self._dateexp.is_selected(
+                        year=start.year,
+                        month=start.month,
+                        day=start.day)):
+            return start.replace(second=0, microsecond=0)
+        prev_time = self._timeexp.prev(
+                minute=start.minute,
+                hour=start.hour)
+        if (not prev_time.move_down
+                and self._dateexp.is_selected(
+                        year=start.year,
+                        month=start.month,
+                        day=start.day)):
             return datetime.datetime(
-                    year=next_date.year,
-                    month=next_date.month,
-                    day=next_date.day,
-                    hour=next_time.hour,
-                    minute=next_time.minute,
+                    year=start.year,
+                    month=start.month,
+                    day=start.day,
+                    hour=prev_time.hour,
+                    minute=prev_time.minute,
+                    tzinfo=start.tzinfo)
+        prev_date = self._dateexp.prev(
+                year=start.year,
+                month=start.month,
+                day=start.day)
+        if prev_date is not None:
+            hour, minute = divmod(self._timeexp.minute_list()[-1], 60)
+            return datetime.datetime(
+                    year=prev_date.year,
+                    month=prev_date.month,
+                    day=prev_date.day,
+                    hour=hour,
+                    minute=minute,
                     tzinfo=start.tzinfo)
         return None
 
+    def count(
+            self,
+            start: datetime.datetime,
+            end: datetime.datetime) -> int:
+        # number of occurrences in [start, end)
+        stats = _stats.ACTIVE.get()
+        if stats is not None:
+            return stats.trace('count', self._count, start, end)
+        return self._count(start, end)
+
+    def _count(
+            self,
+            start: datetime.datetime,
+            end: datetime.datetime) -> int:
+        if end <= start:
+            return 0
+        minute_list = self._timeexp.minute_list()
+        start_index = bisect.bisect_left(
+                minute_list,
+                _minute_of_day(start, ceil=True))
+        end_index = bisect.bisect_left(
+                minute_list,
+                _minute_of_day(end, ceil=True))
+        start_date = start.date()
+        end_date = end.date()
+
+        max_year = self._dateexp.max_year()
+
+        def is_selected(date: datetime.date) -> bool:
+            # no date + 1 day: it overflows on 9999-12-31
+            return ((max_year is None or date.year <= max_year)
+                    and self._dateexp.is_selected(
+                            date.year,
+                            date.month,
+                            date.day))
+
+        if start_date == end_date:
+            return (end_index - start_index
+                    if is_selected(start_date) else 0)
+        # first day, last day and the days between them
+        result = 0
+        if is_selected(start_date):
+            result += len(minute_list) - start_index
+        if is_selected(end_date):
+            result += end_index
+        result += len(minute_list) * self._dateexp.count_days(
+                start_date + datetime.timedelta(days=1),
+                end_date)
+        return result
+
     def next_list(
+            self,
+            start: datetime.datetime,
+            length: int,
+            until: Optional[datetime.datetime] = None,
+            ) -> List[datetime.datetime]:
+        return list(itertools.islice(self.iter(start, until=until), length))
+
+    def between(
+            self,
+            start: datetime.datetime,
+            end: datetime.datetime) -> Iterator[datetime.datetime]:
+        # occurrences in [start, end)
+        for next_ in self.iter(
+                start - datetime.timedelta(minutes=1),
+                until=end):
+            if start <= next_:
+                yield next_
+
+    def in_zone(
+            self,
+            zone: datetime.tzinfo,
+            nonexistent: Optional['NonexistentTimePolicy'] = None,
+            ambiguous: Optional['AmbiguousTimePolicy'] = None,
+            ) -> 'ZonedCronexp':
+        # evaluate the expression in the local time of zone
+        # (default: fire at the end of a DST gap, once in a DST overlap)
+        from ._timezone import (
+                AmbiguousTimePolicy, NonexistentTimePolicy, ZonedCronexp)
+        return ZonedCronexp(
+                self,
+                zone,
+                nonexistent=(nonexistent if nonexistent is not None
+                             else NonexistentTimePolicy.SHIFT),
+                ambiguous=(ambiguous if ambiguous is not None
+                           else AmbiguousTimePolicy.FIRST))
+
+    def next_array(self, timestamps: 'numpy.ndarray') -> 'numpy.ndarray':
+        # timestamps: datetime64 array or int64 epoch seconds
+        # returns datetime64[m] array (NaT if there is no next occurrence)
+        from ._vectorize import next_array
+        return next_array(self, timestamps)
+
+    def match_mask(self, timestamps: 'numpy.ndarray') -> 'numpy.ndarray':
+        # timestamps: datetime64 array or int64 epoch seconds
+        # returns bool array (timestamps are truncated to minutes)
+        from ._vectorize import match_mask
+        return match_mask(self, timestamps)
+
+    def prev_list(
             self,
             start: datetime.datetime,
             length: int) -> List[datetime.datetime]:
-        result: List[datetime.datetime] = []
-        while len(result) < length:
-            next_ = self.next(result[-1] if result else start)
-            if next_ is not None:
-                result.append(next_)
-            else:
-                break
-        return result
+        return list(itertools.islice(self.reverse_iter(start), length))
+
+    def iter(
+            self,
+            start: datetime.datetime,
+            until: Optional[datetime.datetime] = None) -> 'CronexpCursor':
+        return CronexpCursor(self, start, until=until)
+
+    def reverse_iter(
+            self,
+            start: datetime.datetime) -> Iterator[datetime.datetime]:
+        prev_ = self.prev(start)
+        while prev_ is not None:
+            yield prev_
+            prev_ = self.prev(prev_ - datetime.timedelta(minutes=1))
+
+
+def _minute_of_day(time: datetime.datetime, ceil: bool = False) -> int:
+    result = time.hour * 60 + time.minute
+    if ceil and (time.second or time.microsecond):
+        result += 1
+    return result
+
+
+class CronexpCursor:
+    def __init__(
+            self,
+            cronexp: Cronexp,
+            start: datetime.datetime,
+            until: Optional[datetime.datetime] = None) -> None:
+        # until: stop at this time (exclusive)
+        self._cronexp = cronexp
+        self._until = until
+        self._minute_list = cronexp._timeexp.minute_list()
+        self._tzinfo = start.tzinfo
+        # position of the upcoming occurrence
+        self._year = 0
+        self._month = 0
+        self._day_list: List[int] = []
+        self._day_index = 0
+        self._minute_index = 0
+        self._next: Optional[datetime.datetime] = None
+        self.seek(start)
+
+    def __iter__(self) -> Iterator[datetime.datetime]:
+        return self
+
+    def __next__(self) -> datetime.datetime:
+        next_ = self.advance()
+        if next_ is None:
+            raise StopIteration
+        return next_
+
+    def seek(self, start: datetime.datetime) -> None:
+        self._tzinfo = start.tzinfo
+        self._next = self._cronexp.next(start, until=self._until)
+        if self._next is None:
+            return
+        self._year = self._next.year
+        self._month = self._next.month
+        self._day_list = self._cronexp._dateexp.day_list(
+                self._year,
+                self._month)
+        self._day_index = bisect.bisect_left(self._day_list, self._next.day)
+        self._minute_index = bisect.bisect_left(
+                self._minute_list,
+                self._next.hour * 60 + self._next.minute)
+
+    def peek(self) -> Optional[datetime.datetime]:
+        return self._next
+
+    def advance(self) -> Optional[datetime.datetime]:
+        current = self._next
+        if current is not None:
+            self._step()
+        return current
+
+    def _step(self) -> None:
+        self._minute_index += 1
+        if self._minute_index == len(self._minute_list):
+            self._minute_index = 0
+            self._day_index += 1
+            if self._day_index == len(self._day_list):
+                next_date = self._cronexp._dateexp.next(
+                        year=self._year,
+                        month=self._month,
+                        day=self._day_list[-1],
+                        until=(self._until.date()
+                               if self._until is not None else None))
+                if next_date is None:
+                    self._next = None
+                    return
+                self._year = next_date.year
+                self._month = next_date.month
+                self._day_list = self._cronexp._dateexp.day_list(
+                        self._year,
+                        self._month)
+                self._day_index = self._day_list.index(next_date.day)
+        hour, minute = divmod(self._minute_list[self._minute_index], 60)
+        self._next = datetime.datetime(
+                year=self._year,
+                month=self._month,
+                day=self._day_list[self._day_index],
+                hour=hour,
+                minute=minute,
+                tzinfo=self._tzinfo)
+        if self._until is not None and self._until <= self._next:
+            self._next = None
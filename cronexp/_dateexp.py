@@ -1,19 +1,44 @@
 # -*- coding: utf-8 -*-
 
-from typing import NamedTuple, Optional
+import bisect
+import datetime
+import weakref
+from typing import Hashable, List, NamedTuple, Optional
+from . import _stats
 from ._dayexp import Dayexp, DaySelectionMode
 from ._field import Field
 from ._field_parser import month_word_set
 from ._weekday_field import SundayMode
 
 
+GREGORIAN_CYCLE_YEARS = 400
+# the maximum number of days in each month (1...12)
+MAX_MONTH_DAYS = (31, 29, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+
+
 class DateexpNext(NamedTuple):
     day: int
     month: int
     year: int
 
 
+class YearCycleTable(NamedTuple):
+    # year % GREGORIAN_CYCLE_YEARS -> years to the nearest year
+    # which contains a selected date (0 if the year itself does)
+    next: List[int]
+    prev: List[int]
+
+
+# (dayexp, month, max year) -> shared instance
+_interned: 'weakref.WeakValueDictionary[Hashable, Dateexp]' = (
+        weakref.WeakValueDictionary())
+
+
 class Dateexp:
+    __slots__ = (
+            '_dayexp', '_month', '_max_year', '_is_satisfiable',
+            '_year_cycle_table', '__weakref__')
+
     def __init__(
             self,
             day: str,
@@ -33,31 +58,207 @@ class Dateexp:
                 month, 1, 12,
                 word_set=month_word_set() if use_word_set else None)
         self._max_year = max_year
+        self._is_satisfiable = self._check_satisfiable()
+        self._year_cycle_table: Optional[YearCycleTable] = None
+
+    @classmethod
+    def parse(
+            cls,
+            day: str,
+            month: str,
+            weekday: str,
+            day_selection_mode: DaySelectionMode,
+            max_year: Optional[int] = None,
+            use_word_set: bool = True,
+            sunday_mode: SundayMode = SundayMode.SUNDAY_IS_0) -> 'Dateexp':
+        # shared instance
+        return cls.from_fields(
+                dayexp=Dayexp.parse(
+                        day,
+                        weekday,
+                        selection_mode=day_selection_mode,
+                        use_word_set=use_word_set,
+                        sunday_mode=sunday_mode),
+                month=Field.parse(
+                        month, 1, 12,
+                        word_set=month_word_set() if use_word_set else None),
+                max_year=max_year)
+
+    @classmethod
+    def from_fields(
+            cls,
+            dayexp: Dayexp,
+            month: Field,
+            max_year: Optional[int] = None) -> 'Dateexp':
+        # shared instance
+        key = (dayexp, month, max_year)
+        dateexp = _interned.get(key)
+        if dateexp is None:
+            dateexp = cls.__new__(cls)
+            dateexp._dayexp = dayexp
+            dateexp._month = month
+            dateexp._max_year = max_year
+            dateexp._is_satisfiable = dateexp._check_satisfiable()
+            dateexp._year_cycle_table = None
+            _interned[key] = dateexp
+        return dateexp
+
+    @property
+    def is_satisfiable(self) -> bool:
+        # False if no date is ever selected (e.g. Feb 30)
+        return self._is_satisfiable
+
+    @property
+    def dayexp(self) -> Dayexp:
+        return self._dayexp
 
-    def next(self, day: int, month: int, year: int) -> Optional[DateexpNext]:
-        def impl(
-                year_: int,
-                month_: int,
-                day_: Optional[int]) -> Optional[DateexpNext]:
-            if not self._month.is_selected(month_):
-                next_month = self._month.next(month_)
-                day_ = None
-                month_ = next_month.value
-                if next_month.move_up:
-                    year_ += 1
+    @property
+    def month(self) -> Field:
+        return self._month
+
+    def canonical_key(self) -> Hashable:
+        return (self._dayexp.canonical_key(),
+                self._month.canonical_key(),
+                self._max_year)
+
+    def next(
+            self,
+            day: int,
+            month: int,
+            year: int,
+            until: Optional[datetime.date] = None) -> Optional[DateexpNext]:
+        # until: give up after this date
+        if not self._is_satisfiable:
+            return None
+        year_, month_ = year, month
+        day_: Optional[int] = day
+        if not self._month.is_selected(month_):
+            next_month = self._month.next(month_)
+            day_ = None
+            month_ = next_month.value
+            if next_month.move_up:
+                year_ += 1
+        # the calendar repeats every 400 years
+        crossed_year = 0
+        stats = _stats.ACTIVE.get()
+        while year_ <= year + GREGORIAN_CYCLE_YEARS:
+            # no dates after max_year (also after the first month roll)
+            if self._max_year is not None and self._max_year < year_:
+                return None
+            if stats is not None:
+                stats.month += 1
+            if (until is not None
+                    and (until.year, until.month) < (year_, month_)):
+                return None
             day_ = self._dayexp.next(year_, month_, day_)
             if day_ is not None:
+                if (until is not None
+                        and (until.year, until.month, until.day)
+                        < (year_, month_, day_)):
+                    return None
                 return DateexpNext(year=year_, month=month_, day=day_)
+            # skip to the next selected month
             next_month = self._month.next(month_)
             month_ = next_month.value
             if next_month.move_up:
                 year_ += 1
-                if self._max_year is not None and self._max_year < year_:
-                    return None
-            return impl(year_, month_, day_)
+                crossed_year += 1
+                if stats is not None:
+                    stats.year += 1
+                # a whole year without selected dates: skip to the next
+                # year which contains one
+                if crossed_year >= 2:
+                    year_ += self._get_year_cycle_table().next[
+                            year_ % GREGORIAN_CYCLE_YEARS]
+        return None
+
+    def prev(self, day: int, month: int, year: int) -> Optional[DateexpNext]:
+        if not self._is_satisfiable:
+            return None
+        year_, month_ = year, month
+        day_: Optional[int] = day
+        if not self._month.is_selected(month_):
+            prev_month = self._month.prev(month_)
+            day_ = None
+            month_ = prev_month.value
+            if prev_month.move_down:
+                year_ -= 1
+        crossed_year = 0
+        stats = _stats.ACTIVE.get()
+        while year_ >= datetime.MINYEAR:
+            if stats is not None:
+                stats.month += 1
+            day_ = self._dayexp.prev(year_, month_, day_)
+            if day_ is not None:
+                return DateexpNext(year=year_, month=month_, day=day_)
+            prev_month = self._month.prev(month_)
+            month_ = prev_month.value
+            if prev_month.move_down:
+                year_ -= 1
+                crossed_year += 1
+                if stats is not None:
+                    stats.year += 1
+                if crossed_year >= 2:
+                    year_ -= self._get_year_cycle_table().prev[
+                            year_ % GREGORIAN_CYCLE_YEARS]
+        return None
 
-        return impl(year, month, day)
+    def _get_year_cycle_table(self) -> YearCycleTable:
+        # built on demand: only sparse schedules need it
+        if self._year_cycle_table is None:
+            # (2000 + i) % 400 == i
+            has_date = [
+                    any(self._dayexp.next(2000 + i, month, None) is not None
+                        for month in range(1, 13)
+                        if self._month.is_selected(month))
+                    for i in range(GREGORIAN_CYCLE_YEARS)]
+            # satisfiable: at least one year has a selected date
+            assert any(has_date)
+            size = GREGORIAN_CYCLE_YEARS
+            next_: List[int] = [0] * size
+            prev: List[int] = [0] * size
+            for i in range(size):
+                next_[i] = next(k for k in range(size)
+                                if has_date[(i + k) % size])
+                prev[i] = next(k for k in range(size)
+                               if has_date[(i - k) % size])
+            self._year_cycle_table = YearCycleTable(next=next_, prev=prev)
+        return self._year_cycle_table
+
+    def _check_satisfiable(self) -> bool:
+        return any(
+                self._dayexp.is_satisfiable(lastday)
+                for month, lastday in enumerate(MAX_MONTH_DAYS, start=1)
+                if self._month.is_selected(month))
 
     def is_selected(self, year: int, month: int, day: int) -> bool:
         return (self._month.is_selected(month)
                 and self._dayexp.is_selected(year, month, day))
+
+    def max_year(self) -> Optional[int]:
+        return self._max_year
+
+    def count_days(self, start: datetime.date, end: datetime.date) -> int:
+        # number of selected days in [start, end)
+        if not self._is_satisfiable:
+            return 0
+        if self._max_year is not None and self._max_year < end.year:
+            end = datetime.date(self._max_year + 1, 1, 1)
+        result = 0
+        year, month = start.year, start.month
+        while (year, month) <= (end.year, end.month):
+            day_list = self.day_list(year, month)
+            first = (bisect.bisect_left(day_list, start.day)
+                     if (year, month) == (start.year, start.month) else 0)
+            last = (bisect.bisect_left(day_list, end.day)
+                    if (year, month) == (end.year, end.month)
+                    else len(day_list))
+            result += max(last - first, 0)
+            year, month = (year, month + 1) if month < 12 else (year + 1, 1)
+        return result
+
+    def day_list(self, year: int, month: int) -> List[int]:
+        if not self._month.is_selected(month):
+            return []
+        mask = self._dayexp.day_mask(year, month)
+        return [day for day in range(1, mask.bit_length()) if mask >> day & 1]
@@ -1,20 +1,64 @@
 # -*- coding: utf-8 -*-
 
-import calendar
-from typing import List, Optional
-from ._field_parser import FieldParser
+import weakref
+from typing import Hashable, List, Optional, Tuple
+from . import _stats
+from ._field import field_table
+from ._field_parser import DayFieldParseResult, FieldParser
+from ._month_info import month_info, month_length
+
+
+# identical fields share one instance
+_interned: 'weakref.WeakValueDictionary[Hashable, DayOfMonthField]' = (
+        weakref.WeakValueDictionary())
 
 
 class DayOfMonthField:
+    __slots__ = (
+            '_non_standard', '_is_any', '_is_blank', '_l', '_w', '_table',
+            '__weakref__')
+
     def __init__(self, field: str, non_standard: bool) -> None:
-        self._non_standard = non_standard
         parser = FieldParser(field, 1, 31)
-        result = parser.parse_day_field(non_standard=non_standard)
+        self._setup(
+                parser.parse_day_field(non_standard=non_standard),
+                non_standard)
+
+    @classmethod
+    def parse(cls, field: str, non_standard: bool) -> 'DayOfMonthField':
+        # shared instance
+        parser = FieldParser(field, 1, 31)
+        return cls.from_parse_result(
+                parser.parse_day_field(non_standard=non_standard),
+                non_standard)
+
+    @classmethod
+    def from_parse_result(
+            cls,
+            result: DayFieldParseResult,
+            non_standard: bool) -> 'DayOfMonthField':
+        # shared instance
+        key = (cls,
+               non_standard,
+               result.is_any,
+               result.is_blank,
+               tuple(result.value),
+               result.last,
+               tuple(result.w))
+        field = _interned.get(key)
+        if field is None:
+            field = cls.__new__(cls)
+            field._setup(result, non_standard)
+            _interned[key] = field
+        return field
+
+    def _setup(self, result: DayFieldParseResult, non_standard: bool) -> None:
+        self._non_standard = non_standard
         self._is_any = result.is_any
         self._is_blank = result.is_blank
-        self._value = result.value
         self._l = result.last
-        self._w = result.w
+        self._w = tuple(result.w)
+        self._table = field_table(result.value, 31)
 
     @property
     def is_any(self) -> bool:
@@ -24,10 +68,59 @@ class DayOfMonthField:
     def is_blank(self) -> bool:
         return self._is_blank
 
+    @property
+    def non_standard(self) -> bool:
+        return self._non_standard
+
+    @property
+    def bitmask(self) -> int:
+        return self._table.bitmask
+
+    @property
+    def last(self) -> bool:
+        return self._l
+
+    @property
+    def w(self) -> Tuple[int, ...]:
+        return self._w
+
+    @property
+    def has_extension(self) -> bool:
+        return self._non_standard and (self._l or bool(self._w))
+
+    def canonical_key(self) -> Hashable:
+        return (self._is_any,
+                self._is_blank,
+                self._table.bitmask,
+                self._l,
+                self._w)
+
+    def is_satisfiable(self, lastday: int) -> bool:
+        # whether a day can be selected in a month with lastday days
+        if self._non_standard:
+            if self._is_blank:
+                return False
+            if self._l or self._w:
+                return True
+        return self._table.min is not None and self._table.min <= lastday
+
+    def day_mask(self, year: int, month: int) -> int:
+        # bit i: day i is selected (1 <= i <= 31)
+        if self._non_standard and self._is_blank:
+            return 0
+        lastday = month_length(year, month)
+        result = self._table.bitmask & ((1 << (lastday + 1)) - 2)
+        if self._non_standard:
+            if self._l:
+                result |= 1 << lastday
+            for w in self._w:
+                result |= 1 << day_of_month_w(w, year, month)
+        return result
+
     def next(self, year: int, month: int, day: Optional[int]) -> Optional[int]:
-        lastday = calendar.monthrange(year, month)[1]
-        target: List[Optional[int]] = []
-        target.extend(self._value)
+        lastday = month_length(year, month)
+        target: List[Optional[int]] = [
+                self._table.next_of(day if day is not None else 0)]
         if self._non_standard:
             if self.is_blank:
                 return None
@@ -42,12 +135,26 @@ class DayOfMonthField:
                        target),
                 default=None)
 
+    def prev(self, year: int, month: int, day: Optional[int]) -> Optional[int]:
+        lastday = month_length(year, month)
+        limit = min(day, lastday + 1) if day is not None else lastday + 1
+        target: List[Optional[int]] = [self._table.prev_of(limit)]
+        if self._non_standard:
+            if self.is_blank:
+                return None
+            if self._l:
+                target.append(lastday)
+            target.extend(day_of_month_w(w, year, month) for w in self._w)
+        return max(
+                filter(lambda x: x is not None and x < limit, target),
+                default=None)
+
     def is_selected(self, year: int, month: int, day: int) -> bool:
         if self._non_standard and self._is_blank:
             return False
-        lastday = calendar.monthrange(year, month)[1]
+        lastday = month_length(year, month)
         if 1 <= day <= lastday:
-            if day in self._value:
+            if self._table.is_selected(day):
                 return True
             if self._non_standard:
                 if self._l and day == lastday:
@@ -61,9 +168,12 @@ def day_of_month_w(
         target: int,
         year: int,
         month: int) -> int:
-    lastday = calendar.monthrange(year, month)[1]
+    stats = _stats.ACTIVE.get()
+    if stats is not None:
+        stats.day_of_month_w += 1
+    init_weekday, lastday = month_info(year, month)
     result = min(target, lastday)
-    weekday = calendar.weekday(year, month, result)
+    weekday = (init_weekday + result - 1) % 7
     if weekday > 4:
         if result == 1:
             result += 2 if weekday == 5 else 1
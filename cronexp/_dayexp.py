@@ -1,7 +1,9 @@
 # -*- coding: utf-8 -*-
 
 import enum
-from typing import List, Optional
+import weakref
+from typing import Dict, Hashable, List, Optional, Tuple
+from . import _stats
 from ._day_field import DayOfMonthField
 from ._weekday_field import DayOfWeekField, SundayMode
 
@@ -12,6 +14,11 @@ class DaySelectionMode(enum.Enum):
     EITHER = enum.auto()
 
 
+EITHER_BLANK_MESSAGE = 'One of day and weekday must be "?"'
+# (year, month) entries of the day mask cache per Dayexp
+DAY_MASK_CACHE_SIZE = 1200
+
+
 class DayexpParseError(Exception):
     def __init__(self, day: str, weekday: str, message: str) -> None:
         super().__init__()
@@ -27,7 +34,16 @@ class DayexpParseError(Exception):
         return '\n'.join(line)
 
 
+# (selection mode, day of month, day of week) -> shared instance
+_interned: 'weakref.WeakValueDictionary[Hashable, Dayexp]' = (
+        weakref.WeakValueDictionary())
+
+
 class Dayexp:
+    __slots__ = (
+            '_mode', '_day_of_month', '_day_of_week', '_day_mask_cache',
+            '__weakref__')
+
     def __init__(
             self,
             day: str,
@@ -36,6 +52,7 @@ class Dayexp:
             use_word_set: bool = True,
             sunday_mode: SundayMode = SundayMode.SUNDAY_IS_0) -> None:
         self._mode = selection_mode
+        self._day_mask_cache: Optional[Dict[Tuple[int, int], int]] = None
         self._day_of_month = DayOfMonthField(
                 day,
                 non_standard=self._mode is DaySelectionMode.EITHER)
@@ -44,52 +61,155 @@ class Dayexp:
                 non_standard=self._mode is DaySelectionMode.EITHER,
                 use_word_set=use_word_set,
                 sunday_mode=sunday_mode)
-        if (self._mode is DaySelectionMode.EITHER
-                and self._day_of_month.is_blank == self._day_of_week.is_blank):
-            raise DayexpParseError(
-                    day,
-                    weekday,
-                    'One of day and weekday must be "?"')
+        _check_either_blank(
+                day,
+                weekday,
+                self._mode,
+                self._day_of_month,
+                self._day_of_week)
 
-    def next(self, year: int, month: int, day: Optional[int]) -> Optional[int]:
-        next_day_of_month = self._day_of_month.next(year, month, day)
-        next_day_of_week = self._day_of_week.next(year, month, day)
+    @classmethod
+    def parse(
+            cls,
+            day: str,
+            weekday: str,
+            selection_mode: DaySelectionMode,
+            use_word_set: bool = True,
+            sunday_mode: SundayMode = SundayMode.SUNDAY_IS_0) -> 'Dayexp':
+        # shared instance
+        day_of_month = DayOfMonthField.parse(
+                day,
+                non_standard=selection_mode is DaySelectionMode.EITHER)
+        day_of_week = DayOfWeekField.parse(
+                weekday,
+                non_standard=selection_mode is DaySelectionMode.EITHER,
+                use_word_set=use_word_set,
+                sunday_mode=sunday_mode)
+        _check_either_blank(
+                day,
+                weekday,
+                selection_mode,
+                day_of_month,
+                day_of_week)
+        return cls.from_fields(day_of_month, day_of_week, selection_mode)
+
+    @classmethod
+    def from_fields(
+            cls,
+            day_of_month: DayOfMonthField,
+            day_of_week: DayOfWeekField,
+            selection_mode: DaySelectionMode) -> 'Dayexp':
+        # shared instance
+        key = (selection_mode, day_of_month, day_of_week)
+        dayexp = _interned.get(key)
+        if dayexp is None:
+            dayexp = cls.__new__(cls)
+            dayexp._mode = selection_mode
+            dayexp._day_of_month = day_of_month
+            dayexp._day_of_week = day_of_week
+            dayexp._day_mask_cache = None
+            _interned[key] = dayexp
+        return dayexp
+
+    @property
+    def selection_mode(self) -> DaySelectionMode:
+        return self._mode
+
+    @property
+    def day_of_month(self) -> DayOfMonthField:
+        return self._day_of_month
+
+    @property
+    def day_of_week(self) -> DayOfWeekField:
+        return self._day_of_week
+
+    def canonical_key(self) -> Hashable:
+        return (self._mode,
+                self._day_of_month.canonical_key(),
+                self._day_of_week.canonical_key())
+
+    def is_satisfiable(self, lastday: int) -> bool:
+        # whether a day can be selected in a month with lastday days
+        # in some year
+        day_of_month = self._day_of_month.is_satisfiable(lastday)
+        day_of_week = self._day_of_week.is_satisfiable()
         if self._mode is DaySelectionMode.OR:
             if not self._day_of_month.is_any and not self._day_of_week.is_any:
-                return min(filter(lambda x: x is not None,
-                                  [next_day_of_month, next_day_of_week]),
-                           default=None)
-            return (next_day_of_month
+                return day_of_month or day_of_week
+            return (day_of_month
                     if self._day_of_week.is_any
-                    else next_day_of_week)
+                    else day_of_week)
         if self._mode is DaySelectionMode.AND:
-            while (next_day_of_month is not None
-                   and next_day_of_week is not None):
-                if next_day_of_month < next_day_of_week:
-                    next_day_of_month = self._day_of_month.next(
-                            year, month, next_day_of_month)
-                elif next_day_of_month > next_day_of_week:
-                    next_day_of_week = self._day_of_week.next(
-                            year, month, next_day_of_week)
-                else:
-                    return next_day_of_month
+            return day_of_month and day_of_week
+        return (day_of_month
+                if self._day_of_week.is_blank
+                else day_of_week)
+
+    def day_mask(self, year: int, month: int) -> int:
+        # bit i: day i is selected (1 <= i <= 31)
+        key = (year, month)
+        cache = self._day_mask_cache
+        if cache is None:
+            cache = self._day_mask_cache = {}
+        result = cache.get(key)
+        if result is None:
+            result = self._resolve_day_mask(year, month)
+            # drop the oldest
+            # (shared by threads: another one may drop it first)
+            while len(cache) >= DAY_MASK_CACHE_SIZE:
+                try:
+                    cache.pop(next(iter(cache)), None)
+                except (StopIteration, RuntimeError):
+                    break
+            cache[key] = result
+        return result
+
+    def _resolve_day_mask(self, year: int, month: int) -> int:
+        stats = _stats.ACTIVE.get()
+        if stats is not None:
+            stats.day_mask += 1
         if self._mode is DaySelectionMode.EITHER:
-            return (next_day_of_month
+            return (self._day_of_month.day_mask(year, month)
                     if self._day_of_week.is_blank
-                    else next_day_of_week)
-        return None
+                    else self._day_of_week.day_mask(year, month))
+        if self._day_of_week.is_any:
+            return self._day_of_month.day_mask(year, month)
+        if self._day_of_month.is_any:
+            return self._day_of_week.day_mask(year, month)
+        if self._mode is DaySelectionMode.OR:
+            return (self._day_of_month.day_mask(year, month)
+                    | self._day_of_week.day_mask(year, month))
+        return (self._day_of_month.day_mask(year, month)
+                & self._day_of_week.day_mask(year, month))
+
+    def next(self, year: int, month: int, day: Optional[int]) -> Optional[int]:
+        # the first selected day after day
+        day_ = max(day, 0) if day is not None else 0
+        mask = self.day_mask(year, month) >> (day_ + 1)
+        if not mask:
+            return None
+        return day_ + (mask & -mask).bit_length()
+
+    def prev(self, year: int, month: int, day: Optional[int]) -> Optional[int]:
+        # the last selected day before day
+        mask = self.day_mask(year, month)
+        if day is not None:
+            mask &= (1 << max(day, 0)) - 1
+        return mask.bit_length() - 1 if mask else None
 
     def is_selected(self, year: int, month: int, day: int) -> bool:
-        is_selected_month = self._day_of_month.is_selected(year, month, day)
-        is_selected_week = self._day_of_week.is_selected(year, month, day)
-        if self._mode is DaySelectionMode.EITHER:
-            return (is_selected_month
-                    if self._day_of_week.is_blank
-                    else is_selected_week)
-        if not self._day_of_month.is_any and not self._day_of_week.is_any:
-            return (is_selected_month or is_selected_week
-                    if self._mode is DaySelectionMode.OR
-                    else is_selected_month and is_selected_week)
-        return (is_selected_month
-                if self._day_of_week.is_any
-                else is_selected_week)
+        return 1 <= day <= 31 and bool(self.day_mask(year, month) >> day & 1)
+
+
+def _check_either_blank(
+        day: str,
+        weekday: str,
+        selection_mode: DaySelectionMode,
+        day_of_month: DayOfMonthField,
+        day_of_week: DayOfWeekField) -> None:
+    if (selection_mode is DaySelectionMode.EITHER
+            and day_of_month.is_blank == day_of_week.is_blank):
+        raise DayexpParseError(
+                day,
+                weekday,
+                EITHER_BLANK_MESSAGE)
@@ -1,7 +1,8 @@
 # -*- coding: utf-8 -*-
 
-from typing import Dict, NamedTuple, Optional
-from ._field_parser import FieldParser
+import weakref
+from typing import Dict, Hashable, Iterable, List, NamedTuple, Optional, Tuple
+from ._field_parser import FieldParser, FieldParseResult
 
 
 class FieldNext(NamedTuple):
@@ -9,7 +10,68 @@ class FieldNext(NamedTuple):
     move_up: bool
 
 
+class FieldPrev(NamedTuple):
+    value: int
+    move_down: bool
+
+
+class FieldTable(NamedTuple):
+    bitmask: int
+    next: Tuple[Optional[int], ...]
+    prev: Tuple[Optional[int], ...]
+    min: Optional[int]
+    max: Optional[int]
+
+    def is_selected(self, value: int) -> bool:
+        return value >= 0 and bool(self.bitmask >> value & 1)
+
+    def next_of(self, value: int) -> Optional[int]:
+        # smallest selected value greater than value
+        index = value + 1
+        if index < 0:
+            return self.min
+        if index < len(self.next):
+            return self.next[index]
+        return None
+
+    def prev_of(self, value: int) -> Optional[int]:
+        # largest selected value less than value
+        index = value - 1
+        if index < 0:
+            return None
+        if index < len(self.prev):
+            return self.prev[index]
+        return self.max
+
+
+def field_table(value: Iterable[int], max_: int) -> FieldTable:
+    bitmask = 0
+    for i in value:
+        bitmask |= 1 << i
+    # next[i]: smallest selected value >= i (0 <= i <= max_ + 1)
+    next_: List[Optional[int]] = [None] * (max_ + 2)
+    for i in range(max_, -1, -1):
+        next_[i] = i if bitmask >> i & 1 else next_[i + 1]
+    # prev[i]: largest selected value <= i (0 <= i <= max_)
+    prev: List[Optional[int]] = [None] * (max_ + 1)
+    for i in range(0, max_ + 1):
+        prev[i] = i if bitmask >> i & 1 else (prev[i - 1] if i else None)
+    return FieldTable(
+            bitmask=bitmask,
+            next=tuple(next_),
+            prev=tuple(prev),
+            min=next_[0],
+            max=bitmask.bit_length() - 1 if bitmask else None)
+
+
+# identical fields share one instance
+_interned: 'weakref.WeakValueDictionary[Hashable, Field]' = (
+        weakref.WeakValueDictionary())
+
+
 class Field:
+    __slots__ = ('_is_any', '_table', '__weakref__')
+
     def __init__(
             self,
             field: str,
@@ -17,30 +79,68 @@ class Field:
             max_: int,
             word_set: Optional[Dict[str, int]] = None) -> None:
         parser = FieldParser(field, min_, max_, word_set=word_set)
-        result = parser.parse_field()
+        self._setup(parser.parse_field(), max_)
+
+    @classmethod
+    def parse(
+            cls,
+            field: str,
+            min_: int,
+            max_: int,
+            word_set: Optional[Dict[str, int]] = None) -> 'Field':
+        # shared instance
+        parser = FieldParser(field, min_, max_, word_set=word_set)
+        return cls.from_parse_result(parser.parse_field(), max_)
+
+    @classmethod
+    def from_parse_result(
+            cls,
+            result: FieldParseResult,
+            max_: int) -> 'Field':
+        # shared instance
+        key = (cls, result.is_any, max_, tuple(result.value))
+        field = _interned.get(key)
+        if field is None:
+            field = cls.__new__(cls)
+            field._setup(result, max_)
+            _interned[key] = field
+        return field
+
+    def _setup(self, result: FieldParseResult, max_: int) -> None:
+        assert result.value
         self._is_any = result.is_any
-        self._value = result.value
-        assert self._value
+        self._table = field_table(result.value, max_)
 
     @property
     def is_any(self) -> bool:
         return self._is_any
 
+    @property
+    def bitmask(self) -> int:
+        return self._table.bitmask
+
+    def canonical_key(self) -> Hashable:
+        return self._table.bitmask
+
     def next(self, value: int) -> FieldNext:
-        next_value: Optional[int] = None
-        for i in self._value:
-            if value < i:
-                next_value = i
-                break
+        next_value = self._table.next_of(value)
         return FieldNext(
             value=next_value if next_value is not None else self.min(),
             move_up=next_value is None)
 
+    def prev(self, value: int) -> FieldPrev:
+        prev_value = self._table.prev_of(value)
+        return FieldPrev(
+            value=prev_value if prev_value is not None else self.max(),
+            move_down=prev_value is None)
+
     def is_selected(self, i: int) -> bool:
-        return i in self._value
+        return self._table.is_selected(i)
 
     def min(self) -> int:
-        return min(self._value)
+        assert self._table.min is not None
+        return self._table.min
 
     def max(self) -> int:
-        return max(self._value)
+        assert self._table.max is not None
+        return self._table.max
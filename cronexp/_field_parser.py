@@ -1,7 +1,10 @@
 # -*- coding: utf-8 -*-
 
+import functools
 import re
-from typing import Dict, List, NamedTuple, Optional, Tuple
+from typing import (
+        Dict, FrozenSet, List, Match, NamedTuple, Optional, Pattern, Set,
+        Tuple)
 
 
 class FieldElementParseError(NamedTuple):
@@ -30,6 +33,12 @@ class FieldParseError(Exception):
         return '{0}\n'.format('\n'.join(line))
 
 
+class FieldParseErrorDetail(NamedTuple):
+    field: str
+    mismatched: List[str]
+    parse_error: List[FieldElementParseError]
+
+
 class FieldParseResult(NamedTuple):
     source: str
     is_any: bool
@@ -54,6 +63,21 @@ class WeekdayFieldParseResult(NamedTuple):
     hash: List[Tuple[int, int]]
 
 
+# element kinds: group names of _element_pattern
+# parse errors are reported in this order
+_ELEMENT_KIND_ORDER = {
+        'standard': 0,
+        'question': 1,
+        'day_last': 2,
+        'day_w': 2,
+        'weekday_last': 2,
+        'weekday_hash': 3}
+_STANDARD_KINDS = frozenset(('standard',))
+_DAY_KINDS = frozenset(('standard', 'question', 'day_last', 'day_w'))
+_WEEKDAY_KINDS = frozenset((
+        'standard', 'question', 'weekday_last', 'weekday_hash'))
+
+
 class FieldParser:
     def __init__(
             self,
@@ -68,198 +92,221 @@ class FieldParser:
         # parse result
         self._is_any = False
         self._is_blank = False
-        self._value: List[int] = []
+        self._value: Set[int] = set()
         self._day_last = False
-        self._day_w: List[int] = []
-        self._weekday_last: List[int] = []
-        self._weekday_hash: List[Tuple[int, int]] = []
+        self._day_w: Set[int] = set()
+        self._weekday_last: Set[int] = set()
+        self._weekday_hash: Set[Tuple[int, int]] = set()
         # parse error
-        self._element_list = field.split(',')
-        self._parse_error: List[FieldElementParseError] = []
+        self._mismatched: List[str] = []
+        self._parse_error: List[Tuple[int, FieldElementParseError]] = []
 
     def parse_field(self) -> FieldParseResult:
-        self._parse_standard()
+        self._parse(_STANDARD_KINDS, use_slash=True)
         self._error_check()
         return FieldParseResult(
                 source=self._origin,
                 is_any=self._is_any,
-                value=self._value)
+                value=sorted(self._value))
 
     def parse_day_field(
             self,
             non_standard: bool = True) -> DayFieldParseResult:
-        self._parse_standard()
-        if non_standard:
-            self._parse_question()
-            self._parse_day()
+        self._parse(
+                _DAY_KINDS if non_standard else _STANDARD_KINDS,
+                use_slash=True)
         self._error_check()
         return DayFieldParseResult(
                 source=self._origin,
                 is_any=self._is_any,
                 is_blank=self._is_blank,
-                value=self._value,
+                value=sorted(self._value),
                 last=self._day_last,
-                w=self._day_w)
+                w=sorted(self._day_w))
 
     def parse_weekday_field(
             self,
             non_standard: bool = True,
             use_slash: bool = True) -> WeekdayFieldParseResult:
-        self._parse_standard(use_slash=use_slash)
-        if non_standard:
-            self._parse_question()
-            self._parse_weekday()
+        self._parse(
+                _WEEKDAY_KINDS if non_standard else _STANDARD_KINDS,
+                use_slash=use_slash)
         self._error_check()
         return WeekdayFieldParseResult(
                 source=self._origin,
                 is_any=self._is_any,
                 is_blank=self._is_blank,
-                value=self._value,
-                last=self._weekday_last,
-                hash=self._weekday_hash)
-
-    def _parse_standard(self, use_slash: bool = True) -> None:
-        pattern = re.compile(
-                r'^(\*|(?P<begin>{0})(|-(?P<end>{0})))'
-                r'(|/(?P<step>[0-9]+))$'
-                .format(_word_set_to_regex(self._word_set)))
-        for element in self._element_list[:]:
-            match = pattern.match(element)
-            if match is None:
-                continue
-            self._element_list.remove(element)
-            # parameter
-            begin = _read_word(match.group('begin'), self._word_set)
-            end = _read_word(match.group('end'), self._word_set)
-            step = (int(match.group('step'))
-                    if match.group('step') is not None else None)
-            # error check
-            if begin is not None and not self._min <= begin <= self._max:
-                self._add_error(
-                        element,
-                        '{0} is out of range({1}...{2})'
-                        .format(begin, self._min, self._max))
-                continue
-            if end is not None and not self._min <= end <= self._max:
-                self._add_error(
-                        element,
-                        '{0} is out of range({1}...{2})'
-                        .format(end, self._min, self._max))
-                continue
-            if step is not None and step <= 0:
-                self._add_error(element, 'step must be positive value')
-                continue
-            if begin is not None and end is not None and end < begin:
-                self._add_error(
-                        element,
-                        'invalid range({0}...{1})'.format(begin, end))
-                continue
-            if not use_slash and step is not None:
-                self._add_error(element, '"/" is not allowed')
-                continue
-            # evaluate
-            evaluated = _evaluate_standard(
-                    self._min,
-                    self._max,
-                    begin,
-                    end,
-                    step)
-            if evaluated is None:
-                self._is_any = True
-                self._value.extend(range(self._min, self._max + 1))
-            else:
-                self._value.extend(evaluated)
-        self._value = sorted(set(self._value))
-
-    def _parse_question(self) -> None:
-        for element in self._element_list[:]:
-            if element != '?':
-                continue
-            self._element_list.remove(element)
-            self._is_blank = True
-            if self._origin != '?':
-                self._add_error(element, 'there is a charactor other than "?"')
-
-    def _parse_day(self) -> None:
-        # L
-        for element in self._element_list[:]:
-            if element != 'L':
-                continue
-            self._element_list.remove(element)
-            self._day_last = True
-        # <N>W
-        w_pattern = re.compile(r'^(?P<target>[0-9]+)W$')
-        for element in self._element_list[:]:
-            match = w_pattern.match(element)
-            if match is None:
-                continue
-            self._element_list.remove(element)
-            w_target = int(match.group('target'))
-            if self._min <= w_target <= self._max:
-                self._day_w.append(w_target)
-            else:
-                self._add_error(
-                        element,
-                        '{0} is out of range({1}...{2})'
-                        .format(w_target, self._min, self._max))
-        self._day_w = sorted(set(self._day_w))
-
-    def _parse_weekday(self) -> None:
-        # <N>L
-        l_pattern = re.compile(
-                r'^(?P<weekday>{0})L$'
-                .format(_word_set_to_regex(self._word_set)))
-        for element in self._element_list[:]:
-            match = l_pattern.match(element)
-            if not match:
-                continue
-            self._element_list.remove(element)
-            weekday = _read_word(match.group('weekday'), self._word_set)
-            if weekday is not None and self._min <= weekday <= self._max:
-                self._weekday_last.append(weekday)
-            else:
-                self._add_error(
-                        element,
-                        '{0} is out of range({1}...{2})'
-                        .format(weekday, self._min, self._max))
-        self._weekday_last = sorted(set(self._weekday_last))
-        # <N>#<N>
-        hash_pattern = re.compile(
-                r'^(?P<weekday>{0})#(?P<week_number>[0-9]+)$'
-                .format(_word_set_to_regex(self._word_set)))
-        for element in self._element_list[:]:
-            match = hash_pattern.match(element)
-            if not match:
-                continue
-            self._element_list.remove(element)
-            weekday = _read_word(match.group('weekday'), self._word_set)
-            week_number = int(match.group('week_number'))
-            if weekday is None or not self._min <= weekday <= self._max:
-                self._add_error(
-                        element,
-                        '{0} is out of range({1}...{2})'
-                        .format(weekday, self._min, self._max))
-            elif not 1 <= week_number <= 5:
-                self._add_error(
-                        element,
-                        '{0} is out of range({1}...{2})'
-                        .format(week_number, 1, 5))
+                value=sorted(self._value),
+                last=sorted(self._weekday_last),
+                hash=sorted(self._weekday_hash))
+
+    def validate_field(self) -> Optional[FieldParseErrorDetail]:
+        # same as parse_field, without raising FieldParseError
+        self._parse(_STANDARD_KINDS, use_slash=True)
+        return self._error_detail()
+
+    def validate_day_field(
+            self,
+            non_standard: bool = True) -> Optional[FieldParseErrorDetail]:
+        self._parse(
+                _DAY_KINDS if non_standard else _STANDARD_KINDS,
+                use_slash=True)
+        return self._error_detail()
+
+    def validate_weekday_field(
+            self,
+            non_standard: bool = True,
+            use_slash: bool = True) -> Optional[FieldParseErrorDetail]:
+        self._parse(
+                _WEEKDAY_KINDS if non_standard else _STANDARD_KINDS,
+                use_slash=use_slash)
+        return self._error_detail()
+
+    def _parse(self, kinds: FrozenSet[str], use_slash: bool) -> None:
+        pattern = _element_pattern(_word_set_key(self._word_set))
+        for element in self._origin.split(','):
+            match = pattern.fullmatch(element)
+            kind = match.lastgroup if match is not None else None
+            if match is None or kind not in kinds:
+                self._mismatched.append(element)
+            elif kind == 'standard':
+                self._parse_standard(element, match, use_slash)
+            elif kind == 'question':
+                self._parse_question(element)
+            elif kind == 'day_last':
+                self._day_last = True
+            elif kind == 'day_w':
+                self._parse_day_w(element, match)
+            elif kind == 'weekday_last':
+                self._parse_weekday_last(element, match)
             else:
-                self._weekday_hash.append((weekday, week_number))
-        self._weekday_hash = sorted(set(self._weekday_hash))
+                self._parse_weekday_hash(element, match)
+
+    def _parse_standard(
+            self,
+            element: str,
+            match: Match[str],
+            use_slash: bool) -> None:
+        # parameter
+        begin = _read_word(match.group('begin'), self._word_set)
+        end = _read_word(match.group('end'), self._word_set)
+        step = (int(match.group('step'))
+                if match.group('step') is not None else None)
+        # error check
+        kind = 'standard'
+        if begin is not None and not self._min <= begin <= self._max:
+            self._add_error(
+                    kind,
+                    element,
+                    '{0} is out of range({1}...{2})'
+                    .format(begin, self._min, self._max))
+            return
+        if end is not None and not self._min <= end <= self._max:
+            self._add_error(
+                    kind,
+                    element,
+                    '{0} is out of range({1}...{2})'
+                    .format(end, self._min, self._max))
+            return
+        if step is not None and step <= 0:
+            self._add_error(kind, element, 'step must be positive value')
+            return
+        if begin is not None and end is not None and end < begin:
+            self._add_error(
+                    kind,
+                    element,
+                    'invalid range({0}...{1})'.format(begin, end))
+            return
+        if not use_slash and step is not None:
+            self._add_error(kind, element, '"/" is not allowed')
+            return
+        # evaluate
+        evaluated = _evaluate_standard(
+                self._min,
+                self._max,
+                begin,
+                end,
+                step)
+        if evaluated is None:
+            self._is_any = True
+            self._value.update(range(self._min, self._max + 1))
+        else:
+            self._value.update(evaluated)
+
+    def _parse_question(self, element: str) -> None:
+        self._is_blank = True
+        if self._origin != '?':
+            self._add_error(
+                    'question',
+                    element,
+                    'there is a charactor other than "?"')
+
+    def _parse_day_w(self, element: str, match: Match[str]) -> None:
+        w_target = int(match.group('w_target'))
+        if self._min <= w_target <= self._max:
+            self._day_w.add(w_target)
+        else:
+            self._add_error(
+                    'day_w',
+                    element,
+                    '{0} is out of range({1}...{2})'
+                    .format(w_target, self._min, self._max))
+
+    def _parse_weekday_last(self, element: str, match: Match[str]) -> None:
+        weekday = _read_word(match.group('last_weekday'), self._word_set)
+        if weekday is not None and self._min <= weekday <= self._max:
+            self._weekday_last.add(weekday)
+        else:
+            self._add_error(
+                    'weekday_last',
+                    element,
+                    '{0} is out of range({1}...{2})'
+                    .format(weekday, self._min, self._max))
+
+    def _parse_weekday_hash(self, element: str, match: Match[str]) -> None:
+        weekday = _read_word(match.group('hash_weekday'), self._word_set)
+        week_number = int(match.group('week_number'))
+        if weekday is None or not self._min <= weekday <= self._max:
+            self._add_error(
+                    'weekday_hash',
+                    element,
+                    '{0} is out of range({1}...{2})'
+                    .format(weekday, self._min, self._max))
+        elif not 1 <= week_number <= 5:
+            self._add_error(
+                    'weekday_hash',
+                    element,
+                    '{0} is out of range({1}...{2})'
+                    .format(week_number, 1, 5))
+        else:
+            self._weekday_hash.add((weekday, week_number))
 
     def _add_error(
             self,
+            kind: str,
             element: str,
             reason: str) -> None:
-        self._parse_error.append(FieldElementParseError(element, reason))
+        self._parse_error.append((
+                _ELEMENT_KIND_ORDER[kind],
+                FieldElementParseError(element, reason)))
+
+    def _error_detail(self) -> Optional[FieldParseErrorDetail]:
+        if not self._mismatched and not self._parse_error:
+            return None
+        # stable sort: element order within the same kind
+        self._parse_error.sort(key=lambda x: x[0])
+        return FieldParseErrorDetail(
+                field=self._origin,
+                mismatched=self._mismatched,
+                parse_error=[error for _, error in self._parse_error])
 
     def _error_check(self) -> None:
-        if self._element_list or self._parse_error:
+        detail = self._error_detail()
+        if detail is not None:
             raise FieldParseError(
-                    field=self._origin,
-                    mismatched=self._element_list,
-                    parse_error=self._parse_error)
+                    field=detail.field,
+                    mismatched=detail.mismatched,
+                    parse_error=detail.parse_error)
 
 
 def month_word_set() -> Dict[str, int]:
@@ -310,11 +357,30 @@ def _evaluate_standard(
     return result
 
 
-def _word_set_to_regex(word_set: Optional[Dict[str, int]]) -> str:
-    return (r'({0}|[0-9]+)'.format(
+def _word_set_key(word_set: Optional[Dict[str, int]]) -> Tuple[str, ...]:
+    return tuple(word_set.keys()) if word_set else ()
+
+
+def _word_set_to_regex(word_list: Tuple[str, ...]) -> str:
+    return (r'(?:{0}|[0-9]+)'.format(
                 '|'.join(f'{x.lower()}|{x.upper()}|{x.title()}'
-                         for x in word_set.keys()))
-            if word_set else r'[0-9]+')
+                         for x in word_list))
+            if word_list else r'[0-9]+')
+
+
+@functools.lru_cache(maxsize=None)
+def _element_pattern(word_list: Tuple[str, ...]) -> Pattern[str]:
+    # group names of the alternatives are the element kinds
+    return re.compile(
+            r'(?P<standard>(?:\*|(?P<begin>{0})(?:-(?P<end>{0}))?)'
+            r'(?:/(?P<step>[0-9]+))?)'
+            r'|(?P<question>\?)'
+            r'|(?P<day_last>L)'
+            r'|(?P<day_w>(?P<w_target>[0-9]+)W)'
+            r'|(?P<weekday_last>(?P<last_weekday>{0})L)'
+            r'|(?P<weekday_hash>(?P<hash_weekday>{0})'
+            r'#(?P<week_number>[0-9]+))'
+            .format(_word_set_to_regex(word_list)))
 
 
 def _read_word(
@@ -0,0 +1,136 @@
+# -*- coding: utf-8 -*-
+
+import datetime
+from typing import Dict, Iterable, List, Optional, Tuple, Union
+from ._cronexp import Cronexp
+from ._day_field import DayOfMonthField
+from ._dayexp import DaySelectionMode
+from ._month_info import month_length
+from ._weekday_field import DayOfWeekField
+
+
+class CronexpIndex:
+    def __init__(self, expressions: Iterable[Cronexp] = ()) -> None:
+        self._expressions: List[Cronexp] = []
+        # value -> bitmap of expression ids
+        self._minute = [0] * 60
+        self._hour = [0] * 24
+        self._month = [0] * 13
+        self._day_of_month = [0] * 32
+        self._day_of_week = [0] * 7
+        # how day and weekday are combined
+        self._use_day_of_month = 0
+        self._use_day_of_week = 0
+        self._use_either = 0
+        self._use_both = 0
+        # max_year -> bitmap of expression ids
+        self._max_year: Dict[int, int] = {}
+        # L/W/# fields, resolved per month
+        self._extension: List[
+                Tuple[int, Union[DayOfMonthField, DayOfWeekField]]] = []
+        self._extension_cache: Dict[
+                Tuple[int, int],
+                Tuple[List[int], List[int]]] = {}
+        for cronexp in expressions:
+            self.add(cronexp)
+
+    def __len__(self) -> int:
+        return len(self._expressions)
+
+    def __getitem__(self, id_: int) -> Cronexp:
+        return self._expressions[id_]
+
+    def add(self, cronexp: Cronexp) -> int:
+        id_ = len(self._expressions)
+        self._expressions.append(cronexp)
+        bit = 1 << id_
+        timeexp = cronexp._timeexp
+        dayexp = cronexp._dateexp.dayexp
+        _add_posting(self._minute, timeexp.minute.bitmask, bit)
+        _add_posting(self._hour, timeexp.hour.bitmask, bit)
+        _add_posting(self._month, cronexp._dateexp.month.bitmask, bit)
+        _add_posting(
+                self._day_of_month,
+                dayexp.day_of_month.bitmask,
+                bit)
+        _add_posting(self._day_of_week, dayexp.day_of_week.bitmask, bit)
+        day_of_month = dayexp.day_of_month
+        day_of_week = dayexp.day_of_week
+        if dayexp.selection_mode is DaySelectionMode.OR:
+            if not day_of_month.is_any and not day_of_week.is_any:
+                self._use_either |= bit
+            elif day_of_week.is_any:
+                self._use_day_of_month |= bit
+            else:
+                self._use_day_of_week |= bit
+        elif dayexp.selection_mode is DaySelectionMode.AND:
+            self._use_both |= bit
+        elif day_of_week.is_blank:
+            self._use_day_of_month |= bit
+        else:
+            self._use_day_of_week |= bit
+        max_year = cronexp._dateexp.max_year()
+        if max_year is not None:
+            self._max_year[max_year] = self._max_year.get(max_year, 0) | bit
+        for field in (day_of_month, day_of_week):
+            if field.has_extension:
+                self._extension.append((id_, field))
+                self._extension_cache.clear()
+        return id_
+
+    def due_bitmap(self, time: datetime.datetime) -> int:
+        result = (self._minute[time.minute]
+                  & self._hour[time.hour]
+                  & self._month[time.month])
+        for max_year, bitmap in self._max_year.items():
+            if max_year < time.year:
+                result &= ~bitmap
+        if not result:
+            return 0
+        weekday = (time.weekday() + 1) % 7
+        extension = self._month_extension(time.year, time.month)
+        day_of_month = self._day_of_month[time.day] | extension[0][time.day]
+        day_of_week = self._day_of_week[weekday] | extension[1][time.day]
+        return result & (
+                (self._use_day_of_month & day_of_month)
+                | (self._use_day_of_week & day_of_week)
+                | (self._use_either & (day_of_month | day_of_week))
+                | (self._use_both & day_of_month & day_of_week))
+
+    def due(self, time: datetime.datetime) -> List[int]:
+        return _bitmap_to_ids(self.due_bitmap(time))
+
+    def _month_extension(
+            self,
+            year: int,
+            month: int) -> Tuple[List[int], List[int]]:
+        # (day of month, day of week): day -> bitmap of expression ids
+        # selected by L/W/#
+        cache = self._extension_cache.get((year, month))
+        if cache is None:
+            cache = ([0] * 32, [0] * 32)
+            lastday = month_length(year, month)
+            for id_, field in self._extension:
+                posting = cache[0 if isinstance(field, DayOfMonthField)
+                                else 1]
+                day: Optional[int] = field.next(year, month, None)
+                while day is not None and day <= lastday:
+                    posting[day] |= 1 << id_
+                    day = field.next(year, month, day)
+            self._extension_cache = {(year, month): cache}
+        return cache
+
+
+def _add_posting(posting: List[int], bitmask: int, bit: int) -> None:
+    for value in range(len(posting)):
+        if bitmask >> value & 1:
+            posting[value] |= bit
+
+
+def _bitmap_to_ids(bitmap: int) -> List[int]:
+    result: List[int] = []
+    while bitmap:
+        lowest = bitmap & -bitmap
+        result.append(lowest.bit_length() - 1)
+        bitmap ^= lowest
+    return result
@@ -0,0 +1,30 @@
+# -*- coding: utf-8 -*-
+
+import datetime
+import heapq
+from typing import Iterable, Iterator, List, Tuple
+from ._cronexp import Cronexp, CronexpCursor
+
+
+def merge_occurrences(
+        expressions: Iterable[Cronexp],
+        start: datetime.datetime) -> Iterator[Tuple[int, datetime.datetime]]:
+    # yield (expression id, occurrence) in time order
+    # (ties are ordered by expression id)
+    cursor_list: List[CronexpCursor] = []
+    heap: List[Tuple[datetime.datetime, int]] = []
+    for id_, cronexp in enumerate(expressions):
+        cursor = cronexp.iter(start)
+        cursor_list.append(cursor)
+        next_ = cursor.advance()
+        if next_ is not None:
+            heap.append((next_, id_))
+    heapq.heapify(heap)
+    while heap:
+        next_, id_ = heap[0]
+        yield id_, next_
+        following = cursor_list[id_].advance()
+        if following is not None:
+            heapq.heapreplace(heap, (following, id_))
+        else:
+            heapq.heappop(heap)
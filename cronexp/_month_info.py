@@ -0,0 +1,46 @@
+# -*- coding: utf-8 -*-
+
+import calendar
+import datetime
+from typing import Tuple
+from . import _stats
+
+
+# (year - 1) * 12 + (month - 1) -> weekday of the 1st | (days - 28) << 3
+# filled a year at a time, shared by all expressions
+_UNSET = 0xff
+_table = bytearray([_UNSET]) * (datetime.MAXYEAR * 12)
+
+
+def month_info(year: int, month: int) -> Tuple[int, int]:
+    # same as calendar.monthrange:
+    # (weekday of the 1st (0: Monday, ... 6: Sunday), number of days)
+    value = _table[_index(year, month)]
+    if value == _UNSET:
+        value = _fill(year, month)
+    return value & 7, 28 + (value >> 3)
+
+
+def month_length(year: int, month: int) -> int:
+    value = _table[_index(year, month)]
+    if value == _UNSET:
+        value = _fill(year, month)
+    return 28 + (value >> 3)
+
+
+def _index(year: int, month: int) -> int:
+    if not (datetime.MINYEAR <= year <= datetime.MAXYEAR
+            and 1 <= month <= 12):
+        raise ValueError('invalid year({0}) or month({1})'
+                         .format(year, month))
+    return (year - 1) * 12 + month - 1
+
+
+def _fill(year: int, month: int) -> int:
+    stats = _stats.ACTIVE.get()
+    for month_ in range(1, 13):
+        if stats is not None:
+            stats.monthrange += 1
+        weekday, days = calendar.monthrange(year, month_)
+        _table[_index(year, month_)] = weekday | (days - 28) << 3
+    return _table[_index(year, month)]
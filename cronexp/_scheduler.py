@@ -0,0 +1,108 @@
+# -*- coding: utf-8 -*-
+
+import asyncio
+import datetime
+import heapq
+from typing import (
+        Any, Awaitable, Callable, List, NamedTuple, Optional, Set, Tuple)
+from ._cronexp import Cronexp, CronexpCursor
+
+
+class CronexpJob(NamedTuple):
+    cronexp: Cronexp
+    function: Callable[[datetime.datetime], Awaitable[Any]]
+    cursor: CronexpCursor
+
+
+class CronexpScheduler:
+    def __init__(
+            self,
+            max_concurrency: Optional[int] = None,
+            clock: Callable[[], datetime.datetime] = datetime.datetime.now,
+            ) -> None:
+        self._max_concurrency = max_concurrency
+        self._clock = clock
+        self._job_list: List[CronexpJob] = []
+        # (next occurrence, job id)
+        self._heap: List[Tuple[datetime.datetime, int]] = []
+        self._task_set: Set['asyncio.Task[Any]'] = set()
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._wakeup: Optional[asyncio.Event] = None
+        self._is_running = False
+
+    def add(
+            self,
+            cronexp: Cronexp,
+            function: Callable[[datetime.datetime], Awaitable[Any]]) -> int:
+        # function is called with the scheduled time
+        id_ = len(self._job_list)
+        cursor = cronexp.iter(self._clock())
+        self._job_list.append(CronexpJob(
+                cronexp=cronexp,
+                function=function,
+                cursor=cursor))
+        next_ = cursor.peek()
+        if next_ is not None:
+            heapq.heappush(self._heap, (next_, id_))
+            if self._wakeup is not None:
+                self._wakeup.set()
+        return id_
+
+    def stop(self) -> None:
+        self._is_running = False
+        if self._wakeup is not None:
+            self._wakeup.set()
+
+    async def run(self) -> None:
+        self._is_running = True
+        self._wakeup = asyncio.Event()
+        if self._max_concurrency is not None:
+            self._semaphore = asyncio.Semaphore(self._max_concurrency)
+        try:
+            while self._is_running:
+                timeout: Optional[float] = None
+                if self._heap:
+                    timeout = max(
+                            (self._heap[0][0] - self._clock())
+                            .total_seconds(),
+                            0.0)
+                if timeout is None or timeout > 0.0:
+                    self._wakeup.clear()
+                    try:
+                        await asyncio.wait_for(self._wakeup.wait(), timeout)
+                    except asyncio.TimeoutError:
+                        pass
+                    continue
+                self._dispatch(self._clock())
+            if self._task_set:
+                await asyncio.gather(
+                        *self._task_set,
+                        return_exceptions=True)
+        finally:
+            self._wakeup = None
+            self._semaphore = None
+
+    def _dispatch(self, now: datetime.datetime) -> None:
+        # run due jobs and reschedule only them
+        while self._heap and self._heap[0][0] <= now:
+            scheduled, id_ = self._heap[0]
+            job = self._job_list[id_]
+            task = asyncio.ensure_future(self._call(job, scheduled))
+            self._task_set.add(task)
+            task.add_done_callback(self._task_set.discard)
+            # skip occurrences missed while the loop was busy
+            job.cursor.seek(now)
+            next_ = job.cursor.peek()
+            if next_ is not None:
+                heapq.heapreplace(self._heap, (next_, id_))
+            else:
+                heapq.heappop(self._heap)
+
+    async def _call(
+            self,
+            job: CronexpJob,
+            scheduled: datetime.datetime) -> Any:
+        if self._semaphore is None:
+            return await job.function(scheduled)
+        async with self._semaphore:
+            return await job.function(scheduled)
@@ -0,0 +1,178 @@
+# -*- coding: utf-8 -*-
+
+import struct
+from typing import List, Tuple
+from ._cronexp import Cronexp, CronexpOption
+from ._dateexp import Dateexp
+from ._day_field import DayOfMonthField
+from ._dayexp import Dayexp, DaySelectionMode
+from ._field import Field
+from ._field_parser import (
+        DayFieldParseResult, FieldParseResult, WeekdayFieldParseResult)
+from ._timeexp import Timeexp
+from ._weekday_field import DayOfWeekField, SundayMode
+
+
+# layout (little endian)
+#   magic, version
+#   option flags, max_year
+#   field flags
+#   bitmask: minute, hour, month, day of month, day of week
+#   day of month W, day of week L, day of week #: count + values
+_MAGIC = b'CX'
+_VERSION = 1
+_HEADER = struct.Struct('<2sBBiBQIHIB')
+_SELECTION_MODE = (
+        DaySelectionMode.OR,
+        DaySelectionMode.AND,
+        DaySelectionMode.EITHER)
+# option flags
+_USE_WORD_SET = 1 << 0
+_SUNDAY_IS_7 = 1 << 1
+_HAS_MAX_YEAR = 1 << 2
+_SELECTION_MODE_SHIFT = 3
+# field flags
+_MINUTE_IS_ANY = 1 << 0
+_HOUR_IS_ANY = 1 << 1
+_MONTH_IS_ANY = 1 << 2
+_DAY_IS_ANY = 1 << 3
+_DAY_IS_BLANK = 1 << 4
+_DAY_LAST = 1 << 5
+_WEEKDAY_IS_ANY = 1 << 6
+_WEEKDAY_IS_BLANK = 1 << 7
+
+
+def dump(cronexp: Cronexp) -> bytes:
+    option = cronexp.option
+    timeexp = cronexp._timeexp
+    dateexp = cronexp._dateexp
+    day_of_month = dateexp.dayexp.day_of_month
+    day_of_week = dateexp.dayexp.day_of_week
+    option_flags = (
+            (_USE_WORD_SET if option.use_word_set else 0)
+            | (_SUNDAY_IS_7
+               if option.sunday_mode is SundayMode.SUNDAY_IS_7 else 0)
+            | (_HAS_MAX_YEAR if option.max_year is not None else 0)
+            | (_SELECTION_MODE.index(option.day_selection_mode)
+               << _SELECTION_MODE_SHIFT))
+    field_flags = (
+            (_MINUTE_IS_ANY if timeexp.minute.is_any else 0)
+            | (_HOUR_IS_ANY if timeexp.hour.is_any else 0)
+            | (_MONTH_IS_ANY if dateexp.month.is_any else 0)
+            | (_DAY_IS_ANY if day_of_month.is_any else 0)
+            | (_DAY_IS_BLANK if day_of_month.is_blank else 0)
+            | (_DAY_LAST if day_of_month.last else 0)
+            | (_WEEKDAY_IS_ANY if day_of_week.is_any else 0)
+            | (_WEEKDAY_IS_BLANK if day_of_week.is_blank else 0))
+    data = bytearray(_HEADER.pack(
+            _MAGIC,
+            _VERSION,
+            option_flags,
+            option.max_year if option.max_year is not None else 0,
+            field_flags,
+            timeexp.minute.bitmask,
+            timeexp.hour.bitmask,
+            dateexp.month.bitmask,
+            day_of_month.bitmask,
+            day_of_week.bitmask))
+    data.append(len(day_of_month.w))
+    data.extend(day_of_month.w)
+    data.append(len(day_of_week.last))
+    data.extend(day_of_week.last)
+    data.append(len(day_of_week.hash))
+    for weekday, week_number in day_of_week.hash:
+        data.extend((weekday, week_number))
+    return bytes(data)
+
+
+def load(data: bytes) -> Cronexp:
+    try:
+        (magic,
+         version,
+         option_flags,
+         max_year,
+         field_flags,
+         minute,
+         hour,
+         month,
+         day,
+         weekday) = _HEADER.unpack_from(data)
+        if magic != _MAGIC or version != _VERSION:
+            raise ValueError('unsupported format')
+        offset = _HEADER.size
+        day_w, offset = _read_list(data, offset, 1)
+        weekday_last, offset = _read_list(data, offset, 1)
+        weekday_hash, offset = _read_list(data, offset, 2)
+        if offset != len(data):
+            raise ValueError('trailing data')
+        selection_mode = _SELECTION_MODE[
+                option_flags >> _SELECTION_MODE_SHIFT]
+    except (IndexError, struct.error, ValueError) as error:
+        raise ValueError(
+                'failed to decode Cronexp: {0}'.format(error)) from None
+    option = CronexpOption(
+            max_year=(max_year
+                      if option_flags & _HAS_MAX_YEAR else None),
+            use_word_set=bool(option_flags & _USE_WORD_SET),
+            day_selection_mode=selection_mode,
+            sunday_mode=(SundayMode.SUNDAY_IS_7
+                         if option_flags & _SUNDAY_IS_7
+                         else SundayMode.SUNDAY_IS_0))
+    non_standard = selection_mode is DaySelectionMode.EITHER
+    timeexp = Timeexp.from_fields(
+            minute=_field(minute, 59, bool(field_flags & _MINUTE_IS_ANY)),
+            hour=_field(hour, 23, bool(field_flags & _HOUR_IS_ANY)))
+    day_of_month = DayOfMonthField.from_parse_result(
+            DayFieldParseResult(
+                    source='',
+                    is_any=bool(field_flags & _DAY_IS_ANY),
+                    is_blank=bool(field_flags & _DAY_IS_BLANK),
+                    value=_bitmask_to_list(day, 31),
+                    last=bool(field_flags & _DAY_LAST),
+                    w=[w for w, in day_w]),
+            non_standard=non_standard)
+    day_of_week = DayOfWeekField.from_parse_result(
+            WeekdayFieldParseResult(
+                    source='',
+                    is_any=bool(field_flags & _WEEKDAY_IS_ANY),
+                    is_blank=bool(field_flags & _WEEKDAY_IS_BLANK),
+                    value=_bitmask_to_list(weekday, 6),
+                    last=[last for last, in weekday_last],
+                    hash=[(weekday_, week_number)
+                          for weekday_, week_number in weekday_hash]),
+            non_standard=non_standard)
+    dateexp = Dateexp.from_fields(
+            dayexp=Dayexp.from_fields(
+                    day_of_month=day_of_month,
+                    day_of_week=day_of_week,
+                    selection_mode=selection_mode),
+            month=_field(month, 12, bool(field_flags & _MONTH_IS_ANY)),
+            max_year=option.max_year)
+    return Cronexp.from_exp(timeexp, dateexp, option=option)
+
+
+def _read_list(
+        data: bytes,
+        offset: int,
+        size: int) -> Tuple[List[Tuple[int, ...]], int]:
+    length = data[offset]
+    offset += 1
+    result = [tuple(data[offset + i * size:offset + (i + 1) * size])
+              for i in range(length)]
+    offset += length * size
+    if offset > len(data):
+        raise ValueError('truncated data')
+    return result, offset
+
+
+def _bitmask_to_list(bitmask: int, max_: int) -> List[int]:
+    return [i for i in range(max_ + 1) if bitmask >> i & 1]
+
+
+def _field(bitmask: int, max_: int, is_any: bool) -> Field:
+    return Field.from_parse_result(
+            FieldParseResult(
+                    source='',
+                    is_any=is_any,
+                    value=_bitmask_to_list(bitmask, max_)),
+            max_)
@@ -0,0 +1,80 @@
+# -*- coding: utf-8 -*-
+
+import contextlib
+import contextvars
+from typing import Any, Callable, Iterator, NamedTuple, Optional
+
+
+class SearchCounter(NamedTuple):
+    # traced calls (Cronexp.next, prev, nth, count)
+    call: int = 0
+    # Dateexp.next / prev
+    month: int = 0
+    year: int = 0
+    # Timeexp.next / prev table lookups
+    timeexp: int = 0
+    # (year, month) day sets resolved by Dayexp
+    day_mask: int = 0
+    # calendar helpers
+    # (monthrange: only when the shared month table is filled)
+    monthrange: int = 0
+    day_of_month_w: int = 0
+    day_of_week_l: int = 0
+    day_of_week_hash: int = 0
+
+
+# tracer(method name, counter of the call)
+SearchTracer = Callable[[str, SearchCounter], None]
+
+
+class SearchStats:
+    def __init__(self, tracer: Optional[SearchTracer] = None) -> None:
+        self.tracer = tracer
+        self.call = 0
+        self.month = 0
+        self.year = 0
+        self.timeexp = 0
+        self.day_mask = 0
+        self.monthrange = 0
+        self.day_of_month_w = 0
+        self.day_of_week_l = 0
+        self.day_of_week_hash = 0
+
+    def counter(self) -> SearchCounter:
+        # cumulative
+        return SearchCounter(*(getattr(self, name)
+                               for name in SearchCounter._fields))
+
+    def trace(
+            self,
+            name: str,
+            function: Callable[..., Any],
+            *args: Any) -> Any:
+        before = self.counter()
+        result = function(*args)
+        self.call += 1
+        if self.tracer is not None:
+            self.tracer(
+                    name,
+                    SearchCounter(*(x - y for x, y in zip(
+                            self.counter(),
+                            before))))
+        return result
+
+
+# the collector in effect for this thread / task (None: disabled)
+ACTIVE: 'contextvars.ContextVar[Optional[SearchStats]]' = (
+        contextvars.ContextVar('cronexp_search_stats', default=None))
+
+
+@contextlib.contextmanager
+def search_stats(
+        tracer: Optional[SearchTracer] = None) -> Iterator[SearchStats]:
+    # count the search steps in this block (current thread / task)
+    # nested blocks: only the innermost one counts
+    stats = SearchStats(tracer)
+    token = ACTIVE.set(stats)
+    try:
+        yield stats
+    finally:
+        ACTIVE.reset(token)
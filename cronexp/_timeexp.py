@@ -1,39 +1,131 @@
 # -*- coding: utf-8 -*-
 
-from typing import NamedTuple
+import array
+import weakref
+from typing import Hashable, List, NamedTuple, Sequence
+from . import _stats
 from ._field import Field
 
 
+MINUTES_PER_DAY = 24 * 60
+
+
 class TimeexpNext(NamedTuple):
     minute: int
     hour: int
     move_up: bool
 
 
+class TimeexpPrev(NamedTuple):
+    minute: int
+    hour: int
+    move_down: bool
+
+
+# (minute, hour) -> shared instance
+_interned: 'weakref.WeakValueDictionary[Hashable, Timeexp]' = (
+        weakref.WeakValueDictionary())
+
+
 class Timeexp:
+    __slots__ = (
+            '_minute', '_hour', '_selected', '_next', '_prev',
+            '_minute_list', '__weakref__')
+
     def __init__(self, minute: str, hour: str) -> None:
-        self._minute = Field(minute, 0, 59)
-        self._hour = Field(hour, 0, 23)
+        self._setup(Field(minute, 0, 59), Field(hour, 0, 23))
+
+    @classmethod
+    def parse(cls, minute: str, hour: str) -> 'Timeexp':
+        # shared instance
+        return cls.from_fields(
+                Field.parse(minute, 0, 59),
+                Field.parse(hour, 0, 23))
+
+    @classmethod
+    def from_fields(cls, minute: Field, hour: Field) -> 'Timeexp':
+        # shared instance
+        key = (minute, hour)
+        timeexp = _interned.get(key)
+        if timeexp is None:
+            timeexp = cls.__new__(cls)
+            timeexp._setup(minute, hour)
+            _interned[key] = timeexp
+        return timeexp
+
+    def _setup(self, minute: Field, hour: Field) -> None:
+        self._minute = minute
+        self._hour = hour
+        # minute of day -> selected
+        self._selected = bytes(
+                self._hour.is_selected(i // 60)
+                and self._minute.is_selected(i % 60)
+                for i in range(MINUTES_PER_DAY))
+        # minute of day -> next selected minute of day (>= i)
+        # values >= MINUTES_PER_DAY carry over to the next day
+        first = self._selected.index(1)
+        next_: List[int] = [first + MINUTES_PER_DAY] * (MINUTES_PER_DAY + 1)
+        for i in range(MINUTES_PER_DAY - 1, -1, -1):
+            next_[i] = i if self._selected[i] else next_[i + 1]
+        self._next = array.array('H', next_)
+        # minute of day -> previous selected minute of day (<= i)
+        # negative values borrow from the previous day
+        last = MINUTES_PER_DAY - 1 - self._selected[::-1].index(1)
+        prev: List[int] = [last - MINUTES_PER_DAY] * MINUTES_PER_DAY
+        for i in range(0, MINUTES_PER_DAY):
+            if self._selected[i]:
+                prev[i] = i
+            elif i:
+                prev[i] = prev[i - 1]
+        self._prev = array.array('h', prev)
+        self._minute_list = tuple(
+                i for i in range(MINUTES_PER_DAY) if self._selected[i])
+
+    @property
+    def minute(self) -> Field:
+        return self._minute
+
+    @property
+    def hour(self) -> Field:
+        return self._hour
+
+    def canonical_key(self) -> Hashable:
+        return (self._minute.canonical_key(), self._hour.canonical_key())
 
     def next(self, hour: int, minute: int) -> TimeexpNext:
-        def impl(hour_: int, minute_: int, move_up_: bool) -> TimeexpNext:
-            if not self._hour.is_selected(hour_):
-                next_hour = self._hour.next(hour)
-                return TimeexpNext(
-                        hour=next_hour.value,
-                        minute=self._minute.min(),
-                        move_up=move_up_ or next_hour.move_up)
-            next_minute = self._minute.next(minute_)
-            if next_minute.move_up:
-                hour_ += 1
-            if self._hour.is_selected(hour_):
-                return TimeexpNext(
-                        hour=hour_,
-                        minute=next_minute.value,
-                        move_up=move_up_)
-            return impl(hour_, next_minute.value, move_up_)
-        return impl(hour, minute, False)
+        stats = _stats.ACTIVE.get()
+        if stats is not None:
+            stats.timeexp += 1
+        index = min(max(hour * 60 + minute + 1, 0), MINUTES_PER_DAY)
+        next_hour, next_minute = divmod(self._next[index], 60)
+        return TimeexpNext(
+                hour=next_hour % 24,
+                minute=next_minute,
+                move_up=next_hour >= 24)
+
+    def prev(self, hour: int, minute: int) -> TimeexpPrev:
+        stats = _stats.ACTIVE.get()
+        if stats is not None:
+            stats.timeexp += 1
+        index = min(hour * 60 + minute - 1, MINUTES_PER_DAY - 1)
+        prev_ = (self._prev[index] if index >= 0
+                 else self._prev[-1] - MINUTES_PER_DAY)
+        prev_hour, prev_minute = divmod(prev_, 60)
+        return TimeexpPrev(
+                hour=prev_hour % 24,
+                minute=prev_minute,
+                move_down=prev_hour < 0)
 
     def is_selected(self, hour: int, minute: int) -> bool:
-        return (self._hour.is_selected(hour)
-                and self._minute.is_selected(minute))
+        return (0 <= minute < 60
+                and 0 <= hour < 24
+                and bool(self._selected[hour * 60 + minute]))
+
+    def minute_list(self) -> Sequence[int]:
+        return self._minute_list
+
+    def selected_table(self) -> bytes:
+        return self._selected
+
+    def next_table(self) -> Sequence[int]:
+        return self._next
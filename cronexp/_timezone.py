@@ -0,0 +1,243 @@
+# -*- coding: utf-8 -*-
+
+import bisect
+import datetime
+import enum
+import functools
+import heapq
+import itertools
+from typing import Iterator, List, NamedTuple, Optional, Tuple
+from ._cronexp import Cronexp
+from ._dateexp import GREGORIAN_CYCLE_YEARS
+
+
+class NonexistentTimePolicy(enum.Enum):
+    # local time skipped by a forward transition (e.g. 02:30 at DST start)
+    SKIP = enum.auto()
+    # fire at the end of the gap
+    SHIFT = enum.auto()
+
+
+class AmbiguousTimePolicy(enum.Enum):
+    # local time repeated by a backward transition (e.g. 01:30 at DST end)
+    FIRST = enum.auto()
+    LAST = enum.auto()
+    BOTH = enum.auto()
+
+
+class ZoneTransition(NamedTuple):
+    # naive UTC
+    utc: datetime.datetime
+    before: datetime.timedelta
+    after: datetime.timedelta
+
+
+class ZoneTransitionTable(NamedTuple):
+    initial: datetime.timedelta
+    transition: List[ZoneTransition]
+    utc_list: List[datetime.datetime]
+    offset_list: List[datetime.timedelta]
+    max_offset: datetime.timedelta
+    # the longest repeated period
+    max_fold: datetime.timedelta
+
+
+# the sampling interval must be shorter than the interval of transitions
+_SAMPLING_INTERVAL = datetime.timedelta(hours=6)
+_SECOND = datetime.timedelta(seconds=1)
+
+
+def _utcoffset(
+        zone: datetime.tzinfo,
+        utc: datetime.datetime) -> datetime.timedelta:
+    offset = zone.fromutc(utc.replace(tzinfo=zone)).utcoffset()
+    if offset is None:
+        raise ValueError('{0!r} has no utcoffset'.format(zone))
+    return offset
+
+
+@functools.lru_cache(maxsize=4096)
+def zone_transition_table(
+        zone: datetime.tzinfo,
+        year: int) -> ZoneTransitionTable:
+    # transitions of the local year (with 2 days margin on each side)
+    begin = (datetime.datetime(year - 1, 12, 30)
+             if year > datetime.MINYEAR
+             else datetime.datetime(year, 1, 2))
+    end = (datetime.datetime(year + 1, 1, 3)
+           if year < datetime.MAXYEAR
+           else datetime.datetime(year, 12, 30))
+    initial = _utcoffset(zone, begin)
+    transition: List[ZoneTransition] = []
+    time, offset = begin, initial
+    while time < end:
+        sample = min(time + _SAMPLING_INTERVAL, end)
+        if _utcoffset(zone, sample) == offset:
+            time = sample
+            continue
+        # binary search for the first second with a new offset
+        lower, upper = time, sample
+        while upper - lower > _SECOND:
+            middle = lower + (upper - lower) // _SECOND // 2 * _SECOND
+            if _utcoffset(zone, middle) == offset:
+                lower = middle
+            else:
+                upper = middle
+        after = _utcoffset(zone, upper)
+        transition.append(
+                ZoneTransition(utc=upper, before=offset, after=after))
+        time, offset = upper, after
+    offset_list = sorted({initial, *(x.after for x in transition)})
+    return ZoneTransitionTable(
+            initial=initial,
+            transition=transition,
+            utc_list=[x.utc for x in transition],
+            offset_list=offset_list,
+            max_offset=offset_list[-1],
+            # 0 when the year has only forward transitions
+            max_fold=max([x.before - x.after for x in transition]
+                         + [datetime.timedelta(0)]))
+
+
+def _offset_at(
+        table: ZoneTransitionTable,
+        utc: datetime.datetime) -> datetime.timedelta:
+    index = bisect.bisect_right(table.utc_list, utc)
+    return table.transition[index - 1].after if index else table.initial
+
+
+def _resolve(
+        table: ZoneTransitionTable,
+        local: datetime.datetime,
+        ) -> Tuple[List[Tuple[datetime.datetime, datetime.timedelta]],
+                   Optional[ZoneTransition]]:
+    # local time -> ([(naive UTC, offset)...], gap transition)
+    # 1 instant: normal, 2 instants: ambiguous, 0 instant: nonexistent
+    result = sorted(
+            (local - offset, offset)
+            for offset in table.offset_list
+            if _offset_at(table, local - offset) == offset)
+    if result:
+        return result, None
+    gap = next((x for x in table.transition
+                if x.utc + x.before <= local < x.utc + x.after),
+               None)
+    return result, gap
+
+
+class ZonedCronexp:
+    def __init__(
+            self,
+            cronexp: Cronexp,
+            zone: datetime.tzinfo,
+            nonexistent: NonexistentTimePolicy = NonexistentTimePolicy.SHIFT,
+            ambiguous: AmbiguousTimePolicy = AmbiguousTimePolicy.FIRST,
+            ) -> None:
+        # the expression is evaluated in the local time of zone
+        self._cronexp = cronexp
+        self._zone = zone
+        self._nonexistent = nonexistent
+        self._ambiguous = ambiguous
+
+    @property
+    def cronexp(self) -> Cronexp:
+        return self._cronexp
+
+    @property
+    def zone(self) -> datetime.tzinfo:
+        return self._zone
+
+    @property
+    def nonexistent(self) -> NonexistentTimePolicy:
+        return self._nonexistent
+
+    @property
+    def ambiguous(self) -> AmbiguousTimePolicy:
+        return self._ambiguous
+
+    def next(
+            self,
+            start: datetime.datetime,
+            until: Optional[datetime.datetime] = None,
+            ) -> Optional[datetime.datetime]:
+        return next(self.iter(start, until=until), None)
+
+    def next_list(
+            self,
+            start: datetime.datetime,
+            length: int,
+            until: Optional[datetime.datetime] = None,
+            ) -> List[datetime.datetime]:
+        return list(itertools.islice(self.iter(start, until=until), length))
+
+    def iter(
+            self,
+            start: datetime.datetime,
+            until: Optional[datetime.datetime] = None,
+            ) -> Iterator[datetime.datetime]:
+        # start, until: aware datetime (until is exclusive)
+        # yields aware datetime in zone, strictly increasing
+        last = _to_utc(start)
+        until_utc = _to_utc(until) if until is not None else None
+        local = start.astimezone(self._zone).replace(tzinfo=None)
+        table = zone_transition_table(self._zone, local.year)
+        year = local.year
+        # local times before start may be repeated after start
+        candidate = self._cronexp.iter(
+                local - table.max_fold - datetime.timedelta(minutes=1))
+        # (naive UTC, local, fold)
+        pending: List[Tuple[datetime.datetime, datetime.datetime, int]] = []
+        for wall in candidate:
+            if wall.year != year:
+                year = wall.year
+                table = zone_transition_table(self._zone, year)
+            if local.year + GREGORIAN_CYCLE_YEARS < year:
+                break
+            for instant in self._instant_list(table, wall):
+                if last < instant[0]:
+                    heapq.heappush(pending, instant)
+            # later local times are not earlier than bound in UTC
+            bound = wall - table.max_offset
+            if until_utc is not None and until_utc <= bound:
+                break
+            while pending and pending[0][0] <= bound:
+                utc, next_local, fold = heapq.heappop(pending)
+                if utc <= last:
+                    continue
+                if until_utc is not None and until_utc <= utc:
+                    return
+                last = utc
+                yield next_local.replace(tzinfo=self._zone, fold=fold)
+        while pending:
+            utc, next_local, fold = heapq.heappop(pending)
+            if utc <= last:
+                continue
+            if until_utc is not None and until_utc <= utc:
+                return
+            last = utc
+            yield next_local.replace(tzinfo=self._zone, fold=fold)
+
+    def _instant_list(
+            self,
+            table: ZoneTransitionTable,
+            local: datetime.datetime,
+            ) -> List[Tuple[datetime.datetime, datetime.datetime, int]]:
+        instant_list, gap = _resolve(table, local)
+        if gap is not None:
+            if self._nonexistent is NonexistentTimePolicy.SKIP:
+                return []
+            return [(gap.utc, gap.utc + gap.after, 0)]
+        result = [(utc, local, min(fold, 1))
+                  for fold, (utc, _) in enumerate(instant_list)]
+        if len(result) > 1:
+            if self._ambiguous is AmbiguousTimePolicy.FIRST:
+                return result[:1]
+            if self._ambiguous is AmbiguousTimePolicy.LAST:
+                return result[-1:]
+        return result
+
+
+def _to_utc(time: datetime.datetime) -> datetime.datetime:
+    if time.tzinfo is None or time.utcoffset() is None:
+        raise ValueError('datetime({0}) must be aware'.format(time))
+    return time.astimezone(datetime.timezone.utc).replace(tzinfo=None)
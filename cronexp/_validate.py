@@ -0,0 +1,77 @@
+# -*- coding: utf-8 -*-
+
+from typing import Any, Dict, NamedTuple, Optional, Union
+from ._cronexp import CronexpOption
+from ._dayexp import EITHER_BLANK_MESSAGE, DaySelectionMode
+from ._field_parser import FieldParser, FieldParseErrorDetail, month_word_set
+from ._weekday_field import weekday_field_parser
+
+
+class FieldCountErrorDetail(NamedTuple):
+    expression: str
+    count: int
+
+
+class DayexpParseErrorDetail(NamedTuple):
+    day: str
+    weekday: str
+    message: str
+
+
+ValidationError = Union[
+        FieldCountErrorDetail,
+        FieldParseErrorDetail,
+        DayexpParseErrorDetail]
+
+
+def validate_expression(
+        expression: str,
+        option: CronexpOption = CronexpOption()) -> Optional[ValidationError]:
+    # the first error which Cronexp(expression, option) would raise,
+    # without raising an exception
+    field_list = expression.split()
+    if len(field_list) != 5:
+        return FieldCountErrorDetail(
+                expression=expression,
+                count=len(field_list))
+    minute, hour, day, month, weekday = field_list
+    non_standard = option.day_selection_mode is DaySelectionMode.EITHER
+    error = (FieldParser(minute, 0, 59).validate_field()
+             or FieldParser(hour, 0, 23).validate_field()
+             or FieldParser(day, 1, 31).validate_day_field(
+                    non_standard=non_standard)
+             or weekday_field_parser(
+                    weekday,
+                    option.use_word_set,
+                    option.sunday_mode).validate_weekday_field(
+                            non_standard=non_standard))
+    if error is not None:
+        return error
+    # a valid field is blank only if it is "?"
+    if non_standard and (day == '?') == (weekday == '?'):
+        return DayexpParseErrorDetail(
+                day=day,
+                weekday=weekday,
+                message=EITHER_BLANK_MESSAGE)
+    return FieldParser(
+            month, 1, 12,
+            word_set=month_word_set() if option.use_word_set else None,
+            ).validate_field()
+
+
+def validation_error_to_dict(error: ValidationError) -> Dict[str, Any]:
+    if isinstance(error, FieldCountErrorDetail):
+        return {'type': 'FieldCountError',
+                'expression': error.expression,
+                'count': error.count}
+    if isinstance(error, FieldParseErrorDetail):
+        return {'type': 'FieldParseError',
+                'field': error.field,
+                'mismatched': error.mismatched,
+                'parse_error': [{'expression': x.expression,
+                                 'reason': x.reason}
+                                for x in error.parse_error]}
+    return {'type': 'DayexpParseError',
+            'day': error.day,
+            'weekday': error.weekday,
+            'message': error.message}
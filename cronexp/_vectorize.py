@@ -0,0 +1,118 @@
+# -*- coding: utf-8 -*-
+
+import datetime
+from typing import TYPE_CHECKING, List
+import numpy
+from ._timeexp import MINUTES_PER_DAY
+if TYPE_CHECKING:
+    from ._cronexp import Cronexp
+
+
+# the Gregorian calendar repeats every 400 years
+_CALENDAR_CYCLE_MONTHS = 400 * 12
+
+
+def to_minute_array(timestamps: numpy.ndarray) -> numpy.ndarray:
+    array = numpy.asarray(timestamps)
+    if numpy.issubdtype(array.dtype, numpy.integer):
+        # epoch seconds
+        array = array.astype('datetime64[s]')
+    return array.astype('datetime64[m]')
+
+
+def selected_days(
+        cronexp: 'Cronexp',
+        first: numpy.datetime64,
+        last: numpy.datetime64,
+        include_next: bool = True) -> numpy.ndarray:
+    # selected days from the month of first to the month of last
+    # (include_next: up to the first selected day after last)
+    dateexp = cronexp._dateexp
+    if not dateexp.is_satisfiable:
+        return numpy.array([], dtype='datetime64[D]')
+    max_year = min(
+            dateexp.max_year()
+            if dateexp.max_year() is not None else datetime.MAXYEAR,
+            datetime.MAXYEAR)
+    first_date = first.astype(datetime.date)
+    last_date = last.astype(datetime.date)
+    year, month = first_date.year, first_date.month
+    day_list: List[datetime.date] = []
+    months_after_last = 0
+    while year <= max_year and months_after_last <= _CALENDAR_CYCLE_MONTHS:
+        day_list.extend(
+                datetime.date(year, month, day)
+                for day in dateexp.day_list(year, month))
+        if (year, month) >= (last_date.year, last_date.month):
+            months_after_last += 1
+            if not include_next or (day_list and last_date < day_list[-1]):
+                break
+        year, month = (year, month + 1) if month < 12 else (year + 1, 1)
+    return numpy.array(day_list, dtype='datetime64[D]')
+
+
+def next_array(
+        cronexp: 'Cronexp',
+        timestamps: numpy.ndarray) -> numpy.ndarray:
+    start = to_minute_array(timestamps)
+    result = numpy.full(start.shape, numpy.datetime64('NaT'), start.dtype)
+    valid = ~numpy.isnat(start)
+    if not valid.any():
+        return result
+    start = start[valid]
+    day = start.astype('datetime64[D]')
+    minute_of_day = (start - day).astype(numpy.int64)
+    # time of day
+    next_table = numpy.asarray(
+            cronexp._timeexp.next_table(),
+            dtype=numpy.int64)
+    next_minute = next_table[minute_of_day + 1]
+    first_minute = numpy.timedelta64(int(next_table[0]), 'm')
+    # date
+    days = selected_days(cronexp, day.min(), day.max())
+    index = numpy.searchsorted(days, day, side='left')
+    is_selected_day = numpy.zeros(day.shape, dtype=bool)
+    in_range = index < len(days)
+    is_selected_day[in_range] = days[index[in_range]] == day[in_range]
+    next_index = numpy.searchsorted(days, day, side='right')
+    found = next_index < len(days)
+    # combine
+    same_day = is_selected_day & (next_minute < MINUTES_PER_DAY)
+    next_ = numpy.full(start.shape, numpy.datetime64('NaT'), start.dtype)
+    next_[same_day] = (
+            day[same_day]
+            + next_minute[same_day].astype('timedelta64[m]'))
+    other_day = ~same_day & found
+    next_[other_day] = days[next_index[other_day]] + first_minute
+    result[valid] = next_
+    return result
+
+
+def match_mask(
+        cronexp: 'Cronexp',
+        timestamps: numpy.ndarray) -> numpy.ndarray:
+    start = to_minute_array(timestamps)
+    result = numpy.zeros(start.shape, dtype=bool)
+    valid = ~numpy.isnat(start)
+    if not valid.any():
+        return result
+    start = start[valid]
+    day = start.astype('datetime64[D]')
+    minute_of_day = (start - day).astype(numpy.int64)
+    # time of day
+    selected_table = numpy.frombuffer(
+            cronexp._timeexp.selected_table(),
+            dtype=numpy.uint8).astype(bool)
+    is_selected_time = selected_table[minute_of_day]
+    # date
+    days = selected_days(
+            cronexp,
+            day.min(),
+            day.max(),
+            include_next=False)
+    index = numpy.searchsorted(days, day, side='left')
+    is_selected_day = numpy.zeros(day.shape, dtype=bool)
+    in_range = index < len(days)
+    is_selected_day[in_range] = days[index[in_range]] == day[in_range]
+    result[valid] = is_selected_time & is_selected_day
+    return result
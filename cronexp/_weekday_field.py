@@ -1,9 +1,17 @@
 # -*- coding: utf-8 -*-
 
-import calendar
 import enum
-from typing import List, Optional
-from ._field_parser import FieldParser, weekday_word_set
+import weakref
+from typing import Hashable, List, Optional, Tuple
+from . import _stats
+from ._field import field_table
+from ._field_parser import (
+        FieldParser, WeekdayFieldParseResult, weekday_word_set)
+from ._month_info import month_info
+
+
+# 5 weeks: days 1...35
+_WEEK_REPEAT = sum(1 << (7 * i) for i in range(5))
 
 
 class SundayMode(enum.Enum):
@@ -11,33 +19,78 @@ class SundayMode(enum.Enum):
     SUNDAY_IS_7 = enum.auto()
 
 
+# identical fields share one instance
+_interned: 'weakref.WeakValueDictionary[Hashable, DayOfWeekField]' = (
+        weakref.WeakValueDictionary())
+
+
 class DayOfWeekField:
+    __slots__ = (
+            '_non_standard', '_is_any', '_is_blank', '_l', '_hash', '_table',
+            '__weakref__')
+
     def __init__(
             self,
             field: str,
             non_standard: bool,
             use_word_set: bool = True,
             sunday_mode: SundayMode = SundayMode.SUNDAY_IS_0) -> None:
+        self._setup(
+                _parse_weekday_field(
+                        field,
+                        non_standard,
+                        use_word_set,
+                        sunday_mode),
+                non_standard)
+
+    @classmethod
+    def parse(
+            cls,
+            field: str,
+            non_standard: bool,
+            use_word_set: bool = True,
+            sunday_mode: SundayMode = SundayMode.SUNDAY_IS_0,
+            ) -> 'DayOfWeekField':
+        # shared instance
+        return cls.from_parse_result(
+                _parse_weekday_field(
+                        field,
+                        non_standard,
+                        use_word_set,
+                        sunday_mode),
+                non_standard)
+
+    @classmethod
+    def from_parse_result(
+            cls,
+            result: WeekdayFieldParseResult,
+            non_standard: bool) -> 'DayOfWeekField':
+        # result.value: 0 (Sunday) ... 6 (Saturday)
+        # shared instance
+        key = (cls,
+               non_standard,
+               result.is_any,
+               result.is_blank,
+               tuple(result.value),
+               tuple(result.last),
+               tuple(result.hash))
+        field = _interned.get(key)
+        if field is None:
+            field = cls.__new__(cls)
+            field._setup(result, non_standard)
+            _interned[key] = field
+        return field
+
+    def _setup(
+            self,
+            result: WeekdayFieldParseResult,
+            non_standard: bool) -> None:
         self._non_standard = non_standard
-        min_ = 0 if sunday_mode is SundayMode.SUNDAY_IS_0 else 1
-        max_ = 6 if sunday_mode is SundayMode.SUNDAY_IS_0 else 7
-        word_set = weekday_word_set() if use_word_set else None
-        if word_set is not None and sunday_mode is SundayMode.SUNDAY_IS_7:
-            word_set['sun'] = 7
-        parser = FieldParser(field, min_, max_, word_set=word_set)
-        result = parser.parse_weekday_field(
-                non_standard=non_standard,
-                use_slash=True)
         self._is_any = result.is_any
         self._is_blank = result.is_blank
-        self._value = result.value
-        if sunday_mode is SundayMode.SUNDAY_IS_7:
-            if 7 in self._value:
-                self._value.remove(7)
-                self._value.append(0)
-                self._value.sort()
-        self._l = result.last
-        self._hash = result.hash
+        self._l = tuple(result.last)
+        self._hash = tuple(result.hash)
+        self._table = field_table(result.value, 6)
 
     @property
     def is_any(self) -> bool:
@@ -47,14 +100,68 @@ class DayOfWeekField:
     def is_blank(self) -> bool:
         return self._is_blank
 
+    @property
+    def non_standard(self) -> bool:
+        return self._non_standard
+
+    @property
+    def bitmask(self) -> int:
+        return self._table.bitmask
+
+    @property
+    def last(self) -> Tuple[int, ...]:
+        return self._l
+
+    @property
+    def hash(self) -> Tuple[Tuple[int, int], ...]:
+        return self._hash
+
+    @property
+    def has_extension(self) -> bool:
+        return self._non_standard and bool(self._l or self._hash)
+
+    def canonical_key(self) -> Hashable:
+        # Sunday may be 7 in L and #
+        return (self._is_any,
+                self._is_blank,
+                self._table.bitmask,
+                tuple(sorted(set(l % 7 for l in self._l))),
+                tuple(sorted(set((weekday % 7, week_number)
+                                 for weekday, week_number in self._hash))))
+
+    def is_satisfiable(self) -> bool:
+        # every weekday falls on every day of month in some year,
+        # and every month has at least 29 days in some year (#5)
+        if self._non_standard:
+            if self._is_blank:
+                return False
+            if self._l or self._hash:
+                return True
+        return bool(self._table.bitmask)
+
+    def day_mask(self, year: int, month: int) -> int:
+        # bit i: day i is selected (1 <= i <= 31)
+        if self._non_standard and self._is_blank:
+            return 0
+        init_weekday, lastday = month_info(year, month)
+        result = weekday_day_mask(self._table.bitmask, init_weekday, lastday)
+        if self._non_standard:
+            for weekday in self._l:
+                result |= 1 << day_of_week_l(weekday, year, month)
+            for weekday, week_number in self._hash:
+                day = day_of_week_hash(weekday, week_number, year, month)
+                if day is not None:
+                    result |= 1 << day
+        return result
+
     def next(self, year: int, month: int, day: Optional[int]) -> Optional[int]:
-        init_weekday, lastday = calendar.monthrange(year, month)
+        init_weekday, lastday = month_info(year, month)
         # 0: Mon,... 6:Sun -> 0: Sun, ..., 6: Sat
         init_weekday = (init_weekday + 1) % 7
 
         def next_day(day_: Optional[int]) -> Optional[int]:
             if day_ is None:
-                if init_weekday in self._value:
+                if self._table.is_selected(init_weekday):
                     return 1
                 day_ = 1
                 weekday = init_weekday
@@ -62,11 +169,9 @@ class DayOfWeekField:
                 return None
             else:
                 weekday = (init_weekday + day_ - 1) % 7
-            next_weekday = min(
-                    filter(lambda x: x is None or x > weekday, self._value),
-                    default=None)
+            next_weekday = self._table.next_of(weekday)
             if next_weekday is None:
-                next_weekday = min(self._value, default=None)
+                next_weekday = self._table.min
                 if next_weekday is None:
                     return None
             day_ += 7 - (weekday - next_weekday) % 7
@@ -85,13 +190,42 @@ class DayOfWeekField:
                        target),
                 default=None)
 
+    def prev(self, year: int, month: int, day: Optional[int]) -> Optional[int]:
+        init_weekday, lastday = month_info(year, month)
+        # 0: Mon,... 6:Sun -> 0: Sun, ..., 6: Sat
+        init_weekday = (init_weekday + 1) % 7
+        limit = min(day, lastday + 1) if day is not None else lastday + 1
+
+        def prev_day() -> Optional[int]:
+            weekday = (init_weekday + limit - 1) % 7
+            prev_weekday = self._table.prev_of(weekday)
+            if prev_weekday is None:
+                prev_weekday = self._table.max
+                if prev_weekday is None:
+                    return None
+            day_ = limit - 7 + (prev_weekday - weekday) % 7
+            return day_ if day_ >= 1 else None
+
+        target: List[Optional[int]] = [prev_day()]
+        if self._non_standard:
+            if self._is_blank:
+                return None
+            target.extend(day_of_week_l(l, year, month) for l in self._l)
+            target.extend(
+                    day_of_week_hash(weekday, week_number, year, month)
+                    for weekday, week_number in self._hash)
+        return max(
+                filter(lambda x: x is not None and x < limit, target),
+                default=None)
+
     def is_selected(self, year: int, month: int, day: int) -> bool:
         if self._non_standard and self._is_blank:
             return False
-        lastday = calendar.monthrange(year, month)[1]
+        init_weekday, lastday = month_info(year, month)
         if 1 <= day <= lastday:
-            weekday = (calendar.weekday(year, month, day) + 1) % 7
-            if weekday in self._value:
+            # 0: Sun, ..., 6: Sat
+            weekday = (init_weekday + day) % 7
+            if self._table.is_selected(weekday):
                 return True
             if self._non_standard:
                 if day in [day_of_week_l(weekday, year, month)
@@ -103,13 +237,56 @@ class DayOfWeekField:
         return False
 
 
+def weekday_day_mask(bitmask: int, init_weekday: int, lastday: int) -> int:
+    # bitmask: weekdays (0: Sunday, ... 6: Saturday)
+    # init_weekday: weekday of the 1st (0: Monday, ... 6: Sunday)
+    # returns bit i: day i falls on a selected weekday
+    # 0: Mon,... 6:Sun -> 0: Sun, ..., 6: Sat
+    init_weekday = (init_weekday + 1) % 7
+    # bit i: the weekday of day i + 1 is selected
+    week = (bitmask >> init_weekday | bitmask << (7 - init_weekday)) & 0x7f
+    return (week * _WEEK_REPEAT << 1) & ((1 << (lastday + 1)) - 2)
+
+
+def _parse_weekday_field(
+        field: str,
+        non_standard: bool,
+        use_word_set: bool,
+        sunday_mode: SundayMode) -> WeekdayFieldParseResult:
+    parser = weekday_field_parser(field, use_word_set, sunday_mode)
+    result = parser.parse_weekday_field(
+            non_standard=non_standard,
+            use_slash=True)
+    if sunday_mode is SundayMode.SUNDAY_IS_7:
+        if 7 in result.value:
+            result.value.remove(7)
+            result.value.append(0)
+            result.value.sort()
+    return result
+
+
+def weekday_field_parser(
+        field: str,
+        use_word_set: bool,
+        sunday_mode: SundayMode) -> FieldParser:
+    min_ = 0 if sunday_mode is SundayMode.SUNDAY_IS_0 else 1
+    max_ = 6 if sunday_mode is SundayMode.SUNDAY_IS_0 else 7
+    word_set = weekday_word_set() if use_word_set else None
+    if word_set is not None and sunday_mode is SundayMode.SUNDAY_IS_7:
+        word_set['sun'] = 7
+    return FieldParser(field, min_, max_, word_set=word_set)
+
+
 def day_of_week_l(
         weekday: int,
         year: int,
         month: int) -> int:
     # weekday 0: Sunday, ... 6: Saturday
     # init_weekday: 0: Monday, ... 6: Sunday
-    init_weekday, lastday = calendar.monthrange(year, month)
+    stats = _stats.ACTIVE.get()
+    if stats is not None:
+        stats.day_of_week_l += 1
+    init_weekday, lastday = month_info(year, month)
     return lastday - (init_weekday + lastday - weekday) % 7
 
 
@@ -120,6 +297,9 @@ def day_of_week_hash(
         month: int) -> Optional[int]:
     # weekday 0: Sunday, ... 6: Saturday
     # init_weekday: 0: Monday, ... 6: Sunday
-    init_weekday, lastday = calendar.monthrange(year, month)
+    stats = _stats.ACTIVE.get()
+    if stats is not None:
+        stats.day_of_week_hash += 1
+    init_weekday, lastday = month_info(year, month)
     result = 1 + (weekday - init_weekday - 1) % 7 + 7 * (week_number - 1)
     return result if result <= lastday else None
@@ -0,0 +1,221 @@
+# -*- coding: utf-8 -*-
+
+import argparse
+import datetime
+import itertools
+import json
+import platform
+import sys
+import time
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Sequence
+from ._batch import CronexpBatch
+from ._cronexp import Cronexp, CronexpOption
+from ._dayexp import DaySelectionMode
+from ._field_parser import FieldParser, weekday_word_set
+
+
+class Benchmark(NamedTuple):
+    group: str
+    name: str
+    function: Callable[[], Any]
+
+
+class BenchmarkResult(NamedTuple):
+    group: str
+    name: str
+    # seconds per call
+    best: float
+    mean: float
+    loops: int
+    repeat: int
+
+
+START = datetime.datetime(2021, 1, 1, 0, 0)
+OR = CronexpOption(day_selection_mode=DaySelectionMode.OR)
+AND = CronexpOption(day_selection_mode=DaySelectionMode.AND)
+EITHER = CronexpOption(day_selection_mode=DaySelectionMode.EITHER)
+
+# (name, field, min, max)
+PARSE_CASE = [
+        ('any', '*', 0, 59),
+        ('single', '0', 0, 59),
+        ('step', '*/5', 0, 59),
+        ('list', '0,5,10,15,20,25,30,35,40,45,50,55', 0, 59),
+        ('range_step', '1-10/2,20-40/3,50-59', 0, 59)]
+# (name, expression, option)
+INIT_CASE = [
+        ('any', '* * * * *', OR),
+        ('typical', '*/15 9-17 * * mon-fri', OR),
+        ('complex', '0,10-20/2,45 0-6,12,18-23/2 1-10,15 */2 *', OR),
+        ('either_extension', '0 0 L,15W * ?', EITHER)]
+# (name, expression, option)
+NEXT_CASE = [
+        ('dense', '* * * * *', OR),
+        ('hourly', '0 * * * *', OR),
+        ('daily', '30 4 * * *', OR),
+        ('weekday', '0 9 * * mon-fri', OR),
+        ('yearly', '0 0 1 1 *', OR),
+        ('end_of_year', '59 23 31 12 *', OR),
+        # day selection modes
+        ('or', '0 0 13 * fri', OR),
+        ('and', '0 0 13 * fri', AND),
+        ('either_day', '0 0 13 * ?', EITHER),
+        ('either_weekday', '0 0 ? * fri', EITHER),
+        # L / W / #
+        ('day_last', '0 0 L * ?', EITHER),
+        ('day_w', '0 0 15W * ?', EITHER),
+        ('weekday_last', '0 0 ? * 5L', EITHER),
+        ('weekday_hash', '0 0 ? * 1#3', EITHER),
+        # pathological
+        ('leap_day', '0 0 29 2 *', OR),
+        ('leap_day_on_weekday', '0 0 29 2 mon', AND),
+        ('leap_day_either', '0 0 29 2 ?', EITHER),
+        ('never', '0 0 30 2 *', OR)]
+# (name, expression, option)
+NEXT_LIST_CASE = [
+        ('dense', '* * * * *', OR),
+        ('hourly', '0 * * * *', OR),
+        ('weekday_hash', '0 0 ? * 1#3', EITHER)]
+NEXT_LIST_LENGTH = [1, 10, 100, 1000]
+BATCH_SIZE = 1000
+
+
+def benchmark_list() -> List[Benchmark]:
+    result: List[Benchmark] = []
+    for name, field, min_, max_ in PARSE_CASE:
+        result.append(Benchmark(
+                group='parse',
+                name=name,
+                function=lambda field=field, min_=min_, max_=max_:
+                    FieldParser(field, min_, max_).parse_field()))
+    result.append(Benchmark(
+            group='parse',
+            name='day_extension',
+            function=lambda: FieldParser(
+                    '1-5,L,15W', 1, 31).parse_day_field()))
+    result.append(Benchmark(
+            group='parse',
+            name='weekday_extension',
+            function=lambda: FieldParser(
+                    'mon-fri,5L,2#3', 0, 7,
+                    word_set=weekday_word_set()).parse_weekday_field()))
+    for name, expression, option in INIT_CASE:
+        result.append(Benchmark(
+                group='init',
+                name=name,
+                function=lambda expression=expression, option=option:
+                    Cronexp(expression, option=option)))
+    for name, expression, option in NEXT_CASE:
+        cronexp = Cronexp(expression, option=option)
+        result.append(Benchmark(
+                group='next',
+                name=name,
+                function=lambda cronexp=cronexp: cronexp.next(START)))
+    for name, expression, option in NEXT_LIST_CASE:
+        cronexp = Cronexp(expression, option=option)
+        for length in NEXT_LIST_LENGTH:
+            result.append(Benchmark(
+                    group='next_list',
+                    name='{0}_{1}'.format(name, length),
+                    function=lambda cronexp=cronexp, length=length:
+                        cronexp.next_list(START, length)))
+    # next() of many expressions from one start
+    expression_list = [
+            Cronexp(expression, option=option)
+            for _, expression, option in itertools.islice(
+                    itertools.cycle(NEXT_CASE),
+                    BATCH_SIZE)]
+    batch = CronexpBatch(expression_list)
+    result.append(Benchmark(
+            group='batch',
+            name='loop_{0}'.format(BATCH_SIZE),
+            function=lambda: [x.next(START) for x in expression_list]))
+    result.append(Benchmark(
+            group='batch',
+            name='batch_{0}'.format(BATCH_SIZE),
+            function=lambda: batch.next(START)))
+    return result
+
+
+def run_benchmark(
+        benchmark: Benchmark,
+        min_time: float = 0.2,
+        repeat: int = 5) -> BenchmarkResult:
+    # loops: the number of calls per measurement (at least min_time)
+    loops = 1
+    while True:
+        elapsed = _measure(benchmark.function, loops)
+        if min_time <= elapsed:
+            break
+        loops *= 10 if elapsed * 10 < min_time else 2
+    timing = [elapsed / loops]
+    timing.extend(_measure(benchmark.function, loops) / loops
+                  for _ in range(repeat - 1))
+    return BenchmarkResult(
+            group=benchmark.group,
+            name=benchmark.name,
+            best=min(timing),
+            mean=sum(timing) / len(timing),
+            loops=loops,
+            repeat=len(timing))
+
+
+def _measure(function: Callable[[], Any], loops: int) -> float:
+    begin = time.perf_counter()
+    for _ in range(loops):
+        function()
+    return time.perf_counter() - begin
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog='python -m cronexp.bench')
+    parser.add_argument(
+            '--filter',
+            metavar='TEXT',
+            default=None,
+            help='run benchmarks whose "group/name" contains TEXT')
+    parser.add_argument(
+            '--min-time',
+            type=float,
+            default=0.2,
+            help='minimum seconds per measurement (default: %(default)s)')
+    parser.add_argument(
+            '--repeat',
+            type=int,
+            default=5,
+            help='measurements per benchmark (default: %(default)s)')
+    parser.add_argument(
+            '--output',
+            metavar='FILE',
+            default=None,
+            help='write JSON to FILE (default: stdout)')
+    args = parser.parse_args(argv)
+    if args.repeat <= 0:
+        parser.error('--repeat must be positive value')
+    result: List[Dict[str, Any]] = []
+    for benchmark in benchmark_list():
+        if (args.filter is not None
+                and args.filter not in '{0}/{1}'.format(
+                        benchmark.group,
+                        benchmark.name)):
+            continue
+        result.append(run_benchmark(
+                benchmark,
+                min_time=args.min_time,
+                repeat=args.repeat)._asdict())
+    output = json.dumps(
+            {'python': platform.python_version(),
+             'implementation': platform.python_implementation(),
+             'platform': platform.platform(),
+             'result': result},
+            indent=2) + '\n'
+    if args.output is None:
+        sys.stdout.write(output)
+    else:
+        with open(args.output, 'w', encoding='utf-8') as stream:
+            stream.write(output)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
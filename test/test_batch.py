@@ -0,0 +1,86 @@
+# -*- coding: utf-8 -*-
+
+import datetime
+import random
+import unittest
+from cronexp._batch import CronexpBatch
+from cronexp._cronexp import Cronexp, CronexpOption
+from cronexp._dayexp import DaySelectionMode
+
+
+class CronexpBatchTest(unittest.TestCase):
+    def test_next(self):
+        either = CronexpOption(day_selection_mode=DaySelectionMode.EITHER)
+        and_ = CronexpOption(day_selection_mode=DaySelectionMode.AND)
+        expression_list = [
+                Cronexp('* * * * *'),
+                Cronexp('0 */6 * * *'),
+                Cronexp('*/30 9-17 * * mon-fri'),
+                Cronexp('59 23 * * *'),
+                Cronexp('0 0 1-7 * mon'),
+                Cronexp('0 0 1-7 * mon', option=and_),
+                Cronexp('0 0 13 * fri', option=and_),
+                Cronexp('0 0 31 * *'),
+                Cronexp('0 12 1 jan *'),
+                Cronexp('0 12 L * ?', option=either),
+                Cronexp('0 12 15W * ?', option=either),
+                Cronexp('0 12 ? * 5#2,1L', option=either),
+                Cronexp('0 12 ? * sat', option=either),
+                Cronexp('0 0 29 2 *'),
+                Cronexp('0 0 29 2 mon', option=and_),
+                Cronexp('0 0 30 2 *'),
+                Cronexp('0 0 1 * *', option=CronexpOption(max_year=2020))]
+        batch = CronexpBatch(expression_list)
+        self.assertEqual(len(batch), len(expression_list))
+        self.assertIs(batch[3], expression_list[3])
+        start_list = [
+                datetime.datetime(2019, 1, 1, 0, 0),
+                datetime.datetime(2019, 2, 28, 23, 59, 30),
+                datetime.datetime(2019, 12, 31, 23, 59),
+                datetime.datetime(2020, 2, 28, 12, 0),
+                datetime.datetime(2020, 2, 29, 0, 0),
+                datetime.datetime(2020, 12, 31, 11, 59),
+                datetime.datetime(2021, 6, 13, 9, 30),
+                datetime.datetime(
+                        2021, 6, 13, 17, 31,
+                        tzinfo=datetime.timezone.utc)]
+        for start in start_list:
+            with self.subTest(start=start):
+                self.assertEqual(
+                        batch.next(start),
+                        [cronexp.next(start) for cronexp in expression_list])
+
+    def test_random(self):
+        random_ = random.Random(0)
+        mode_list = [DaySelectionMode.OR, DaySelectionMode.AND]
+
+        def field(min_: int, max_: int) -> str:
+            return random_.choice([
+                    '*',
+                    str(random_.randint(min_, max_)),
+                    '{0}-{1}'.format(min_, random_.randint(min_, max_)),
+                    '*/{0}'.format(random_.randint(2, 7))])
+
+        expression_list = [
+                Cronexp(
+                        ' '.join([field(0, 59), field(0, 23), field(1, 31),
+                                  field(1, 12), field(0, 6)]),
+                        option=CronexpOption(
+                                day_selection_mode=random_.choice(mode_list)))
+                for _ in range(300)]
+        batch = CronexpBatch(expression_list)
+        start = datetime.datetime(2019, 1, 1)
+        for _ in range(20):
+            start += datetime.timedelta(minutes=random_.randint(1, 80000))
+            with self.subTest(start=start):
+                self.assertEqual(
+                        batch.next(start),
+                        [cronexp.next(start) for cronexp in expression_list])
+
+    def test_empty(self):
+        batch = CronexpBatch()
+        self.assertEqual(batch.next(datetime.datetime(2019, 1, 1)), [])
+        self.assertEqual(batch.add(Cronexp('0 0 * * *')), 0)
+        self.assertEqual(
+                batch.next(datetime.datetime(2019, 1, 1)),
+                [datetime.datetime(2019, 1, 2)])
@@ -0,0 +1,34 @@
+# -*- coding: utf-8 -*-
+
+import contextlib
+import io
+import json
+import unittest
+from cronexp.bench import benchmark_list, main
+
+
+class BenchmarkTest(unittest.TestCase):
+    def test_benchmark_list(self):
+        name_list = ['{0}/{1}'.format(x.group, x.name)
+                     for x in benchmark_list()]
+        self.assertEqual(len(name_list), len(set(name_list)))
+        self.assertEqual(
+                {x.split('/')[0] for x in name_list},
+                {'parse', 'init', 'next', 'next_list', 'batch'})
+        for benchmark in benchmark_list():
+            with self.subTest(group=benchmark.group, name=benchmark.name):
+                benchmark.function()
+
+    def test_main(self):
+        stdout = io.StringIO()
+        with contextlib.redirect_stdout(stdout):
+            status = main(['--filter', 'next/', '--min-time', '0',
+                           '--repeat', '2'])
+        self.assertEqual(status, 0)
+        output = json.loads(stdout.getvalue())
+        self.assertTrue(output['result'])
+        for result in output['result']:
+            with self.subTest(name=result['name']):
+                self.assertEqual(result['group'], 'next')
+                self.assertEqual(result['repeat'], 2)
+                self.assertLessEqual(result['best'], result['mean'])
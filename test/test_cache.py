@@ -0,0 +1,78 @@
+# -*- coding: utf-8 -*-
+
+import unittest
+from cronexp._cache import CronexpCache
+from cronexp._cronexp import Cronexp, CronexpOption
+from cronexp._dayexp import DaySelectionMode
+from cronexp._weekday_field import SundayMode
+
+
+class CronexpCacheTest(unittest.TestCase):
+    def test_hit(self):
+        cache = CronexpCache()
+        cronexp = cache.compile('*/15 * * * *')
+        self.assertIs(cache.compile('*/15  *  * * *'), cronexp)
+        info = cache.info()
+        self.assertEqual(info.hits, 1)
+        self.assertEqual(info.misses, 1)
+        self.assertEqual(info.currsize, 1)
+
+    def test_canonical(self):
+        cache = CronexpCache()
+        expression_list = [
+                ('*/15 9-17 * * MON-FRI', CronexpOption()),
+                ('0,15,30,45 9-17 * * 1-5', CronexpOption()),
+                ('0-59/15 9,10-17 * * mon,tue-fri', CronexpOption())]
+        cronexp = cache.compile(*expression_list[0])
+        for expression, option in expression_list[1:]:
+            with self.subTest(expression=expression, option=option):
+                self.assertIs(cache.compile(expression, option), cronexp)
+        info = cache.info()
+        self.assertEqual(info.misses, len(expression_list))
+        self.assertEqual(info.shared, len(expression_list) - 1)
+
+    def test_canonical_option(self):
+        # shared parts, but the requested option
+        test_case = [
+                ('0 0 * * 7',
+                 CronexpOption(sunday_mode=SundayMode.SUNDAY_IS_7)),
+                ('0 0 * * 0', CronexpOption(use_word_set=False))]
+        for expression, option in test_case:
+            with self.subTest(expression=expression, option=option):
+                cache = CronexpCache()
+                cronexp = cache.compile('0 0 * * sun')
+                result = cache.compile(expression, option)
+                self.assertEqual(result.option, option)
+                self.assertIs(result._timeexp, cronexp._timeexp)
+                self.assertIs(result._dateexp, cronexp._dateexp)
+                self.assertEqual(
+                        Cronexp.from_bytes(result.to_bytes()).option,
+                        option)
+                self.assertEqual(cache.info().shared, 1)
+
+    def test_not_shared(self):
+        cache = CronexpCache()
+        expression_list = [
+                ('0 0 * * 1-5', CronexpOption()),
+                ('0 0 1-31 * 1-5', CronexpOption()),
+                ('0 0 * * 1-5', CronexpOption(
+                        day_selection_mode=DaySelectionMode.AND)),
+                ('0 0 * * 1-5', CronexpOption(max_year=2100))]
+        cronexp_list = [
+                cache.compile(expression, option)
+                for expression, option in expression_list]
+        self.assertEqual(len(set(map(id, cronexp_list))), len(cronexp_list))
+
+    def test_maxsize(self):
+        cache = CronexpCache(maxsize=2)
+        first = cache.compile('0 * * * *')
+        cache.compile('1 * * * *')
+        cache.compile('0 * * * *')
+        cache.compile('2 * * * *')
+        self.assertEqual(cache.info().currsize, 2)
+        self.assertIs(cache.compile('0 * * * *'), first)
+        cache.compile('1 * * * *')
+        self.assertEqual(cache.info().hits, 2)
+        self.assertEqual(cache.info().misses, 4)
+        with self.assertRaises(ValueError):
+            CronexpCache(maxsize=0)
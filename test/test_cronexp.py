@@ -2,6 +2,7 @@
 
 import calendar
 import datetime
+import itertools
 import math
 import unittest
 from cronexp._cronexp import Cronexp, CronexpOption
@@ -30,6 +31,16 @@ class CronexpTest(unittest.TestCase):
                 cronexp.next_list(init, len(result_list)),
                 result_list)
 
+    def test_next_day(self):
+        cronexp = Cronexp('*/15 9-10 * * mon-fri')
+        self.assertEqual(
+                cronexp.next(datetime.datetime(2020, 1, 2, 10, 45)),
+                datetime.datetime(2020, 1, 3, 9, 0))
+        cronexp = Cronexp('0 8,19 10 * *')
+        self.assertEqual(
+                cronexp.next(datetime.datetime(2019, 1, 1, 12, 0)),
+                datetime.datetime(2019, 1, 10, 8, 0))
+
     def test_invalid_expression(self):
         expression_list = [
                 '*',
@@ -58,3 +69,299 @@ class CronexpTest(unittest.TestCase):
                     '* * * * 0',
                     option=CronexpOption(
                             sunday_mode=SundayMode.SUNDAY_IS_7))
+
+    def test_prev(self):
+        either = CronexpOption(day_selection_mode=DaySelectionMode.EITHER)
+        expression_list = [
+                ('0 8,19 10/10 * *', CronexpOption()),
+                ('*/20 9-10 * * mon-fri', CronexpOption()),
+                ('0 0 1-7 * mon', CronexpOption(
+                        day_selection_mode=DaySelectionMode.AND)),
+                ('30 0 L * ?', either),
+                ('0 9 15W * ?', either),
+                ('0 9 ? * 5#2,1L', either),
+                ('0 12 29 2 *', CronexpOption())]
+        init = datetime.datetime(2019, 1, 1, 0, 0)
+        for expression, option in expression_list:
+            cronexp = Cronexp(expression, option=option)
+            occurrence = cronexp.next_list(init, 100)
+            for prev_, next_ in zip(occurrence, occurrence[1:]):
+                with self.subTest(expression=expression, start=next_):
+                    self.assertEqual(cronexp.prev(next_), next_)
+                    self.assertEqual(
+                            cronexp.prev(next_ - datetime.timedelta(
+                                    seconds=1)),
+                            prev_)
+            self.assertEqual(
+                    cronexp.prev_list(occurrence[-1], len(occurrence)),
+                    occurrence[::-1])
+
+    def test_prev_none(self):
+        cronexp = Cronexp('0 12 1 1 *')
+        self.assertIsNone(cronexp.prev(datetime.datetime(1, 1, 1, 0, 0)))
+
+    def test_count(self):
+        either = CronexpOption(day_selection_mode=DaySelectionMode.EITHER)
+        expression_list = [
+                ('* * * * *', CronexpOption()),
+                ('*/20 9-10 * * mon-fri', CronexpOption()),
+                ('30 0 L * ?', either),
+                ('0 9 ? * 5#2,1L', either),
+                ('0 12 29 2 *', CronexpOption(max_year=2023)),
+                ('0 * * * *', CronexpOption(max_year=2022))]
+        interval_list = [
+                (datetime.datetime(2019, 1, 1, 9, 20),
+                 datetime.datetime(2019, 1, 1, 10, 20)),
+                (datetime.datetime(2019, 1, 1, 9, 20, 1),
+                 datetime.datetime(2019, 1, 1, 10, 20, 1)),
+                (datetime.datetime(2019, 1, 30, 0, 30),
+                 datetime.datetime(2019, 3, 31, 0, 30)),
+                (datetime.datetime(2019, 12, 31, 12, 0),
+                 datetime.datetime(2021, 3, 1, 0, 0)),
+                (datetime.datetime(2019, 1, 2),
+                 datetime.datetime(2019, 1, 1)),
+                (datetime.datetime(2022, 12, 31, 12, 0),
+                 datetime.datetime(2023, 1, 1, 12, 0))]
+        for expression, option in expression_list:
+            cronexp = Cronexp(expression, option=option)
+            for start, end in interval_list:
+                occurrence = itertools.takewhile(
+                        lambda x: x < end,
+                        cronexp.iter(start - datetime.timedelta(minutes=1)))
+                expected = sum(1 for x in occurrence if start <= x)
+                with self.subTest(expression=expression, start=start):
+                    self.assertEqual(cronexp.count(start, end), expected)
+        cronexp = Cronexp('* * * * *')
+        self.assertEqual(
+                cronexp.count(
+                        datetime.datetime(2019, 1, 1),
+                        datetime.datetime(2020, 1, 1)),
+                525600)
+        cronexp = Cronexp(
+                '0 12 29 2 *',
+                option=CronexpOption(max_year=2023))
+        self.assertEqual(
+                cronexp.count(
+                        datetime.datetime(2019, 1, 1),
+                        datetime.datetime(2030, 1, 1)),
+                1)
+        # end on the last day
+        either = CronexpOption(day_selection_mode=DaySelectionMode.EITHER)
+        test_case = [
+                ('* * * * *', CronexpOption(), 2160),
+                ('30 0 L * ?', either, 1),
+                ('0 * * * *', CronexpOption(max_year=2022), 0)]
+        for expression, option, expected in test_case:
+            cronexp = Cronexp(expression, option=option)
+            with self.subTest(expression=expression):
+                self.assertEqual(
+                        cronexp.count(
+                                datetime.datetime(9999, 12, 30),
+                                datetime.datetime(9999, 12, 31, 12)),
+                        expected)
+
+    def test_is_satisfiable(self):
+        self.assertTrue(Cronexp('0 0 29 2 *').is_satisfiable)
+        for expression in ['0 0 30 2 *', '0 0 31 4,6,9,11 *']:
+            cronexp = Cronexp(expression)
+            start = datetime.datetime(2019, 1, 1)
+            with self.subTest(expression=expression):
+                self.assertFalse(cronexp.is_satisfiable)
+                self.assertIsNone(cronexp.next(start))
+                self.assertIsNone(cronexp.prev(start))
+                self.assertIsNone(cronexp.nth(start, 1))
+                self.assertEqual(cronexp.next_list(start, 10), [])
+                self.assertEqual(
+                        cronexp.count(start, datetime.datetime(2119, 1, 1)),
+                        0)
+
+    def test_until(self):
+        cronexp = Cronexp('0 0 30 2 *')
+        self.assertIsNone(cronexp.next(
+                datetime.datetime(2019, 1, 1),
+                until=datetime.datetime(2100, 1, 1)))
+        cronexp = Cronexp('0 8,19 10/10 * *')
+        start = datetime.datetime(2019, 1, 1)
+        self.assertEqual(
+                cronexp.next(start, until=datetime.datetime(2019, 1, 10, 8)),
+                None)
+        self.assertEqual(
+                cronexp.next(start, until=datetime.datetime(2019, 1, 10, 9)),
+                datetime.datetime(2019, 1, 10, 8, 0))
+        self.assertEqual(
+                cronexp.next_list(
+                        start,
+                        10,
+                        until=datetime.datetime(2019, 1, 20, 19, 0)),
+                [datetime.datetime(2019, 1, 10, 8, 0),
+                 datetime.datetime(2019, 1, 10, 19, 0),
+                 datetime.datetime(2019, 1, 20, 8, 0)])
+
+    def test_between(self):
+        cronexp = Cronexp('*/20 9-10 * * mon-fri')
+        start = datetime.datetime(2019, 1, 4, 10, 20)
+        end = datetime.datetime(2019, 1, 7, 9, 40)
+        self.assertEqual(
+                list(cronexp.between(start, end)),
+                [datetime.datetime(2019, 1, 4, 10, 20),
+                 datetime.datetime(2019, 1, 4, 10, 40),
+                 datetime.datetime(2019, 1, 7, 9, 0),
+                 datetime.datetime(2019, 1, 7, 9, 20)])
+        self.assertEqual(
+                len(list(cronexp.between(
+                        start + datetime.timedelta(seconds=1),
+                        end))),
+                3)
+        cronexp = Cronexp('0 0 30 2 *')
+        self.assertEqual(
+                list(cronexp.between(
+                        datetime.datetime(2019, 1, 1),
+                        datetime.datetime(2119, 1, 1))),
+                [])
+
+    def test_nth(self):
+        either = CronexpOption(day_selection_mode=DaySelectionMode.EITHER)
+        expression_list = [
+                ('*/20 9-10 * * mon-fri', CronexpOption()),
+                ('30 0 L * ?', either),
+                ('0 9 ? * 5#2,1L', either),
+                ('0 12 29 2 *', CronexpOption())]
+        start = datetime.datetime(2019, 1, 4, 10, 20, 30)
+        for expression, option in expression_list:
+            cronexp = Cronexp(expression, option=option)
+            expected = cronexp.next_list(start, 200)
+            for n in [1, 2, 3, 5, 7, 30, 61, 199, 200]:
+                with self.subTest(expression=expression, n=n):
+                    self.assertEqual(cronexp.nth(start, n), expected[n - 1])
+        with self.assertRaises(ValueError):
+            cronexp.nth(start, 0)
+
+    def test_nth_none(self):
+        start = datetime.datetime(2019, 1, 1)
+        cronexp = Cronexp(
+                '0 0 1 1 *',
+                option=CronexpOption(max_year=2021))
+        self.assertEqual(cronexp.nth(start, 2), datetime.datetime(2021, 1, 1))
+        self.assertIsNone(cronexp.nth(start, 3))
+        self.assertIsNone(Cronexp('0 0 30 2 *').nth(start, 1))
+        # start after max_year (same as count)
+        cronexp = Cronexp(
+                '* * * * *',
+                option=CronexpOption(max_year=2020))
+        start = datetime.datetime(2021, 3, 1, 12, 0)
+        self.assertIsNone(cronexp.nth(start, 1))
+        self.assertIsNone(cronexp.nth(start, 100))
+        self.assertEqual(
+                cronexp.count(start, start + datetime.timedelta(days=1)),
+                0)
+
+    def test_shared(self):
+        cronexp1 = Cronexp('0 9 * * mon-fri')
+        cronexp2 = Cronexp('0  9 * * 1-5')
+        cronexp3 = Cronexp('0 12 1 * mon-fri')
+        self.assertIsNot(cronexp1, cronexp2)
+        self.assertIs(cronexp1._timeexp, cronexp2._timeexp)
+        self.assertIs(cronexp1._dateexp, cronexp2._dateexp)
+        self.assertIs(cronexp1._timeexp.minute, cronexp3._timeexp.minute)
+        self.assertIs(
+                cronexp1._dateexp.month,
+                cronexp3._dateexp.month)
+        self.assertIs(
+                cronexp1._dateexp.dayexp.day_of_week,
+                cronexp3._dateexp.dayexp.day_of_week)
+        # '*' and '0-59' differ in the day selection
+        self.assertIsNot(
+                Cronexp('* * * * *')._timeexp.minute,
+                Cronexp('0-59 * * * *')._timeexp.minute)
+        # options are not shared
+        self.assertIsNot(
+                cronexp1._dateexp,
+                Cronexp('0 9 * * mon-fri',
+                        option=CronexpOption(max_year=2100))._dateexp)
+
+    def test_slots(self):
+        cronexp = Cronexp('0 9 L * ?', option=CronexpOption(
+                day_selection_mode=DaySelectionMode.EITHER))
+        dateexp = cronexp._dateexp
+        for obj in [cronexp,
+                    cronexp._timeexp,
+                    cronexp._timeexp.minute,
+                    dateexp,
+                    dateexp.dayexp,
+                    dateexp.dayexp.day_of_month,
+                    dateexp.dayexp.day_of_week]:
+            with self.subTest(type=type(obj).__name__):
+                self.assertFalse(hasattr(obj, '__dict__'))
+
+
+class CronexpCursorTest(unittest.TestCase):
+    def test_iter(self):
+        either = CronexpOption(day_selection_mode=DaySelectionMode.EITHER)
+        expression_list = [
+                ('0 8,19 10/10 * *', CronexpOption()),
+                ('*/15 9-10 * * mon-fri', CronexpOption()),
+                ('30 0 L * ?', either),
+                ('0 9 ? * 5#2', either),
+                ('0 12 29 2 *', CronexpOption())]
+        init = datetime.datetime(2019, 12, 30, 23, 0)
+        for expression, option in expression_list:
+            cronexp = Cronexp(expression, option=option)
+            cursor = cronexp.iter(init)
+            start = init
+            for _ in range(200):
+                expected = cronexp.next(start)
+                with self.subTest(expression=expression, start=start):
+                    self.assertEqual(cursor.peek(), expected)
+                    self.assertEqual(cursor.advance(), expected)
+                start = expected
+
+    def test_seek(self):
+        cronexp = Cronexp('0 8,19 10/10 * *')
+        cursor = cronexp.iter(datetime.datetime(2019, 1, 1, 0, 0))
+        cursor.seek(datetime.datetime(2019, 1, 20, 8, 0))
+        self.assertEqual(
+                cursor.peek(),
+                datetime.datetime(2019, 1, 20, 19, 0))
+        self.assertEqual(
+                cursor.advance(),
+                datetime.datetime(2019, 1, 20, 19, 0))
+        self.assertEqual(
+                cursor.peek(),
+                datetime.datetime(2019, 1, 30, 8, 0))
+
+    def test_max_year(self):
+        cronexp = Cronexp(
+                '0 0 1 1 *',
+                option=CronexpOption(max_year=2021))
+        result = list(cronexp.iter(datetime.datetime(2019, 6, 1)))
+        self.assertEqual(
+                result,
+                [datetime.datetime(2020, 1, 1),
+                 datetime.datetime(2021, 1, 1)])
+
+    def test_max_year_next(self):
+        # no occurrences after max_year, from any start
+        test_case = [
+                ('0 0 1 1 *', datetime.datetime(2020, 6, 1)),
+                ('0 0 * * *', datetime.datetime(2020, 12, 31, 12, 0)),
+                ('0 0 * * *', datetime.datetime(2021, 3, 1)),
+                ('0 * * * *', datetime.datetime(2021, 3, 1))]
+        option = CronexpOption(max_year=2020)
+        for expression, start in test_case:
+            cronexp = Cronexp(expression, option=option)
+            end = datetime.datetime(2022, 1, 1)
+            with self.subTest(expression=expression, start=start):
+                self.assertIsNone(cronexp.next(start))
+                self.assertEqual(cronexp.next_list(start, 10, until=end), [])
+                self.assertEqual(list(cronexp.between(start, end)), [])
+        cronexp = Cronexp('0 0 * * *', option=option)
+        start = datetime.datetime(2020, 12, 30, 12, 0)
+        self.assertEqual(
+                cronexp.next_list(
+                        start,
+                        10,
+                        until=datetime.datetime(2022, 1, 1)),
+                [datetime.datetime(2020, 12, 31)])
+        self.assertEqual(
+                list(cronexp.between(start, datetime.datetime(2022, 1, 1))),
+                [datetime.datetime(2020, 12, 31)])
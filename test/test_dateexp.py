@@ -305,8 +305,7 @@ class DateexpTest(unittest.TestCase):
                         month='2',
                         weekday='*',
                         day_selection_mode=day_selection_mode)
-                with self.assertRaises(RecursionError):
-                    dateexp.next(day=1, month=1, year=2019)
+                self.assertIsNone(dateexp.next(day=1, month=1, year=2019))
 
     def test_error_disuse_word_set(self):
         input_list = [
@@ -330,8 +329,7 @@ class DateexpTest(unittest.TestCase):
                 '?',
                 max_year=None,
                 day_selection_mode=DaySelectionMode.EITHER)
-        with self.assertRaises(RecursionError):
-            no_max_year.next(year=2019, month=1, day=1)
+        self.assertEqual(no_max_year.next(year=2019, month=1, day=1), None)
         with_max_year = Dateexp(
                 '30',
                 '2',
@@ -339,3 +337,76 @@ class DateexpTest(unittest.TestCase):
                 max_year=2100,
                 day_selection_mode=DaySelectionMode.EITHER)
         self.assertEqual(with_max_year.next(year=2019, month=1, day=1), None)
+
+    def test_is_satisfiable(self):
+        satisfiable = [
+                ('29', '2', '*', DaySelectionMode.OR),
+                ('29', '2', '1', DaySelectionMode.AND),
+                ('30', '2', 'mon', DaySelectionMode.OR),
+                ('30', '1-2', '*', DaySelectionMode.AND),
+                ('L', '2', '?', DaySelectionMode.EITHER),
+                ('30W', '2', '?', DaySelectionMode.EITHER),
+                ('?', '2', '1#5', DaySelectionMode.EITHER),
+                ('?', '2', '5L', DaySelectionMode.EITHER)]
+        unsatisfiable = [
+                ('30', '2', '*', DaySelectionMode.OR),
+                ('31', '4,6,9,11', '*', DaySelectionMode.OR),
+                ('30,31', '2', '*', DaySelectionMode.AND),
+                ('30', '2', 'mon', DaySelectionMode.AND),
+                ('30', '2', '?', DaySelectionMode.EITHER)]
+        for expected, expression_list in [
+                (True, satisfiable),
+                (False, unsatisfiable)]:
+            for day, month, weekday, mode in expression_list:
+                dateexp = Dateexp(day, month, weekday, day_selection_mode=mode)
+                with self.subTest(
+                        day=day,
+                        month=month,
+                        weekday=weekday,
+                        mode=mode):
+                    self.assertEqual(dateexp.is_satisfiable, expected)
+                    self.assertEqual(
+                            dateexp.next(day=1, month=1, year=2000)
+                            is not None,
+                            expected)
+
+    def test_sparse_year(self):
+        dateexp_list = [
+                Dateexp('29', '2', '1',
+                        day_selection_mode=DaySelectionMode.AND),
+                Dateexp('13', '*', 'fri',
+                        day_selection_mode=DaySelectionMode.AND),
+                Dateexp('?', '2', '0#5',
+                        day_selection_mode=DaySelectionMode.EITHER)]
+        for dateexp in dateexp_list:
+            expected = []
+            date = datetime.date(1990, 1, 1)
+            while date.year < 2100:
+                if dateexp.is_selected(date.year, date.month, date.day):
+                    expected.append(date)
+                date += datetime.timedelta(days=1)
+            with self.subTest(dateexp=dateexp):
+                result = []
+                date = datetime.date(1990, 1, 1)
+                while True:
+                    next_ = dateexp.next(
+                            year=date.year,
+                            month=date.month,
+                            day=date.day)
+                    date = datetime.date(next_.year, next_.month, next_.day)
+                    if date.year >= 2100:
+                        break
+                    result.append(date)
+                self.assertEqual(result, expected)
+                result = []
+                date = datetime.date(2099, 12, 31)
+                while True:
+                    prev = dateexp.prev(
+                            year=date.year,
+                            month=date.month,
+                            day=date.day)
+                    date = datetime.date(prev.year, prev.month, prev.day)
+                    if date.year < 1990:
+                        break
+                    result.append(date)
+                self.assertEqual(result[::-1], expected)
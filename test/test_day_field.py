@@ -112,3 +112,37 @@ class DayOfMonthFieldTest(unittest.TestCase):
                     break
             with self.subTest(year=year, month=month, day=day):
                 self.assertEqual(field.next(year, month, day), expected)
+
+    def test_prev(self):
+        field = DayOfMonthField('*/5,11W,21W,L', non_standard=True)
+        for year, month, day in itertools.product(
+                (2019, 2020),
+                range(1, 13),
+                (None, *range(1, 33))):
+            lastday = calendar.monthrange(year, month)[1]
+            limit = day if day is not None else lastday + 1
+            expected = max(
+                    (x for x in range(1, min(limit, lastday + 1))
+                     if field.is_selected(year, month, x)),
+                    default=None)
+            with self.subTest(year=year, month=month, day=day):
+                self.assertEqual(field.prev(year, month, day), expected)
+
+    def test_day_mask(self):
+        field_list = [
+                ('*', False),
+                ('*/5,11W,21W,L', True),
+                ('1W,31W,30', True),
+                ('?', True)]
+        for (field, non_standard), year, month in itertools.product(
+                field_list,
+                (2019, 2020),
+                range(1, 13)):
+            day_of_month = DayOfMonthField(field, non_standard=non_standard)
+            expected = sum(
+                    1 << day for day in range(1, 32)
+                    if day_of_month.is_selected(year, month, day))
+            with self.subTest(field=field, year=year, month=month):
+                self.assertEqual(
+                        day_of_month.day_mask(year, month),
+                        expected)
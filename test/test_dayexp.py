@@ -3,8 +3,11 @@
 import calendar
 import itertools
 import math
+import sys
+import threading
 import unittest
-from cronexp._dayexp import Dayexp, DayexpParseError, DaySelectionMode
+from cronexp._dayexp import (
+        DAY_MASK_CACHE_SIZE, Dayexp, DayexpParseError, DaySelectionMode)
 
 
 class DayexpTest(unittest.TestCase):
@@ -196,3 +199,84 @@ class DayexpTest(unittest.TestCase):
                             day,
                             weekday,
                             selection_mode=DaySelectionMode.EITHER)
+
+    def test_day_mask(self):
+        input_list = [
+                ('*', '*', DaySelectionMode.OR),
+                ('1,15', 'Mon', DaySelectionMode.OR),
+                ('1,15', 'Mon', DaySelectionMode.AND),
+                ('13', 'Fri', DaySelectionMode.AND),
+                ('*/2', '*', DaySelectionMode.AND),
+                ('L,15W', '?', DaySelectionMode.EITHER),
+                ('?', '5L,1#3', DaySelectionMode.EITHER)]
+        for (day, weekday, mode), year, month in itertools.product(
+                input_list,
+                (2019, 2020),
+                range(1, 13)):
+            dayexp = Dayexp(day, weekday, selection_mode=mode)
+            day_of_month = dayexp.day_of_month.day_mask(year, month)
+            day_of_week = dayexp.day_of_week.day_mask(year, month)
+            if mode is DaySelectionMode.EITHER:
+                expected = (day_of_month
+                            if dayexp.day_of_week.is_blank
+                            else day_of_week)
+            elif dayexp.day_of_month.is_any or dayexp.day_of_week.is_any:
+                expected = day_of_month & day_of_week
+            elif mode is DaySelectionMode.OR:
+                expected = day_of_month | day_of_week
+            else:
+                expected = day_of_month & day_of_week
+            with self.subTest(
+                    day=day, weekday=weekday, mode=mode,
+                    year=year, month=month):
+                self.assertEqual(dayexp.day_mask(year, month), expected)
+                selected = [x for x in range(1, 32) if expected >> x & 1]
+                for x in (None, *range(0, 33)):
+                    self.assertEqual(
+                            dayexp.next(year, month, x),
+                            min((y for y in selected if x is None or x < y),
+                                default=None))
+                    self.assertEqual(
+                            dayexp.prev(year, month, x),
+                            max((y for y in selected if x is None or y < x),
+                                default=None))
+
+    def test_day_mask_cache(self):
+        dayexp = Dayexp('13', 'Fri', selection_mode=DaySelectionMode.AND)
+        for year, month in itertools.product(range(1900, 2100), range(1, 13)):
+            dayexp.day_mask(year, month)
+        self.assertEqual(len(dayexp._day_mask_cache), DAY_MASK_CACHE_SIZE)
+        self.assertTrue(dayexp.is_selected(2099, 2, 13))
+        self.assertTrue(dayexp.is_selected(1998, 2, 13))
+
+    def test_day_mask_cache_threads(self):
+        # the cache is shared: eviction by several threads at once
+        dayexp = Dayexp('L', '?', selection_mode=DaySelectionMode.EITHER)
+        error_list = []
+
+        def resolve(first_year):
+            try:
+                for year, month in itertools.product(
+                        range(first_year, first_year + 400),
+                        range(1, 13)):
+                    lastday = calendar.monthrange(year, month)[1]
+                    if dayexp.day_mask(year, month) != 1 << lastday:
+                        error_list.append((year, month))
+            except Exception as error:
+                error_list.append(error)
+        interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)
+        try:
+            thread_list = [
+                    threading.Thread(target=resolve, args=(1600 + 100 * i,))
+                    for i in range(8)]
+            for thread in thread_list:
+                thread.start()
+            for thread in thread_list:
+                thread.join()
+        finally:
+            sys.setswitchinterval(interval)
+        self.assertEqual(error_list, [])
+        self.assertLessEqual(
+                len(dayexp._day_mask_cache),
+                DAY_MASK_CACHE_SIZE + len(thread_list))
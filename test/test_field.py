@@ -2,7 +2,7 @@
 
 import itertools
 import unittest
-from cronexp._field import Field
+from cronexp._field import Field, field_table
 
 
 class FieldTest(unittest.TestCase):
@@ -41,3 +41,45 @@ class FieldTest(unittest.TestCase):
         result = field.next(11)
         self.assertEqual(result.value, 1)
         self.assertTrue(result.move_up)
+
+    def test_prev(self):
+        field = Field('5,8', 0, 10)
+        for i in range(0, 12):
+            with self.subTest(i=i):
+                result = field.prev(i)
+                if i > 8:
+                    self.assertEqual(result.value, 8)
+                    self.assertFalse(result.move_down)
+                elif 5 < i <= 8:
+                    self.assertEqual(result.value, 5)
+                    self.assertFalse(result.move_down)
+                else:
+                    self.assertEqual(result.value, 8)
+                    self.assertTrue(result.move_down)
+
+
+class FieldTableTest(unittest.TestCase):
+    def test_field_table(self):
+        selected = [2, 3, 5, 7]
+        table = field_table(selected, 10)
+        self.assertEqual(table.min, 2)
+        self.assertEqual(table.max, 7)
+        for i in range(-2, 13):
+            with self.subTest(i=i):
+                self.assertEqual(table.is_selected(i), i in selected)
+                self.assertEqual(
+                        table.next_of(i),
+                        min((x for x in selected if i < x), default=None))
+                self.assertEqual(
+                        table.prev_of(i),
+                        max((x for x in selected if x < i), default=None))
+
+    def test_empty(self):
+        table = field_table([], 10)
+        self.assertIsNone(table.min)
+        self.assertIsNone(table.max)
+        for i in range(-2, 13):
+            with self.subTest(i=i):
+                self.assertFalse(table.is_selected(i))
+                self.assertIsNone(table.next_of(i))
+                self.assertIsNone(table.prev_of(i))
@@ -0,0 +1,75 @@
+# -*- coding: utf-8 -*-
+
+import datetime
+import unittest
+from cronexp._cronexp import Cronexp, CronexpOption
+from cronexp._dayexp import DaySelectionMode
+from cronexp._index import CronexpIndex
+
+
+class CronexpIndexTest(unittest.TestCase):
+    def test_due(self):
+        either = CronexpOption(day_selection_mode=DaySelectionMode.EITHER)
+        and_ = CronexpOption(day_selection_mode=DaySelectionMode.AND)
+        expression_list = [
+                Cronexp('* * * * *'),
+                Cronexp('0 */6 * * *'),
+                Cronexp('*/30 9-17 * * mon-fri'),
+                Cronexp('0 0 1-7 * mon'),
+                Cronexp('0 0 1-7 * mon', option=and_),
+                Cronexp('0 0 13 * fri', option=and_),
+                Cronexp('0 12 L * ?', option=either),
+                Cronexp('0 12 15W * ?', option=either),
+                Cronexp('0 12 ? * 5#2,1L', option=either),
+                Cronexp('0 12 ? * sat', option=either),
+                Cronexp('0 0 29 2 *')]
+        index = CronexpIndex(expression_list)
+        self.assertEqual(len(index), len(expression_list))
+        time = datetime.datetime(2019, 12, 25, 0, 0)
+        end = datetime.datetime(2020, 12, 31, 0, 0)
+        while time < end:
+            expected = [
+                    id_ for id_, cronexp in enumerate(expression_list)
+                    if cronexp.prev(time) == time]
+            with self.subTest(time=time):
+                self.assertEqual(index.due(time), expected)
+            time += datetime.timedelta(minutes=30)
+
+    def test_add(self):
+        index = CronexpIndex()
+        self.assertEqual(index.add(Cronexp('0 0 * * *')), 0)
+        self.assertEqual(index.add(Cronexp('0 * * * *')), 1)
+        self.assertEqual(index.due(datetime.datetime(2020, 1, 1)), [0, 1])
+        self.assertEqual(index.due(datetime.datetime(2020, 1, 1, 1)), [1])
+        self.assertEqual(index.due(datetime.datetime(2020, 1, 1, 1, 1)), [])
+
+    def test_max_year(self):
+        index = CronexpIndex([
+                Cronexp('0 0 * * *', option=CronexpOption(max_year=2020)),
+                Cronexp('0 0 * * *'),
+                Cronexp('0 0 * * *', option=CronexpOption(max_year=2025))])
+        test_case = [
+                (datetime.datetime(2020, 12, 31), [0, 1, 2]),
+                (datetime.datetime(2021, 1, 1), [1, 2]),
+                (datetime.datetime(2030, 1, 1), [1])]
+        for time, expected in test_case:
+            with self.subTest(time=time):
+                self.assertEqual(index.due(time), expected)
+
+    def test_max_year_same_as_next(self):
+        expression_list = [
+                Cronexp('0 0 1 1 *', option=CronexpOption(max_year=2020)),
+                Cronexp('0 0 * * *', option=CronexpOption(max_year=2020)),
+                Cronexp('0 */6 * * *', option=CronexpOption(max_year=2021)),
+                Cronexp('0 0 1 1 *')]
+        index = CronexpIndex(expression_list)
+        time = datetime.datetime(2020, 12, 30, 0, 0)
+        end = datetime.datetime(2022, 1, 2, 0, 0)
+        while time < end:
+            before = time - datetime.timedelta(minutes=1)
+            expected = [
+                    id_ for id_, cronexp in enumerate(expression_list)
+                    if cronexp.next(before) == time]
+            with self.subTest(time=time):
+                self.assertEqual(index.due(time), expected)
+            time += datetime.timedelta(hours=6)
@@ -0,0 +1,43 @@
+# -*- coding: utf-8 -*-
+
+import datetime
+import itertools
+import unittest
+from cronexp._cronexp import Cronexp, CronexpOption
+from cronexp._merge import merge_occurrences
+
+
+class MergeOccurrencesTest(unittest.TestCase):
+    def test_merge(self):
+        expression_list = [
+                Cronexp('*/7 * * * *'),
+                Cronexp('0 */6 * * *'),
+                Cronexp('0,30 9 * * mon-fri'),
+                Cronexp('0 0 1 * *')]
+        start = datetime.datetime(2019, 12, 30, 0, 0)
+        end = datetime.datetime(2020, 1, 10, 0, 0)
+        expected = sorted(
+                (next_, id_)
+                for id_, cronexp in enumerate(expression_list)
+                for next_ in itertools.takewhile(
+                        lambda x: x < end,
+                        cronexp.iter(start)))
+        result = list(itertools.takewhile(
+                lambda x: x[1] < end,
+                merge_occurrences(expression_list, start)))
+        self.assertEqual(
+                result,
+                [(id_, next_) for next_, id_ in expected])
+
+    def test_finite(self):
+        expression_list = [
+                Cronexp('0 0 1 1 *', option=CronexpOption(max_year=2021)),
+                Cronexp('0 12 1 1 *', option=CronexpOption(max_year=2020))]
+        result = list(merge_occurrences(
+                expression_list,
+                datetime.datetime(2019, 6, 1)))
+        self.assertEqual(
+                result,
+                [(0, datetime.datetime(2020, 1, 1, 0, 0)),
+                 (1, datetime.datetime(2020, 1, 1, 12, 0)),
+                 (0, datetime.datetime(2021, 1, 1, 0, 0))])
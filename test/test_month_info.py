@@ -0,0 +1,43 @@
+# -*- coding: utf-8 -*-
+
+import calendar
+import datetime
+import itertools
+import unittest
+from cronexp._month_info import month_info, month_length
+from cronexp._stats import search_stats
+
+
+class MonthInfoTest(unittest.TestCase):
+    def test_month_info(self):
+        year_list = [datetime.MINYEAR, 1900, 2000, 2019, 2020, 2100,
+                     datetime.MAXYEAR]
+        for year, month in itertools.product(year_list, range(1, 13)):
+            with self.subTest(year=year, month=month):
+                self.assertEqual(
+                        month_info(year, month),
+                        calendar.monthrange(year, month))
+                self.assertEqual(
+                        month_length(year, month),
+                        calendar.monthrange(year, month)[1])
+
+    def test_invalid(self):
+        input_list = [
+                (0, 1),
+                (datetime.MAXYEAR + 1, 1),
+                (2020, 0),
+                (2020, 13)]
+        for year, month in input_list:
+            with self.subTest(year=year, month=month):
+                with self.assertRaises(ValueError):
+                    month_info(year, month)
+                with self.assertRaises(ValueError):
+                    month_length(year, month)
+
+    def test_shared(self):
+        # filled once per year
+        with search_stats() as stats:
+            for _ in range(3):
+                for month in range(1, 13):
+                    month_info(7777, month)
+        self.assertEqual(stats.counter().monthrange, 12)
@@ -0,0 +1,57 @@
+# -*- coding: utf-8 -*-
+
+import asyncio
+import datetime
+import unittest
+from cronexp._cronexp import Cronexp
+from cronexp._scheduler import CronexpScheduler
+
+
+def _clock(second: float):
+    # a clock which is `second` seconds before the next minute
+    now = datetime.datetime.now()
+    offset = (now.replace(second=0, microsecond=0)
+              + datetime.timedelta(minutes=1, seconds=-second)
+              - now)
+    return lambda: datetime.datetime.now() + offset
+
+
+class CronexpSchedulerTest(unittest.TestCase):
+    def test_run(self):
+        clock = _clock(0.1)
+        scheduler = CronexpScheduler(max_concurrency=2, clock=clock)
+        called = []
+        running = []
+
+        async def job(scheduled: datetime.datetime) -> None:
+            running.append(scheduled)
+            self.assertLessEqual(len(running), 2)
+            await asyncio.sleep(0.05)
+            called.append(scheduled)
+            running.remove(scheduled)
+            if len(called) == 3:
+                scheduler.stop()
+
+        for _ in range(3):
+            scheduler.add(Cronexp('* * * * *'), job)
+        scheduler.add(Cronexp('0 0 1 1 *'), job)
+        asyncio.run(asyncio.wait_for(scheduler.run(), 5.0))
+        expected = clock().replace(second=0, microsecond=0)
+        self.assertEqual(called, [expected] * 3)
+
+    def test_add_while_running(self):
+        scheduler = CronexpScheduler(clock=_clock(0.2))
+        called = []
+
+        async def job(scheduled: datetime.datetime) -> None:
+            called.append(scheduled)
+            scheduler.stop()
+
+        async def main() -> None:
+            task = asyncio.ensure_future(scheduler.run())
+            await asyncio.sleep(0.05)
+            scheduler.add(Cronexp('* * * * *'), job)
+            await asyncio.wait_for(task, 5.0)
+
+        asyncio.run(main())
+        self.assertEqual(len(called), 1)
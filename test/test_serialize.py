@@ -0,0 +1,56 @@
+# -*- coding: utf-8 -*-
+
+import datetime
+import pickle
+import unittest
+from cronexp._cronexp import Cronexp, CronexpOption
+from cronexp._dayexp import DaySelectionMode
+from cronexp._weekday_field import SundayMode
+
+
+class SerializeTest(unittest.TestCase):
+    def setUp(self):
+        either = CronexpOption(
+                day_selection_mode=DaySelectionMode.EITHER,
+                sunday_mode=SundayMode.SUNDAY_IS_7)
+        self.cronexp_list = [
+                Cronexp('* * * * *'),
+                Cronexp('*/15 9-17 * * mon-fri'),
+                Cronexp('0 0 1-7 * 1', option=CronexpOption(
+                        day_selection_mode=DaySelectionMode.AND,
+                        max_year=2030)),
+                Cronexp('30 0 L,15W,1W * ?', option=either),
+                Cronexp('0 9 ? * 7L,5#2,7#5,sun', option=either),
+                Cronexp('0 12 29 2 *', option=CronexpOption(
+                        use_word_set=False))]
+
+    def test_round_trip(self):
+        start = datetime.datetime(2019, 1, 1)
+        for cronexp in self.cronexp_list:
+            data = cronexp.to_bytes()
+            restored = Cronexp.from_bytes(data)
+            with self.subTest(data=data):
+                self.assertEqual(restored.option, cronexp.option)
+                self.assertEqual(
+                        restored.canonical_key(),
+                        cronexp.canonical_key())
+                self.assertEqual(restored.to_bytes(), data)
+                self.assertEqual(
+                        restored.next_list(start, 50),
+                        cronexp.next_list(start, 50))
+
+    def test_pickle(self):
+        start = datetime.datetime(2019, 1, 1)
+        for cronexp in self.cronexp_list:
+            restored = pickle.loads(pickle.dumps(cronexp))
+            with self.subTest(option=cronexp.option):
+                self.assertEqual(
+                        restored.next_list(start, 50),
+                        cronexp.next_list(start, 50))
+
+    def test_invalid(self):
+        data = self.cronexp_list[4].to_bytes()
+        for invalid in [b'', b'XX' + data[2:], data[:-1], data + b'\x00']:
+            with self.subTest(data=invalid):
+                with self.assertRaises(ValueError):
+                    Cronexp.from_bytes(invalid)
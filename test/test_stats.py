@@ -0,0 +1,115 @@
+# -*- coding: utf-8 -*-
+
+import datetime
+import threading
+import unittest
+from cronexp import _stats
+from cronexp._cronexp import Cronexp, CronexpOption
+from cronexp._dayexp import DaySelectionMode
+from cronexp._stats import SearchCounter, search_stats
+
+
+class SearchStatsTest(unittest.TestCase):
+    def test_disabled(self):
+        self.assertIsNone(_stats.ACTIVE.get())
+        Cronexp('0 0 29 2 *').next(datetime.datetime(2021, 1, 1))
+        self.assertIsNone(_stats.ACTIVE.get())
+
+    def test_counter(self):
+        start = datetime.datetime(2021, 1, 1)
+        test_case = [
+                ('* * * * *', DaySelectionMode.OR,
+                 {'call': 1, 'timeexp': 1}),
+                ('0 0 29 2 *', DaySelectionMode.OR,
+                 {'call': 1, 'month': 3, 'year': 2, 'timeexp': 1}),
+                ('0 0 13 * fri', DaySelectionMode.AND,
+                 {'call': 1, 'month': 8, 'timeexp': 1}),
+                ('0 0 L * ?', DaySelectionMode.EITHER,
+                 {'call': 1, 'month': 1, 'timeexp': 1}),
+                ('0 0 15W * ?', DaySelectionMode.EITHER,
+                 {'call': 1, 'month': 1, 'timeexp': 1}),
+                ('0 0 ? * 1L,1#3', DaySelectionMode.EITHER,
+                 {'call': 1, 'month': 1, 'timeexp': 1})]
+        for expression, mode, expected in test_case:
+            with self.subTest(expression=expression, mode=mode):
+                cronexp = Cronexp(
+                        expression,
+                        option=CronexpOption(day_selection_mode=mode))
+                # resolve the day sets again
+                cronexp._dateexp.dayexp._day_mask_cache = None
+                with search_stats() as stats:
+                    cronexp.next(start)
+                counter = stats.counter()
+                for name, value in expected.items():
+                    self.assertEqual(getattr(counter, name), value, name)
+                self.assertGreater(counter.day_mask, 0)
+                if 'W' in expression:
+                    self.assertGreater(counter.day_of_month_w, 0)
+                if 'L,' in expression:
+                    self.assertGreater(counter.day_of_week_l, 0)
+                    self.assertGreater(counter.day_of_week_hash, 0)
+
+    def test_tracer(self):
+        trace = []
+        cronexp = Cronexp('0 0 1 1 *')
+        start = datetime.datetime(2021, 6, 1)
+        with search_stats(
+                tracer=lambda name, counter: trace.append((name, counter))
+                ) as stats:
+            cronexp.next(start)
+            cronexp.prev(start)
+            cronexp.nth(start, 2)
+            cronexp.count(start, start + datetime.timedelta(days=400))
+        self.assertEqual(
+                [name for name, _ in trace],
+                ['next', 'prev', 'nth', 'count'])
+        self.assertTrue(all(counter.call == 1 for _, counter in trace))
+        total = SearchCounter(*map(sum, zip(*(x for _, x in trace))))
+        self.assertEqual(total, stats.counter())
+
+    def test_nested(self):
+        cronexp = Cronexp('0 0 1 1 *')
+        start = datetime.datetime(2021, 6, 1)
+        with search_stats() as outer:
+            cronexp.next(start)
+            with search_stats() as inner:
+                cronexp.next(start)
+                cronexp.next(start)
+            cronexp.next(start)
+        self.assertIsNone(_stats.ACTIVE.get())
+        self.assertEqual(outer.counter().call, 2)
+        self.assertEqual(inner.counter().call, 2)
+
+    def test_threads(self):
+        # each block counts only the searches of its own thread
+        cronexp = Cronexp('0 0 1 1 *')
+        start = datetime.datetime(2021, 6, 1)
+        barrier = threading.Barrier(2)
+        result = {}
+
+        def run(name, calls):
+            trace = []
+            with search_stats(
+                    tracer=lambda _, counter: trace.append(counter)
+                    ) as stats:
+                barrier.wait()
+                for _ in range(calls):
+                    cronexp.next(start)
+                barrier.wait()
+            result[name] = (stats.counter(), trace, _stats.ACTIVE.get())
+        thread_list = [
+                threading.Thread(target=run, args=('a', 100)),
+                threading.Thread(target=run, args=('b', 300))]
+        for thread in thread_list:
+            thread.start()
+        for thread in thread_list:
+            thread.join()
+        self.assertIsNone(_stats.ACTIVE.get())
+        for name, calls in [('a', 100), ('b', 300)]:
+            counter, trace, active = result[name]
+            with self.subTest(name=name):
+                self.assertEqual(counter.call, calls)
+                self.assertEqual(counter.timeexp, calls)
+                self.assertEqual(len(trace), calls)
+                self.assertTrue(all(x.timeexp == 1 for x in trace))
+                self.assertIsNone(active)
@@ -74,3 +74,41 @@ class TimeexpTest(unittest.TestCase):
                 self.assertTrue(timeexp.is_selected(
                         hour=result.hour,
                         minute=result.minute))
+
+    def test_business_hours(self):
+        timeexp = Timeexp(minute='*/1', hour='9-17')
+        for total_minutes in range(0, 24 * 60):
+            hour, minute = divmod(total_minutes, 60)
+            if hour < 9:
+                expected = (9, 0, False)
+            elif hour < 17 or (hour == 17 and minute < 59):
+                expected = divmod(total_minutes + 1, 60) + (False,)
+            else:
+                expected = (9, 0, True)
+            with self.subTest(hour=hour, minute=minute):
+                result = timeexp.next(hour=hour, minute=minute)
+                self.assertEqual(
+                        (result.hour, result.minute, result.move_up),
+                        expected)
+                self.assertEqual(
+                        timeexp.is_selected(hour=hour, minute=minute),
+                        9 <= hour <= 17)
+
+    def test_prev(self):
+        timeexp = Timeexp(minute='*/10', hour='*/3')
+        selected = [total_minutes for total_minutes in range(0, 24 * 60)
+                    if (total_minutes // 60) % 3 == 0
+                    and (total_minutes % 60) % 10 == 0]
+        for total_minutes in range(0, 24 * 60):
+            hour, minute = divmod(total_minutes, 60)
+            expected = max(
+                    (x for x in selected if x < total_minutes),
+                    default=None)
+            move_down = expected is None
+            if move_down:
+                expected = selected[-1]
+            with self.subTest(hour=hour, minute=minute):
+                result = timeexp.prev(hour=hour, minute=minute)
+                self.assertEqual(
+                        (result.hour, result.minute, result.move_down),
+                        divmod(expected, 60) + (move_down,))
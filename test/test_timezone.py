@@ -0,0 +1,222 @@
+# -*- coding: utf-8 -*-
+
+import datetime
+import unittest
+import zoneinfo
+from cronexp._cronexp import Cronexp, CronexpOption
+from cronexp._dayexp import DaySelectionMode
+from cronexp._timezone import (
+        AmbiguousTimePolicy, NonexistentTimePolicy, ZonedCronexp,
+        zone_transition_table)
+
+
+NEW_YORK = zoneinfo.ZoneInfo('America/New_York')
+
+
+class CountingZone(datetime.tzinfo):
+    def __init__(self, zone: datetime.tzinfo) -> None:
+        self.zone = zone
+        self.count = 0
+
+    def utcoffset(self, time):
+        self.count += 1
+        return self.zone.utcoffset(time.replace(tzinfo=self.zone))
+
+    def dst(self, time):
+        return self.zone.dst(time.replace(tzinfo=self.zone))
+
+    def tzname(self, time):
+        return self.zone.tzname(time.replace(tzinfo=self.zone))
+
+    def fromutc(self, time):
+        self.count += 1
+        result = self.zone.fromutc(time.replace(tzinfo=self.zone))
+        return result.replace(tzinfo=self)
+
+
+class ZoneTransitionTableTest(unittest.TestCase):
+    def test_new_york(self):
+        table = zone_transition_table(NEW_YORK, 2021)
+        self.assertEqual(
+                [(x.utc, x.before.total_seconds() // 3600,
+                  x.after.total_seconds() // 3600)
+                 for x in table.transition],
+                [(datetime.datetime(2021, 3, 14, 7), -5, -4),
+                 (datetime.datetime(2021, 11, 7, 6), -4, -5)])
+        self.assertEqual(table.max_fold, datetime.timedelta(hours=1))
+
+    def test_fixed(self):
+        zone = datetime.timezone(datetime.timedelta(hours=9))
+        table = zone_transition_table(zone, 2021)
+        self.assertEqual(table.transition, [])
+        self.assertEqual(table.initial, datetime.timedelta(hours=9))
+
+    def test_forward_only(self):
+        # Europe/Istanbul 2016: +02:00 -> +03:00 only
+        zone = zoneinfo.ZoneInfo('Europe/Istanbul')
+        table = zone_transition_table(zone, 2016)
+        self.assertTrue(all(x.before < x.after for x in table.transition))
+        self.assertEqual(table.max_fold, datetime.timedelta(0))
+
+
+class ZonedCronexpTest(unittest.TestCase):
+    def test_normal(self):
+        cronexp = Cronexp('0 9 * * *').in_zone(NEW_YORK)
+        start = datetime.datetime(
+                2021, 6, 1, 12, 0, tzinfo=datetime.timezone.utc)
+        result = cronexp.next(start)
+        self.assertEqual(
+                result,
+                datetime.datetime(2021, 6, 1, 9, 0, tzinfo=NEW_YORK))
+        self.assertIs(result.tzinfo, NEW_YORK)
+        self.assertEqual(
+                result.astimezone(datetime.timezone.utc),
+                datetime.datetime(
+                        2021, 6, 1, 13, 0, tzinfo=datetime.timezone.utc))
+
+    def test_nonexistent(self):
+        start = datetime.datetime(2021, 3, 13, 12, 0, tzinfo=NEW_YORK)
+        cronexp = Cronexp('30 2 * * *')
+        test_case = [
+                (NonexistentTimePolicy.SHIFT,
+                 [datetime.datetime(2021, 3, 14, 3, 0),
+                  datetime.datetime(2021, 3, 15, 2, 30)]),
+                (NonexistentTimePolicy.SKIP,
+                 [datetime.datetime(2021, 3, 15, 2, 30),
+                  datetime.datetime(2021, 3, 16, 2, 30)])]
+        for nonexistent, expected in test_case:
+            with self.subTest(nonexistent=nonexistent):
+                zoned = cronexp.in_zone(NEW_YORK, nonexistent=nonexistent)
+                self.assertEqual(
+                        zoned.next_list(start, 2),
+                        [x.replace(tzinfo=NEW_YORK) for x in expected])
+
+    def test_nonexistent_collapse(self):
+        # occurrences in the gap fire once at the end of the gap
+        cronexp = Cronexp('*/20 2,3 14 3 *').in_zone(NEW_YORK)
+        start = datetime.datetime(2021, 3, 14, 0, 0, tzinfo=NEW_YORK)
+        self.assertEqual(
+                [x.replace(tzinfo=None) for x in cronexp.next_list(start, 4)],
+                [datetime.datetime(2021, 3, 14, 3, 0),
+                 datetime.datetime(2021, 3, 14, 3, 20),
+                 datetime.datetime(2021, 3, 14, 3, 40),
+                 datetime.datetime(2022, 3, 14, 2, 0)])
+
+    def test_ambiguous(self):
+        start = datetime.datetime(2021, 11, 6, 12, 0, tzinfo=NEW_YORK)
+        cronexp = Cronexp('30 1 * * *')
+        test_case = [
+                (AmbiguousTimePolicy.FIRST, [0]),
+                (AmbiguousTimePolicy.LAST, [1]),
+                (AmbiguousTimePolicy.BOTH, [0, 1])]
+        for ambiguous, fold_list in test_case:
+            with self.subTest(ambiguous=ambiguous):
+                zoned = cronexp.in_zone(NEW_YORK, ambiguous=ambiguous)
+                expected = [
+                        datetime.datetime(
+                                2021, 11, 7, 1, 30, tzinfo=NEW_YORK, fold=fold)
+                        for fold in fold_list]
+                expected.append(
+                        datetime.datetime(2021, 11, 8, 1, 30, tzinfo=NEW_YORK))
+                result = zoned.next_list(start, len(expected))
+                self.assertEqual(
+                        [(x, x.fold) for x in result],
+                        [(x, x.fold) for x in expected])
+
+    def test_ambiguous_start(self):
+        # start in the first 01:40, the second 01:30 is still ahead
+        cronexp = Cronexp('30 1 * * *').in_zone(
+                NEW_YORK,
+                ambiguous=AmbiguousTimePolicy.BOTH)
+        start = datetime.datetime(2021, 11, 7, 1, 40, tzinfo=NEW_YORK)
+        result = cronexp.next(start)
+        self.assertEqual(result.fold, 1)
+        self.assertEqual(
+                result.astimezone(datetime.timezone.utc),
+                datetime.datetime(
+                        2021, 11, 7, 6, 30, tzinfo=datetime.timezone.utc))
+
+    def test_every_minute(self):
+        start = datetime.datetime(2021, 11, 7, 0, 0, tzinfo=NEW_YORK)
+        end = datetime.datetime(2021, 11, 7, 3, 0, tzinfo=NEW_YORK)
+        test_case = [
+                (AmbiguousTimePolicy.FIRST, 180),
+                (AmbiguousTimePolicy.BOTH, 240)]
+        for ambiguous, expected in test_case:
+            with self.subTest(ambiguous=ambiguous):
+                cronexp = Cronexp('* * * * *').in_zone(
+                        NEW_YORK,
+                        ambiguous=ambiguous)
+                result = list(cronexp.iter(start, until=end))
+                self.assertEqual(len(result), expected - 1)
+                utc = [x.astimezone(datetime.timezone.utc) for x in result]
+                self.assertEqual(utc, sorted(set(utc)))
+
+    def test_until(self):
+        cronexp = Cronexp('0 0 * * *').in_zone(NEW_YORK)
+        start = datetime.datetime(2021, 1, 1, 12, 0, tzinfo=NEW_YORK)
+        self.assertIsNone(cronexp.next(
+                start,
+                until=datetime.datetime(2021, 1, 2, 0, 0, tzinfo=NEW_YORK)))
+        self.assertEqual(
+                cronexp.next(
+                        start,
+                        until=datetime.datetime(
+                                2021, 1, 2, 0, 1, tzinfo=NEW_YORK)),
+                datetime.datetime(2021, 1, 2, 0, 0, tzinfo=NEW_YORK))
+
+    def test_half_hour_dst(self):
+        # Lord Howe Island: 02:00 +11:00 -> 01:30 +10:30
+        zone = zoneinfo.ZoneInfo('Australia/Lord_Howe')
+        cronexp = Cronexp('45 1 * * *').in_zone(
+                zone,
+                ambiguous=AmbiguousTimePolicy.BOTH)
+        start = datetime.datetime(2021, 4, 3, 12, 0, tzinfo=zone)
+        self.assertEqual(
+                [(x.hour, x.minute, x.fold)
+                 for x in cronexp.next_list(start, 3)],
+                [(1, 45, 0), (1, 45, 1), (1, 45, 0)])
+
+    def test_forward_only_year(self):
+        test_case = [
+                ('Europe/Istanbul', '*/15 * * * *',
+                 datetime.datetime(2016, 6, 1, 12, 0),
+                 datetime.datetime(2016, 6, 1, 12, 15)),
+                ('Europe/Moscow', '* * * * *',
+                 datetime.datetime(2011, 6, 1, 12, 0),
+                 datetime.datetime(2011, 6, 1, 12, 1))]
+        for name, expression, start, expected in test_case:
+            with self.subTest(zone=name):
+                zone = zoneinfo.ZoneInfo(name)
+                cronexp = Cronexp(expression).in_zone(zone)
+                self.assertEqual(
+                        cronexp.next(start.replace(tzinfo=zone)),
+                        expected.replace(tzinfo=zone))
+
+    def test_naive_start(self):
+        cronexp = ZonedCronexp(Cronexp('* * * * *'), NEW_YORK)
+        with self.assertRaises(ValueError):
+            cronexp.next(datetime.datetime(2021, 1, 1))
+
+    def test_never(self):
+        # 02:30 on the second Sunday in March never exists in New York
+        cronexp = Cronexp(
+                '30 2 8-14 3 sun',
+                option=CronexpOption(
+                        day_selection_mode=DaySelectionMode.AND)).in_zone(
+                NEW_YORK,
+                nonexistent=NonexistentTimePolicy.SKIP)
+        start = datetime.datetime(2021, 1, 1, tzinfo=NEW_YORK)
+        self.assertIsNone(cronexp.next(
+                start,
+                until=datetime.datetime(2030, 1, 1, tzinfo=NEW_YORK)))
+
+    def test_utcoffset_calls(self):
+        zone = CountingZone(NEW_YORK)
+        cronexp = Cronexp('*/5 * * * *').in_zone(zone)
+        start = datetime.datetime(2021, 1, 1, tzinfo=zone)
+        cronexp.next_list(start, 10)
+        zone.count = 0
+        result = cronexp.next_list(start, 100000)
+        self.assertEqual(len(result), 100000)
+        self.assertLess(zone.count, 10000)
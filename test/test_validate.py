@@ -0,0 +1,113 @@
+# -*- coding: utf-8 -*-
+
+import contextlib
+import io
+import json
+import os
+import tempfile
+import threading
+import unittest
+from cronexp.__main__ import main, run_validate
+from cronexp._cronexp import Cronexp, CronexpOption
+from cronexp._dayexp import DaySelectionMode
+from cronexp._field_parser import FieldParseErrorDetail
+from cronexp._validate import (
+        DayexpParseErrorDetail, FieldCountErrorDetail, validate_expression)
+from cronexp._weekday_field import SundayMode
+
+
+class ValidateExpressionTest(unittest.TestCase):
+    def test_same_as_cronexp(self):
+        expression_list = [
+                '* * * * *',
+                '* * * *',
+                '61 * * * *',
+                '* 24 * * *',
+                '* * 32,L * *',
+                '* * * 13 *',
+                '* * * jan-dec sun-sat',
+                '* * * * 7',
+                '* * ? * *',
+                '* * L * ?',
+                '* * 15W * ?',
+                '* * ? * 5L,1#2',
+                '* * ? * 1#6',
+                '* * ? ? *',
+                '61 x 32 ? 8']
+        option_list = [
+                CronexpOption(),
+                CronexpOption(use_word_set=False),
+                CronexpOption(day_selection_mode=DaySelectionMode.EITHER),
+                CronexpOption(sunday_mode=SundayMode.SUNDAY_IS_7)]
+        for expression in expression_list:
+            for option in option_list:
+                with self.subTest(expression=expression, option=option):
+                    try:
+                        Cronexp(expression, option=option)
+                        message = None
+                    except ValueError as error:
+                        message = str(error)
+                    result = validate_expression(expression, option)
+                    self.assertEqual(result is None, message is None)
+                    if isinstance(result, FieldParseErrorDetail):
+                        self.assertIn(
+                                'Failed to parse "{0}"'.format(result.field),
+                                message)
+                    elif isinstance(result, DayexpParseErrorDetail):
+                        self.assertIn(result.message, message)
+                    elif isinstance(result, FieldCountErrorDetail):
+                        self.assertIn(
+                                'has {0} fields'.format(result.count),
+                                message)
+
+
+class ValidateCommandTest(unittest.TestCase):
+    def test_validate(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'crontab')
+            with open(path, 'w') as stream:
+                stream.write('0 * * * *\n# comment\n\n61 * * * *\n* *\n')
+            output = io.StringIO()
+            with contextlib.redirect_stdout(output):
+                status = main(['validate', '--jobs', '1', path])
+        self.assertEqual(status, 1)
+        result = [json.loads(line)
+                  for line in output.getvalue().splitlines()]
+        self.assertEqual([x['line'] for x in result], [1, 4, 5])
+        self.assertEqual([x['ok'] for x in result], [True, False, False])
+        self.assertEqual(result[1]['error']['type'], 'FieldParseError')
+        self.assertEqual(
+                result[1]['error']['parse_error'],
+                [{'expression': '61',
+                  'reason': '61 is out of range(0...59)'}])
+        self.assertEqual(result[2]['error']['type'], 'FieldCountError')
+
+    def test_jobs(self):
+        lines = [('<test>', i, expression) for i, expression in enumerate(
+                ['0 * * * *', '61 * * * *', '* *', '*/5 9-17 * * mon-fri']
+                * 25,
+                start=1)]
+        expected = list(run_validate(lines, CronexpOption(), jobs=1))
+        for chunk_size in [1, 7, 1000]:
+            with self.subTest(chunk_size=chunk_size):
+                self.assertEqual(
+                        list(run_validate(
+                                lines,
+                                CronexpOption(),
+                                jobs=2,
+                                chunk_size=chunk_size)),
+                        expected)
+
+    def test_jobs_streaming(self):
+        # the first result is yielded before the input reaches EOF
+        received = threading.Event()
+
+        def lines():
+            yield '<test>', 1, '0 * * * *'
+            if not received.wait(timeout=30):
+                raise AssertionError('no result before EOF')
+            yield '<test>', 2, '* *'
+        result = run_validate(lines(), CronexpOption(), jobs=2, chunk_size=1)
+        self.assertTrue(next(result)[0])
+        received.set()
+        self.assertEqual([is_ok for is_ok, _ in result], [False])
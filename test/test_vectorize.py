@@ -0,0 +1,98 @@
+# -*- coding: utf-8 -*-
+
+import datetime
+import unittest
+from cronexp._cronexp import Cronexp, CronexpOption
+from cronexp._dayexp import DaySelectionMode
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+@unittest.skipIf(numpy is None, 'numpy is not installed')
+class NextArrayTest(unittest.TestCase):
+    def test_next_array(self):
+        either = CronexpOption(day_selection_mode=DaySelectionMode.EITHER)
+        expression_list = [
+                ('0 8,19 10/10 * *', CronexpOption()),
+                ('*/20 9-10 * * mon-fri', CronexpOption()),
+                ('30 0 L * ?', either),
+                ('0 9 ? * 5#2,1L', either),
+                ('0 12 29 2 *', CronexpOption())]
+        start_list = [
+                datetime.datetime(2019, 1, 1, 0, 0)
+                + datetime.timedelta(minutes=397 * i)
+                for i in range(2000)]
+        timestamps = numpy.array(start_list, dtype='datetime64[m]')
+        for expression, option in expression_list:
+            cronexp = Cronexp(expression, option=option)
+            result = cronexp.next_array(timestamps)
+            for start, next_ in zip(start_list, result):
+                with self.subTest(expression=expression, start=start):
+                    self.assertEqual(
+                            next_.astype(datetime.datetime),
+                            cronexp.next(start))
+
+    def test_epoch(self):
+        cronexp = Cronexp('0 0 * * *')
+        epoch = numpy.array([0, 59, 86399, 86400], dtype=numpy.int64)
+        self.assertEqual(
+                cronexp.next_array(epoch).tolist(),
+                [datetime.datetime(1970, 1, 2),
+                 datetime.datetime(1970, 1, 2),
+                 datetime.datetime(1970, 1, 2),
+                 datetime.datetime(1970, 1, 3)])
+
+    def test_nat(self):
+        # None of Cronexp.next -> NaT
+        option = CronexpOption(max_year=2020)
+        start_list = [
+                datetime.datetime(2019, 6, 1),
+                datetime.datetime(2020, 6, 1),
+                datetime.datetime(2020, 12, 31, 12, 0),
+                datetime.datetime(2021, 3, 1)]
+        timestamps = numpy.array(start_list, dtype='datetime64[m]')
+        for expression in ['0 0 1 1 *', '0 0 * * *', '0 0 30 2 *']:
+            cronexp = Cronexp(expression, option=option)
+            result = cronexp.next_array(timestamps)
+            for start, next_ in zip(start_list, result):
+                expected = cronexp.next(start)
+                with self.subTest(expression=expression, start=start):
+                    if expected is None:
+                        self.assertTrue(numpy.isnat(next_))
+                    else:
+                        self.assertEqual(
+                                next_.astype(datetime.datetime),
+                                expected)
+        cronexp = Cronexp('0 0 1 1 *', option=option)
+        result = cronexp.next_array(
+                numpy.array(['NaT'], dtype='datetime64[m]'))
+        self.assertTrue(numpy.isnat(result[0]))
+
+
+@unittest.skipIf(numpy is None, 'numpy is not installed')
+class MatchMaskTest(unittest.TestCase):
+    def test_match_mask(self):
+        either = CronexpOption(day_selection_mode=DaySelectionMode.EITHER)
+        expression_list = [
+                ('*/20 9-10 10/10 * *', CronexpOption()),
+                ('*/20 9-10 1-7 * mon', CronexpOption()),
+                ('*/20 9-10 1-7 * mon', CronexpOption(
+                        day_selection_mode=DaySelectionMode.AND)),
+                ('0-30 0 L,15W * ?', either),
+                ('0-30 9 ? * 5#2,1L', either)]
+        start_list = [
+                datetime.datetime(2019, 1, 1, 0, 0)
+                + datetime.timedelta(minutes=37 * i, seconds=i % 60)
+                for i in range(20000)]
+        timestamps = numpy.array(start_list, dtype='datetime64[s]')
+        for expression, option in expression_list:
+            cronexp = Cronexp(expression, option=option)
+            result = cronexp.match_mask(timestamps)
+            expected = [
+                    cronexp.prev(start) == start.replace(second=0)
+                    for start in start_list]
+            with self.subTest(expression=expression):
+                self.assertTrue(result.any())
+                self.assertEqual(result.tolist(), expected)
@@ -227,3 +227,42 @@ class DayOfWeekFieldTest(unittest.TestCase):
                         self.assertEqual(
                                 field_0.next(year, month, day),
                                 field_7.next(year, month, day))
+
+    def test_prev(self):
+        field_list = ['Mon,Fri', '*/3', '2L,5#3,0#5', '6']
+        for expression in field_list:
+            field = DayOfWeekField(expression, non_standard=True)
+            for year, month, day in itertools.product(
+                    (2019, 2020),
+                    range(1, 13),
+                    (None, *range(1, 33))):
+                lastday = calendar.monthrange(year, month)[1]
+                limit = day if day is not None else lastday + 1
+                expected = max(
+                        (x for x in range(1, min(limit, lastday + 1))
+                         if field.is_selected(year, month, x)),
+                        default=None)
+                with self.subTest(
+                        expression=expression,
+                        year=year,
+                        month=month,
+                        day=day):
+                    self.assertEqual(field.prev(year, month, day), expected)
+
+    def test_day_mask(self):
+        field_list = [
+                ('*', False),
+                ('Mon-Fri', False),
+                ('Sun,Sat#2,Sat#4,FriL', True),
+                ('0#5,6L', True),
+                ('?', True)]
+        for (field, non_standard), year, month in itertools.product(
+                field_list,
+                (2019, 2020),
+                range(1, 13)):
+            day_of_week = DayOfWeekField(field, non_standard=non_standard)
+            expected = sum(
+                    1 << day for day in range(1, 32)
+                    if day_of_week.is_selected(year, month, day))
+            with self.subTest(field=field, year=year, month=month):
+                self.assertEqual(day_of_week.day_mask(year, month), expected)